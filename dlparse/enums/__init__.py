@@ -3,6 +3,7 @@ from .ability_condition import AbilityCondition
 from .ability_param import AbilityUpParameter
 from .ability_variant import AbilityVariantType
 from .action import AbilityTargetAction
+from .action_edge import ActionEdgeType
 from .action_component import ActionCommandType, ActionConditionType
 from .action_debuff_type import ActionDebuffType
 from .buff_parameter import BuffParameter, BuffValueUnit
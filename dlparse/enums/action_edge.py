@@ -0,0 +1,22 @@
+"""Enums of the transitions between the actions."""
+from enum import Enum
+
+__all__ = ("ActionEdgeType",)
+
+
+class ActionEdgeType(Enum):
+    """Type of the transition from an action to another action."""
+
+    NEXT_ACTION = 1
+    """Next action of ``PlayerActionInfoEntry`` (``_NextAction`` of the player action info)."""
+    CANCEL_TO_NEXT = 2
+    """Next action which is executed only if the action is terminated by ``ActionPartsTerminateOtherParts``."""
+    ACTIVE_CANCEL = 3
+    """Specific action that can cancel the action (``ActionPartsActiveCancel``)."""
+    COMBO_NEXT = 4
+    """Next combo of a normal attack or a force strike."""
+
+    @property
+    def is_from_prefab(self) -> bool:
+        """Check if the transition requires the player action prefab to be determined."""
+        return self != ActionEdgeType.NEXT_ACTION
@@ -2,5 +2,7 @@
 from .category import ConditionCategories, ConditionCheckResult, ConditionMaxCount
 from .collection import *  # noqa
 from .composite import ConditionComposite
+from .enumeration import ConditionEnumerationStats, iter_condition_composites
 from .items import Condition
+from .mask import get_condition_bit, get_condition_mask, iter_mask_conditions
 from .validate import validate_conditions
@@ -4,6 +4,7 @@ from typing import Any, Generic, Iterable, Optional, TypeVar, Union
 
 from dlparse.errors import EnumConversionError, OperationInvalidError
 from .items import Condition
+from .mask import get_condition_mask, iter_mask_conditions
 # Relative import to avoid circular import
 from ..ability_condition import AbilityCondition
 from ..action_debuff_type import ActionDebuffType
@@ -104,6 +105,8 @@ class ConditionCategory(Generic[T]):
             result_on_invalid: ConditionCheckResult
     ):
         self._members = data
+        self._member_set: frozenset[Condition] = frozenset(data)
+        self._mask: int = get_condition_mask(data)
         self._max_count = max_count
         self._name = name
         self._result_on_invalid = result_on_invalid
@@ -112,7 +115,7 @@ class ConditionCategory(Generic[T]):
         if not isinstance(item, Condition):
             return False
 
-        return item in self.members
+        return item in self._member_set
 
     def __repr__(self):
         return f"<ConditionCategory - {self._name}>"
@@ -127,6 +130,11 @@ class ConditionCategory(Generic[T]):
         """Get all members of this category."""
         return set(self._members.keys())
 
+    @property
+    def mask(self) -> int:
+        """Get the bitset of all members of this category. Check ``get_condition_mask()``."""
+        return self._mask
+
     @property
     def targets(self) -> set[T]:
         """Get all targets of this category."""
@@ -193,10 +201,31 @@ class ConditionCategory(Generic[T]):
 
         return {condition for condition in conditions if condition in self}
 
+    def extract_mask(self, mask: int) -> Union[set[Condition], Condition]:
+        """
+        Same as ``extract()``, but extract from the bitset ``mask`` of the conditions.
+
+        If the maximum allowed count is ``ConditionMaxCount.SINGLE`` and multiple conditions of this category exist,
+        the first one in the definition order of the conditions is returned.
+        """
+        members_mask = mask & self._mask
+
+        if self.max_count_allowed == ConditionMaxCount.SINGLE:
+            return next(iter_mask_conditions(members_mask), None)
+
+        return set(iter_mask_conditions(members_mask))
+
     def is_valid(self, conditions: Iterable[Condition]) -> bool:
         """Check if ``conditions`` is valid."""
+        return self.is_valid_mask(get_condition_mask(conditions))
+
+    def is_valid_mask(self, mask: int) -> bool:
+        """Check if the bitset ``mask`` of the conditions is valid."""
         if self.max_count_allowed == ConditionMaxCount.SINGLE:
-            return len(set(conditions) & set(self.members)) <= 1
+            members_mask = mask & self._mask
+
+            # Clearing the lowest set bit leaves nothing if at most 1 member is in ``mask``
+            return not members_mask & (members_mask - 1)
 
         return True
 
@@ -7,6 +7,7 @@ from dlparse.errors import ConditionValidationFailedError
 from dlparse.utils import remove_duplicates_preserve_order
 from .category import ConditionCategories as CondCat, ConditionCheckResult
 from .items import Condition
+from .mask import get_condition_bit, get_condition_mask, iter_mask_conditions
 from .validate import validate_conditions
 # Relative import to avoid circular import
 from ..action_debuff_type import ActionDebuffType
@@ -35,12 +36,21 @@ COMP_UNCATEGORIZED_EXCEPTION: set[Condition] = {
     Condition.QUEST_START
 }
 
+_COMP_UNCATEGORIZED_EXCEPTION_MASK: int = get_condition_mask(COMP_UNCATEGORIZED_EXCEPTION)
 
-# ``eq=False`` to keep the ``__hash__`` of the superclass
+_BUFF_BOOST_CONDITION_MASK: int = CondCat.self_buff_count.mask | CondCat.self_lapis_card.mask
+
+
+# ``eq=False`` to keep the custom ``__eq__`` and ``__hash__``
 # ``repr=False`` to keep the ``__repr__`` of the superclass
 @dataclass(eq=False, repr=False)
 class ConditionComposite(ConditionCompositeBase[Condition]):
-    """Composite class of various attacking conditions."""
+    """
+    Composite class of various attacking conditions.
+
+    The conditions are also stored as a bitset (check ``get_condition_mask()``) with the hash computed at creation,
+    so the hashing, equality and containment checks do not iterate the conditions.
+    """
 
     # region Target
     target_afflictions: set[Condition] = field(init=False)
@@ -110,6 +120,9 @@ class ConditionComposite(ConditionCompositeBase[Condition]):
 
     # region Other fields (hidden)
     _has_buff_boost_condition: bool = field(init=False)
+    _conditions_sorted: tuple[Condition, ...] = field(init=False)
+    _mask: int = field(init=False)
+    _hash: int = field(init=False)
 
     # endregion
 
@@ -216,59 +229,60 @@ class ConditionComposite(ConditionCompositeBase[Condition]):
         if self.probability and self.probability not in CondCat.probability:
             raise ConditionValidationFailedError(ConditionCheckResult.INTERNAL_NOT_PROBABILITY)
 
-    def _init_validate_fields(self, conditions: tuple[Condition]):
+    def _init_validate_fields(self, conditions_mask: int):
         self._init_validate_target()
         self._init_validate_self_general()
         self._init_validate_self_special()
         self._init_validate_skill()
         self._init_validate_others()
 
-        if cond_not_categorized := (set(conditions) - set(self.conditions_sorted) - COMP_UNCATEGORIZED_EXCEPTION):
+        if not_categorized_mask := (conditions_mask & ~self._mask & ~_COMP_UNCATEGORIZED_EXCEPTION_MASK):
+            cond_not_categorized = set(iter_mask_conditions(not_categorized_mask))
             raise ConditionValidationFailedError(ConditionCheckResult.HAS_CONDITIONS_LEFT, cond_not_categorized)
 
-    def _init_categorized_condition_fields(self, conditions: Optional[Union[Iterable[Condition], Condition]]):
+    def _init_categorized_condition_fields(self, conditions_mask: int):
         # region Target status
-        self.target_afflictions = CondCat.target_status.extract(conditions)
-        self.target_element = CondCat.target_element.extract(conditions)
-        self.target_infliction = CondCat.target_status_infliction.extract(conditions)
-        self.target_in_od = Condition.TARGET_OD_STATE in conditions
-        self.target_in_bk = Condition.TARGET_BK_STATE in conditions
-        self.target_debuff = CondCat.target_debuff.extract(conditions)
+        self.target_afflictions = CondCat.target_status.extract_mask(conditions_mask)
+        self.target_element = CondCat.target_element.extract_mask(conditions_mask)
+        self.target_infliction = CondCat.target_status_infliction.extract_mask(conditions_mask)
+        self.target_in_od = bool(conditions_mask & get_condition_bit(Condition.TARGET_OD_STATE))
+        self.target_in_bk = bool(conditions_mask & get_condition_bit(Condition.TARGET_BK_STATE))
+        self.target_debuff = CondCat.target_debuff.extract_mask(conditions_mask)
         # endregion
 
         # region Self status
-        self.hp_status = CondCat.self_hp_status.extract(conditions)
-        self.hp_condition = CondCat.self_hp_cond.extract(conditions)
-        self.combo_count = CondCat.self_combo_count.extract(conditions)
-        self.buff_count = CondCat.self_buff_count.extract(conditions)
-        self.buff_field_self = CondCat.self_in_buff_field_self.extract(conditions)
-        self.buff_field_ally = CondCat.self_in_buff_field_ally.extract(conditions)
-        self.weapon_type = CondCat.self_weapon_type.extract(conditions)
-        self.action_cond = CondCat.action_condition.extract(conditions)
-        self.action_cond_lv = CondCat.self_action_cond_lv.extract(conditions)
-        self.gauge_filled = CondCat.self_gauge_filled.extract(conditions)
-        self.shapeshift_count = CondCat.shapeshifted_count.extract(conditions)
-        self.in_dragon_count = CondCat.in_dragon_count.extract(conditions)
-        self.current_mode = CondCat.current_mode.extract(conditions)
-        self.is_energized = Condition.SELF_ENERGIZED in conditions
-        self.is_team_amp_up = Condition.SELF_TEAM_AMP_UP in conditions
-        self.is_passive_enhanced = Condition.SELF_PASSIVE_ENHANCED in conditions
+        self.hp_status = CondCat.self_hp_status.extract_mask(conditions_mask)
+        self.hp_condition = CondCat.self_hp_cond.extract_mask(conditions_mask)
+        self.combo_count = CondCat.self_combo_count.extract_mask(conditions_mask)
+        self.buff_count = CondCat.self_buff_count.extract_mask(conditions_mask)
+        self.buff_field_self = CondCat.self_in_buff_field_self.extract_mask(conditions_mask)
+        self.buff_field_ally = CondCat.self_in_buff_field_ally.extract_mask(conditions_mask)
+        self.weapon_type = CondCat.self_weapon_type.extract_mask(conditions_mask)
+        self.action_cond = CondCat.action_condition.extract_mask(conditions_mask)
+        self.action_cond_lv = CondCat.self_action_cond_lv.extract_mask(conditions_mask)
+        self.gauge_filled = CondCat.self_gauge_filled.extract_mask(conditions_mask)
+        self.shapeshift_count = CondCat.shapeshifted_count.extract_mask(conditions_mask)
+        self.in_dragon_count = CondCat.in_dragon_count.extract_mask(conditions_mask)
+        self.current_mode = CondCat.current_mode.extract_mask(conditions_mask)
+        self.is_energized = bool(conditions_mask & get_condition_bit(Condition.SELF_ENERGIZED))
+        self.is_team_amp_up = bool(conditions_mask & get_condition_bit(Condition.SELF_TEAM_AMP_UP))
+        self.is_passive_enhanced = bool(conditions_mask & get_condition_bit(Condition.SELF_PASSIVE_ENHANCED))
         # endregion
 
         # region Skill effect / animation
-        self.teammate_coverage = CondCat.skill_teammates_covered.extract(conditions)
-        self.bullet_hit_count = CondCat.skill_bullet_hit.extract(conditions)
-        self.bullets_on_map = CondCat.skill_bullets_on_map.extract(conditions)
-        self.bullets_summoned = CondCat.skill_bullets_summoned.extract(conditions)
-        self.addl_inputs = CondCat.skill_addl_inputs.extract(conditions)
-        self.action_cancel = CondCat.skill_action_cancel.extract(conditions)
-        self.action_counter_red = Condition.COUNTER_RED_ATTACK in conditions
-        self.mark_explode = Condition.MARK_EXPLODES in conditions
+        self.teammate_coverage = CondCat.skill_teammates_covered.extract_mask(conditions_mask)
+        self.bullet_hit_count = CondCat.skill_bullet_hit.extract_mask(conditions_mask)
+        self.bullets_on_map = CondCat.skill_bullets_on_map.extract_mask(conditions_mask)
+        self.bullets_summoned = CondCat.skill_bullets_summoned.extract_mask(conditions_mask)
+        self.addl_inputs = CondCat.skill_addl_inputs.extract_mask(conditions_mask)
+        self.action_cancel = CondCat.skill_action_cancel.extract_mask(conditions_mask)
+        self.action_counter_red = bool(conditions_mask & get_condition_bit(Condition.COUNTER_RED_ATTACK))
+        self.mark_explode = bool(conditions_mask & get_condition_bit(Condition.MARK_EXPLODES))
         # endregion
 
         # region Others
-        self.trigger = CondCat.trigger.extract(conditions)
-        self.probability = CondCat.probability.extract(conditions)
+        self.trigger = CondCat.trigger.extract_mask(conditions_mask)
+        self.probability = CondCat.probability.extract_mask(conditions_mask)
         # endregion
 
     def _init_converted_fields(self):
@@ -316,19 +330,21 @@ class ConditionComposite(ConditionCompositeBase[Condition]):
         # endregion
 
     def __post_init__(self, conditions: Optional[Union[Iterable[Condition], Condition]]):
-        conditions = self._init_process_conditions(conditions)
+        conditions_mask = get_condition_mask(self._init_process_conditions(conditions))
 
-        self._init_categorized_condition_fields(conditions)
-        self._init_validate_fields(conditions)
-        self._init_converted_fields()
+        self._init_categorized_condition_fields(conditions_mask)
 
         # region Private fields
-        self._has_buff_boost_condition = any(
-            condition in CondCat.self_buff_count or condition in CondCat.self_lapis_card
-            for condition in conditions
-        )
+        self._conditions_sorted = self._init_conditions_sorted()
+        # Conditions not sorted are excluded to make the composites having the same sorted conditions equal
+        self._mask = get_condition_mask(self._conditions_sorted)
+        self._hash = hash(tuple(sorted(condition.value for condition in self._conditions_sorted)))
+        self._has_buff_boost_condition = bool(conditions_mask & _BUFF_BOOST_CONDITION_MASK)
         # endregion
 
+        self._init_validate_fields(conditions_mask)
+        self._init_converted_fields()
+
     def _cond_sorted_target(self) -> tuple[Condition]:
         ret: tuple[Condition] = tuple(sorted(self.target_afflictions))
 
@@ -449,6 +465,18 @@ class ConditionComposite(ConditionCompositeBase[Condition]):
         """Check if the composite has any condition that boosts damage by the buff count."""
         return self._has_buff_boost_condition
 
+    def _init_conditions_sorted(self) -> tuple[Condition, ...]:
+        # ``Condition.TARGET_DEF_DOWN`` is categorized into both target status and debuff.
+        # Sorted conditions may yield this condition twice. Therefore removing the duplicates.
+
+        conditions: tuple[Condition, ...] = (self._cond_sorted_target()
+                                             + self._cond_sorted_self_general()
+                                             + self._cond_sorted_self_special()
+                                             + self._cond_sorted_skill()
+                                             + self._cond_sorted_others())
+
+        return remove_duplicates_preserve_order(conditions)
+
     @property
     def conditions_sorted(self) -> tuple[Condition, ...]:
         """
@@ -475,16 +503,7 @@ class ConditionComposite(ConditionCompositeBase[Condition]):
         - [Other] Trigger
         - [Other] Probability
         """
-        # ``Condition.TARGET_DEF_DOWN`` is categorized into both target status and debuff.
-        # Sorted conditions may yield this condition twice. Therefore removing the duplicates.
-
-        conditions: tuple[Condition, ...] = (self._cond_sorted_target()
-                                             + self._cond_sorted_self_general()
-                                             + self._cond_sorted_self_special()
-                                             + self._cond_sorted_skill()
-                                             + self._cond_sorted_others())
-
-        return remove_duplicates_preserve_order(conditions)
+        return self._conditions_sorted
 
     def get_boost_rate_by_buff(self, hit_attr: "HitAttrEntry", asset_buff_count: "BuffCountAsset"):
         """Get the damage boost rate of ``hit_attr`` under the given condition."""
@@ -495,11 +514,20 @@ class ConditionComposite(ConditionCompositeBase[Condition]):
         # Get the uncapped buff boost rate
         return self.buff_count_converted * hit_attr.rate_boost_by_buff
 
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if isinstance(other, ConditionComposite):
+            return self._mask == other._mask
+
+        return super().__eq__(other)
+
     def __iter__(self):
-        return iter(self.conditions_sorted)
+        return iter(self._conditions_sorted)
 
     def __bool__(self):
-        return bool(self.conditions_sorted)
+        return bool(self._mask)
 
     def __add__(self, other: Union["ConditionComposite", Condition, None]):
         if other is None:
@@ -511,7 +539,13 @@ class ConditionComposite(ConditionCompositeBase[Condition]):
         if not isinstance(other, ConditionComposite):
             raise TypeError(f"Cannot add `ConditionComposite` with type {type(other)}")
 
-        return ConditionComposite(self.conditions_sorted + other.conditions_sorted)
+        if not other._mask & ~self._mask:
+            return self  # ``other`` is a subset, the union is the same as this composite
+
+        if not self._mask & ~other._mask:
+            return other  # This composite is a subset, the union is the same as ``other``
+
+        return ConditionComposite(self._conditions_sorted + other._conditions_sorted)
 
     def __contains__(self, item: Union["ConditionComposite", Condition]):
         if isinstance(item, Condition):
@@ -520,7 +554,7 @@ class ConditionComposite(ConditionCompositeBase[Condition]):
         if not isinstance(item, ConditionComposite):
             raise TypeError(f"Cannot check if {item} ({type(item)}) contains this `ConditionComposite`")
 
-        return set(item) - set(self) == set()
+        return not item._mask & ~self._mask
 
     def __lt__(self, other):
         if not isinstance(other, ConditionComposite):
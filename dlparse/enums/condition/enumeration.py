@@ -0,0 +1,122 @@
+"""Functions to enumerate the condition combinations."""
+from dataclasses import dataclass
+from math import prod
+from typing import Iterable, Iterator, Optional, Sequence
+
+from .category import ConditionCategories, ConditionMaxCount
+from .composite import ConditionComposite
+from .items import Condition
+from .mask import get_condition_bit
+
+__all__ = ("ConditionEnumerationStats", "iter_condition_composites")
+
+# K = condition, V = bitset of the other members of the categories allowing only a single condition
+_exclusive_masks: Optional[dict[Condition, int]] = None
+
+
+def _get_exclusive_mask(condition: Condition) -> int:
+    """Get the bitset of the conditions which cannot coexist with ``condition``."""
+    global _exclusive_masks  # pylint: disable=global-statement
+
+    if _exclusive_masks is None:
+        exclusive_masks: dict[Condition, int] = {}
+
+        for category in ConditionCategories.get_all_categories():
+            if category.max_count_allowed != ConditionMaxCount.SINGLE:
+                continue
+
+            for member in category.members:
+                exclusive_masks[member] = exclusive_masks.get(member, 0) | category.mask
+
+        _exclusive_masks = {member: mask & ~get_condition_bit(member) for member, mask in exclusive_masks.items()}
+
+    return _exclusive_masks.get(condition, 0)
+
+
+@dataclass
+class ConditionEnumerationStats:
+    """
+    Counts of an enumeration of the condition combinations.
+
+    Once the enumeration is exhausted, ``combination_count`` equals the sum of the other counts.
+    """
+
+    combination_count: int = 0
+    """Count of all combinations, which is the size of the cartesian product of the condition elements."""
+    pruned_exclusive_count: int = 0
+    """Count of the combinations pruned for having multiple conditions of a single-condition category."""
+    pruned_duplicate_count: int = 0
+    """Count of the combinations pruned for having the same conditions as an enumerated combination."""
+    yielded_count: int = 0
+    """Count of the condition composites yielded."""
+
+
+def iter_condition_composites(
+        cond_elems: Sequence[Iterable[tuple[Condition, ...]]], /,
+        stats: Optional[ConditionEnumerationStats] = None
+) -> Iterator[ConditionComposite]:
+    """
+    Lazily enumerate the condition composites of the combinations of ``cond_elems``.
+
+    Each element of ``cond_elems`` is the options of the conditions to be combined,
+    a combination takes exactly one option from each element.
+
+    The combinations are built depth-first. A partial combination is pruned with all of its extensions if
+
+    - it has multiple conditions of any category allowing only a single condition, or
+
+    - it has the same set of conditions as another partial combination at the same depth.
+
+    Each distinct set of conditions is yielded once. The enumeration is deterministic.
+
+    If ``stats`` is given, the counts of the enumeration are added to it.
+    """
+    options_list: list[list[tuple[Condition, ...]]] = [
+        sorted({tuple(dict.fromkeys(option)) for option in cond_elem}, key=lambda item: [cond.value for cond in item])
+        for cond_elem in cond_elems
+    ]
+    # Count of the combinations of the elements after each depth
+    remaining_counts: list[int] = [prod(len(options) for options in options_list[depth + 1:])
+                                   for depth in range(len(options_list))]
+
+    stats = stats if stats is not None else ConditionEnumerationStats()
+    stats.combination_count += prod(len(options) for options in options_list)
+
+    # Bitsets of the conditions of the partial combinations enumerated at each depth
+    visited: list[set[int]] = [set() for _ in options_list]
+
+    def enumerate_from(depth: int, conditions: tuple[Condition, ...], conditions_mask: int):
+        if depth == len(options_list):
+            stats.yielded_count += 1
+            yield ConditionComposite(conditions)
+            return
+
+        for option in options_list[depth]:
+            conditions_new = conditions
+            conditions_mask_new = conditions_mask
+            is_exclusive = False
+
+            for condition in option:
+                if (condition_bit := get_condition_bit(condition)) & conditions_mask_new:
+                    continue
+
+                if _get_exclusive_mask(condition) & conditions_mask_new:
+                    is_exclusive = True
+                    break
+
+                conditions_new += (condition,)
+                conditions_mask_new |= condition_bit
+
+            if is_exclusive:
+                stats.pruned_exclusive_count += remaining_counts[depth]
+                continue
+
+            if conditions_mask_new in visited[depth]:
+                stats.pruned_duplicate_count += remaining_counts[depth]
+                continue
+
+            visited[depth].add(conditions_mask_new)
+
+            yield from enumerate_from(depth + 1, conditions_new, conditions_mask_new)
+
+    yield from enumerate_from(0, (), 0)
@@ -0,0 +1,39 @@
+"""Functions to represent the conditions as an integer bitset."""
+from typing import Iterable, Iterator
+
+from .items import Condition
+
+__all__ = ("get_condition_bit", "get_condition_mask", "iter_mask_conditions")
+
+# Bits are assigned by the definition order of the conditions instead of the condition values,
+# because the values are sparse and would make the masks unnecessarily large
+
+# K = condition, V = bit of the condition
+_CONDITION_BITS: dict[Condition, int] = {condition: 1 << idx for idx, condition in enumerate(Condition)}
+
+# K = bit of the condition, V = condition
+_BIT_CONDITIONS: dict[int, Condition] = {bit: condition for condition, bit in _CONDITION_BITS.items()}
+
+
+def get_condition_bit(condition: Condition) -> int:
+    """Get the bit of ``condition`` in the bitsets."""
+    return _CONDITION_BITS[condition]
+
+
+def get_condition_mask(conditions: Iterable[Condition]) -> int:
+    """Get the bitset of ``conditions``."""
+    mask = 0
+
+    for condition in conditions:
+        mask |= _CONDITION_BITS[condition]
+
+    return mask
+
+
+def iter_mask_conditions(mask: int) -> Iterator[Condition]:
+    """Iterate the conditions in the bitset ``mask`` in the definition order of the conditions."""
+    while mask:
+        bit = mask & -mask
+        mask ^= bit
+
+        yield _BIT_CONDITIONS[bit]
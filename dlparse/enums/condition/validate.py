@@ -1,8 +1,11 @@
 """Functions to validate the conditions."""
 from typing import Iterable, Optional
 
-from .category import ConditionCategories, ConditionCheckResult
+from .category import ConditionCategories, ConditionCategory, ConditionCheckResult
 from .items import Condition
+from .mask import get_condition_mask
+
+_categories: Optional[list[ConditionCategory]] = None
 
 
 def validate_conditions(conditions: Optional[Iterable[Condition]] = None) -> ConditionCheckResult:
@@ -25,9 +28,16 @@ def validate_conditions(conditions: Optional[Iterable[Condition]] = None) -> Con
     if not conditions:
         return ConditionCheckResult.PASS
 
+    global _categories  # pylint: disable=global-statement
+
+    if _categories is None:
+        _categories = ConditionCategories.get_all_categories()
+
+    mask = get_condition_mask(conditions)
+
     # Categorical checks
-    for category in ConditionCategories.get_all_categories():
-        if not category.is_valid(conditions):
+    for category in _categories:
+        if not category.is_valid_mask(mask):
             return category.result_on_invalid
 
     return ConditionCheckResult.PASS
@@ -1,7 +1,7 @@
 """Base exporting functions."""
 import csv
 import os
-from json import JSONEncoder, dump
+from json import JSONEncoder
 from typing import Any, Callable, Optional, TypeVar, Union
 
 from dlparse.errors import ActionDataNotFoundError, HitDataUnavailableError, MotionDataNotFoundError
@@ -9,6 +9,7 @@ from dlparse.export.entry import CsvExportableEntryBase, JsonExportableEntryBase
 from dlparse.model import SkillDataBase
 from dlparse.mono.asset import CharaDataEntry, DragonDataEntry, MasterAssetIdType, SkillIdEntry, UnitEntry
 from dlparse.mono.manager import AssetManager
+from dlparse.utils import dump_json
 
 __all__ = (
     "export_as_csv", "export_as_json", "export_to_dir", "print_skipped_messages", "export_transform_skill_entries",
@@ -195,7 +196,7 @@ def export_as_json(obj: Union[dict, list, JT], file_path: str) -> None:
     os.makedirs(os.path.dirname(file_path), exist_ok=True)  # Create directory if needed
 
     with open(file_path, "w", encoding="utf-8", newline="") as f:
-        dump(obj, f, cls=JsonEntryEncoder, ensure_ascii=False, sort_keys=True)
+        dump_json(obj, f, encoder_cls=JsonEntryEncoder)
 
 
 def export_to_dir(entry_dict: dict[MasterAssetIdType, Union[JT, list[JT]]], file_dir: str) -> None:
@@ -85,3 +85,7 @@ def export_unit_story_as_json(file_dir: str, asset_manager: "AssetManager", /, s
             asset_manager, cast(Language, lang), skip_unparsable=skip_unparsable
         )
         export_to_dir(entries, localize_path(file_dir, cast(Language, lang)))
+
+        # Texts of the exported language are no longer needed, release them to reduce the memory usage
+        asset_manager.asset_text_multi.unload([lang.value])
+        asset_manager.asset_text_website.unload([lang.value])
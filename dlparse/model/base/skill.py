@@ -1,9 +1,13 @@
 """Base classes for a skill data."""
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Generic, Optional, TYPE_CHECKING, TypeVar, final
+from functools import cached_property
+from typing import Any, Generic, Iterator, Optional, TYPE_CHECKING, TypeVar, final
 
-from dlparse.enums import Condition, ConditionCategories, ConditionComposite, Element, ElementFlag
+from dlparse.enums import (
+    ActionEdgeType, Condition, ConditionCategories, ConditionComposite, ConditionEnumerationStats, Element,
+    ElementFlag, iter_condition_composites,
+)
 from dlparse.errors import MultipleActionsError
 from dlparse.mono.asset import SkillDataEntry
 from .hit import HitData
@@ -41,7 +45,9 @@ class SkillDataBase(Generic[HT, ET], ABC):
     hit_data_mtx: list[list[HT]] = field(init=False)
     sp_gradual_fill_pct: list[float] = field(init=False)
 
-    possible_conditions: set[ConditionComposite] = field(init=False, default_factory=ConditionComposite)
+    # Options of the conditions to be combined to be the possible conditions
+    possible_cond_elems: list[set[tuple[Condition, ...]]] = field(init=False, default_factory=list)
+    possible_conditions_stats: ConditionEnumerationStats = field(init=False, default_factory=ConditionEnumerationStats)
 
     max_level: int = field(init=False)
 
@@ -136,9 +142,22 @@ class SkillDataBase(Generic[HT, ET], ABC):
 
     @abstractmethod
     def _init_all_possible_conditions(self, *args, **kwargs):
-        """Find all possible conditions and set it to ``self.possible_conditions``."""
+        """
+        Find the options of all possible conditions and set it to ``self.possible_cond_elems``.
+
+        Each condition element should only be added if any hit or buff of the skill references its conditions.
+        """
         raise NotImplementedError()
 
+    @final
+    def _drop_unreferenced_cond_elems(self):
+        # Elements without any condition in their options cannot change the output of any hit,
+        # so these are dropped instead of being multiplied into the combinations
+        self.possible_cond_elems = [
+            cond_elem for cond_elem in self.possible_cond_elems
+            if any(option for option in cond_elem) or not cond_elem
+        ]
+
     def __post_init__(self, *args, **kwargs):
         self.skill_data = self.skill_hit_data.skill_data
         self.skill_id = self.skill_hit_data.rev_result.skill_id_entry.skill_id
@@ -146,8 +165,38 @@ class SkillDataBase(Generic[HT, ET], ABC):
 
         self.max_level = self._init_max_level()  # Needs to be placed before `self._init_sp_gradual_fill_pct()`
         self._init_all_possible_conditions(*args, **kwargs)
+        self._drop_unreferenced_cond_elems()
         self._init_sp_gradual_fill_pct()
 
+    def __getstate__(self) -> dict[str, Any]:
+        # Asset manager is not picklable. It should be re-assigned after unpickling
+        return self.__dict__ | {"asset_manager": None}
+
+    def iter_possible_conditions(
+            self, stats: Optional[ConditionEnumerationStats] = None
+    ) -> Iterator[ConditionComposite]:
+        """
+        Lazily enumerate all possible condition composites of this skill.
+
+        Invalid or duplicated combinations are pruned early. Check ``iter_condition_composites()`` for the details.
+
+        If ``stats`` is given, the counts of the enumeration are added to it.
+        """
+        return iter_condition_composites(self.possible_cond_elems, stats=stats)
+
+    @cached_property
+    def possible_conditions(self) -> set[ConditionComposite]:
+        """
+        Get all possible condition composites of this skill.
+
+        These are enumerated on the first access. The counts of the enumeration are in ``possible_conditions_stats``.
+
+        This is not a dataclass field, so it's not included in ``dataclasses.fields()`` nor ``dataclasses.asdict()``.
+        The pickled state only includes it if it's already enumerated.
+        Use ``possible_cond_elems`` to get the options of the conditions instead.
+        """
+        return set(self.iter_possible_conditions(stats=self.possible_conditions_stats))
+
     def get_all_possible_entries(self) -> list[ET]:
         """Get all possible skill mod entries."""
         entries = []
@@ -174,7 +223,9 @@ class SkillDataBase(Generic[HT, ET], ABC):
                 continue  # Continue if there is only a single or no action ID at the current level
 
             parent_action_id = next(iter(sorted(action_ids_level)))
-            action_id_chain = self.asset_manager.asset_action_info_player.get_action_id_chain(parent_action_id)
+            action_id_chain = self.asset_manager.action_graph.get_chain(
+                parent_action_id, ActionEdgeType.NEXT_ACTION
+            )
 
             if action_ids_level.difference(action_id_chain):
                 raise MultipleActionsError(action_id_mtx)
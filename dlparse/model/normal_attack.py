@@ -2,8 +2,9 @@
 from dataclasses import InitVar, dataclass, field
 from typing import Iterable, Optional, TYPE_CHECKING
 
-from dlparse.enums import Condition, ConditionCategories, ConditionComposite, SkillCancelType
+from dlparse.enums import Condition, ConditionCategories, ConditionComposite
 from dlparse.mono.asset.base import ActionComponentHasHitLabels
+from dlparse.mono.loader import get_next_combo_action_id
 from dlparse.utils import get_ability_data_to_shift_hit_attr, make_hit_label
 from .unit_cancel import SkillCancelActionUnit
 
@@ -18,24 +19,6 @@ PRE_CONDITIONS_TO_OMIT: set[Condition] = {
     Condition.SELF_GMASCULA_S1_LV2
 }
 
-# - Faris (10950102) root normal attack action (901000) have action cancel component goes to `901201`.
-#   However, such action does not exist. (Should be `901001` instead).
-# --------------------
-# No manual fix because it won't reflect the actual game playing data,
-# despite the action may exist, such as `901001` as mentioned above.
-MISSING_ACTION_IDS: set[int] = {901201, 1016141}
-
-# Dirty fix for forcing the next action ID
-# This is needed for Basileus (10750304) because
-# it branches to both closed and ranged variant of auto
-MANUAL_NEXT_ACTION_ID: dict[int, Optional[int]] = {
-    701400: 701401,
-    701401: 701402,
-    701402: 701403,
-    701403: 701404,
-    701404: None,
-}
-
 
 @dataclass
 class NormalAttackComboBranch:
@@ -100,32 +83,7 @@ class NormalAttackCombo:
     next_combo_action_id: Optional[int] = field(init=False)
 
     def _init_next_combo_action_id(self):
-        for cancel_action in self.cancel_actions:
-            if cancel_action.cancel_type != SkillCancelType.NONE or cancel_action.action.is_common_action:
-                # - Next combo action type should be `NONE`; things like `FS` should be excluded
-                # - Excludes common actions (such as roll dodge)
-                #   - legacy actions does not have cancel type assigned
-                continue
-
-            if not cancel_action.action_id:
-                continue  # Action ID = 0 means any action, definitely not the next combo
-
-            if cancel_action.time == 0:
-                continue  # Next combo should not be able to change immediately
-
-            if cancel_action.action_id in MISSING_ACTION_IDS:
-                continue  # Check the notes for `MISSING_ACTION_IDS`
-
-            if self.action_prefab.action_id in MANUAL_NEXT_ACTION_ID:
-                # Not using assignment operator := because the assigned value might be falsy,
-                # Therefore making the condition check results in false-negative
-                self.next_combo_action_id = MANUAL_NEXT_ACTION_ID[self.action_prefab.action_id]
-                return
-
-            self.next_combo_action_id = cancel_action.action_id
-            return
-
-        self.next_combo_action_id = None
+        self.next_combo_action_id = get_next_combo_action_id(self.action_prefab)
 
     def _init_fill_combo_info(self, condition_list: Iterable[ConditionComposite], hit_attr: "HitAttrEntry"):
         for conditions in condition_list:
@@ -501,11 +501,8 @@ class AttackingSkillData(SkillDataBase[DamagingHitData, AttackingSkillDataEntry]
         cond_elems.extend(self._init_all_possible_conditions_self_others(is_exporting))
         cond_elems.extend(self._init_all_possible_conditions_skill())
 
-        # Add combinations
-        self.possible_conditions = {
-            ConditionComposite(tuple(subitem for item in item_combination for subitem in item))
-            for item_combination in product(*cond_elems)
-        }
+        # Combinations are enumerated on demand
+        self.possible_cond_elems = cond_elems
 
     def _init_buff_field_boost_mtx(self):
         self._buff_field_boost_mtx = [
@@ -1,7 +1,6 @@
 """Class for a single supportive skill entry."""
 from collections import defaultdict
 from dataclasses import dataclass, field
-from itertools import product
 from typing import Optional
 
 from dlparse.enums import Condition, ConditionCategories, ConditionComposite, Element
@@ -97,11 +96,8 @@ class SupportiveSkillData(SkillDataBase[BuffingHitData, SupportiveSkillEntry]):
                 )
             })
 
-        # Add combinations
-        self.possible_conditions = {
-            ConditionComposite(tuple(subitem for item in item_combination for subitem in item))
-            for item_combination in product(*cond_elems)
-        }
+        # Combinations are enumerated on demand
+        self.possible_cond_elems = cond_elems
 
     def _init_base_buffs(self, action_condition_asset: ActionConditionAsset):
         self.buffs_base = []
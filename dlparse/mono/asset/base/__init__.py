@@ -1,13 +1,17 @@
 """Base classes for mono behavior scripts."""
 from .ability import AbilityConditionEntryBase, AbilityVariantEntryBase
+from .archive import AssetArchive, get_archive_file_like, mount_archive, pack_archive, unmount_archive
 from .asset import AssetBase, MultilingualAssetBase, get_file_like, get_file_path
+from .columnar import ColumnValueType, ColumnarView
 from .custom import CustomParserBase
 from .entry import EntryBase, EntryDataType, TextEntryBase
-from .master import MasterAssetBase, MasterAssetIdType, MasterEntryBase, MasterParserBase
+from .master import MasterAssetBase, MasterAssetIdType, MasterAssetIndex, MasterEntryBase, MasterParserBase
 from .motion import AnimationControllerBase, parse_motion_data
+from .network import NetworkSource, get_network_source, set_network_source
 from .parser import ParserBase
 from .player_action import (
     ActionAssetBase, ActionComponentBase, ActionComponentCondition, ActionComponentData, ActionComponentHasHitLabels,
     ActionParserBase,
 )
+from .snapshot import get_snapshot_path, parse_file_with_snapshot
 from .story import GroupedStoryAssetBase, GroupedStoryEntryBase, StoryEntryBase
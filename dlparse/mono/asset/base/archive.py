@@ -0,0 +1,224 @@
+"""
+Packed archive of the asset files.
+
+The resources directory contains thousands of small json files.
+Packing them into a single archive avoids the overhead of opening each file.
+
+Archive layout (integers are little-endian):
+
+- Header: magic ``DLPK`` (4 bytes), format version (uint32), index offset (uint64), index length (uint64)
+
+- Blobs: each blob is prefixed by its length (uint64), optionally compressed by ``zlib``
+
+- Index: json object. The key is the path of the file relative to the packed directory using ``/`` as the separator.
+  The value is ``[offset of the blob data, length of the blob data, is compressed]``.
+
+An archive can be mounted to a directory by ``mount_archive()``.
+Then ``get_file_like()`` serves the files under that directory from the archive instead.
+Files not in the archive are still read from the disk.
+"""
+import io
+import json
+import mmap
+import os
+import struct
+import zlib
+from typing import Iterable, Optional, TextIO
+
+__all__ = ("AssetArchive", "pack_archive", "mount_archive", "unmount_archive", "get_archive_file_like")
+
+ARCHIVE_MAGIC = b"DLPK"
+ARCHIVE_FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sIQQ")
+_BLOB_LENGTH = struct.Struct("<Q")
+
+
+def _to_archive_key(relative_path: str) -> str:
+    return relative_path.replace(os.sep, "/")
+
+
+def pack_archive(
+        source_dir: str, archive_path: str, /,
+        compress: bool = False, extensions: Optional[Iterable[str]] = (".json",)
+) -> int:
+    """
+    Pack the files in ``source_dir`` into an archive at ``archive_path``. Returns the count of the files packed.
+
+    If ``compress`` is ``True``, the files will be compressed using ``zlib``.
+    A compressed file is only stored compressed if it gets smaller.
+
+    Only the files ending with any of ``extensions`` are packed. If ``extensions`` is ``None``, all files are packed.
+    """
+    extensions = tuple(extensions) if extensions is not None else None
+    index: dict[str, list] = {}
+
+    os.makedirs(os.path.dirname(os.path.abspath(archive_path)), exist_ok=True)
+
+    with open(archive_path, "wb") as f:
+        # Write a placeholder header first, it will be overwritten after the index is written
+        f.write(_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_FORMAT_VERSION, 0, 0))
+
+        for dir_path, dir_names, file_names in os.walk(source_dir):
+            dir_names.sort()  # Ensure deterministic order of the blobs
+
+            for file_name in sorted(file_names):
+                if extensions is not None and not file_name.endswith(extensions):
+                    continue
+
+                file_path = os.path.join(dir_path, file_name)
+
+                with open(file_path, "rb") as f_src:
+                    content = f_src.read()
+
+                is_compressed = False
+                if compress and len(content_compressed := zlib.compress(content)) < len(content):
+                    content = content_compressed
+                    is_compressed = True
+
+                f.write(_BLOB_LENGTH.pack(len(content)))
+
+                archive_key = _to_archive_key(os.path.relpath(file_path, source_dir))
+                index[archive_key] = [f.tell(), len(content), is_compressed]
+                f.write(content)
+
+        index_offset = f.tell()
+        index_content = json.dumps(index, ensure_ascii=False).encode("utf-8")
+        f.write(index_content)
+
+        f.seek(0)
+        f.write(_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_FORMAT_VERSION, index_offset, len(index_content)))
+
+    return len(index)
+
+
+class AssetArchive:
+    """
+    Memory-mapped asset archive.
+
+    ``get_bytes()`` slices the uncompressed blobs from the memory map directly without copying.
+    ``open()`` copies the blob once into a binary buffer, which is then decoded incrementally while being read.
+    """
+
+    def __init__(self, archive_path: str):
+        """
+        Opens and memory-maps the archive at ``archive_path``.
+
+        :raises ValueError: if the file is not an asset archive or the format version is not supported
+        """
+        self._archive_path = archive_path
+
+        with open(archive_path, "rb") as f:
+            self._mmap: Optional[mmap.mmap] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._view = memoryview(self._mmap)
+
+        magic, version, index_offset, index_length = _HEADER.unpack_from(self._view)
+        if magic != ARCHIVE_MAGIC:
+            self.close()
+            raise ValueError(f"{archive_path} is not an asset archive")
+        if version != ARCHIVE_FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported asset archive version: {version} ({archive_path})")
+
+        self._index: dict[str, list] = json.loads(str(self._view[index_offset:index_offset + index_length], "utf-8"))
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, relative_path: str) -> bool:
+        return _to_archive_key(relative_path) in self._index
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} at {self._archive_path} ({len(self)} files)>"
+
+    @property
+    def file_paths(self) -> list[str]:
+        """Get the relative paths of all files in the archive."""
+        return list(self._index)
+
+    def get_bytes(self, relative_path: str) -> memoryview:
+        """
+        Get the content of the file at ``relative_path``.
+
+        The return is a view of the memory map if the file is not compressed.
+
+        :raises FileNotFoundError: if the file is not in the archive
+        """
+        if not (index_entry := self._index.get(_to_archive_key(relative_path))):
+            raise FileNotFoundError(f"{relative_path} is not in the archive {self._archive_path}")
+
+        offset, length, is_compressed = index_entry
+        content = self._view[offset:offset + length]
+
+        if is_compressed:
+            return memoryview(zlib.decompress(content))
+
+        return content
+
+    def open(self, relative_path: str) -> TextIO:
+        """
+        Get the file-like object of the file at ``relative_path``.
+
+        :raises FileNotFoundError: if the file is not in the archive
+        """
+        return io.TextIOWrapper(io.BytesIO(self.get_bytes(relative_path)), encoding="utf-8")
+
+    def close(self) -> None:
+        """
+        Close the memory map of the archive.
+
+        If any view returned by ``get_bytes()`` is still alive, the memory map is closed
+        once all of these views are released instead.
+        """
+        self._view.release()
+
+        if self._mmap is None:
+            return
+
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Views of the memory map are still alive, dropping the reference lets the map close itself
+            # after the last view is released
+            self._mmap = None
+
+
+_mounted_archives: dict[str, AssetArchive] = {}  # K = absolute path of the mount directory
+
+
+def mount_archive(archive: AssetArchive, mount_dir: str) -> None:
+    """Mount ``archive`` to ``mount_dir``. The files under ``mount_dir`` will be served from ``archive``."""
+    _mounted_archives[os.path.abspath(mount_dir)] = archive
+
+
+def unmount_archive(mount_dir: str, /, archive: Optional[AssetArchive] = None) -> Optional[AssetArchive]:
+    """
+    Unmount the archive at ``mount_dir``. Returns the unmounted archive, if any.
+
+    If ``archive`` is given, the archive at ``mount_dir`` is unmounted only if it is ``archive``.
+    """
+    mount_dir = os.path.abspath(mount_dir)
+
+    if archive is not None and _mounted_archives.get(mount_dir) is not archive:
+        return None
+
+    return _mounted_archives.pop(mount_dir, None)
+
+
+def get_archive_file_like(file_path: str) -> Optional[TextIO]:
+    """Get the file-like object of ``file_path`` from the mounted archives. Returns ``None`` if not archived."""
+    if not _mounted_archives:
+        return None
+
+    file_path = os.path.abspath(file_path)
+
+    for mount_dir, archive in _mounted_archives.items():
+        if not file_path.startswith(mount_dir + os.sep):
+            continue
+
+        relative_path = file_path[len(mount_dir) + 1:]
+        if relative_path in archive:
+            return archive.open(relative_path)
+
+    return None
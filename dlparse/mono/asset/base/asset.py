@@ -1,16 +1,16 @@
 """Base asset class."""
-import io
 import os
 from abc import ABC, abstractmethod
-from typing import Any, Generic, Iterator, Optional, TextIO, Type, TypeVar, cast
-from urllib.error import HTTPError
-from urllib.request import urlopen
+from typing import Any, Generic, Iterable, Iterator, Optional, TextIO, Type, TypeVar, cast
 
 from dlparse.enums import Language
 from dlparse.errors import ConfigError, LanguageAssetNotFoundError, TextLabelNotFoundError
-from dlparse.utils import is_url, localize_asset_path
+from dlparse.utils import get_deep_size, is_url, localize_asset_path
+from .archive import get_archive_file_like
 from .entry import TextEntryBase
+from .network import get_network_source
 from .parser import ParserBase
+from .snapshot import parse_file_with_snapshot
 
 __all__ = ("AssetBase", "MultilingualAssetBase", "get_file_path", "get_file_like")
 
@@ -28,19 +28,15 @@ def get_file_like(file_location: str) -> TextIO:
 
     - Local file path
 
-    - URL
+    - URL (using the network source from ``get_network_source()``)
+
+    - Mounted asset archive (check ``mount_archive()``)
     """
     if is_url(file_location):
-        try:
-            # `is_url()` already validate ``file_location`` to start with ``http``,
-            # no risk of passing ftp:// or file:// here
-            # pylint: disable=consider-using-with
-            return io.TextIOWrapper(urlopen(file_location), encoding='utf-8')  # nosec
-        except HTTPError as ex:
-            if ex.code == 404:
-                raise ValueError(f"URL: {file_location} not found") from ex
+        return get_network_source().open(file_location)
 
-            raise ex
+    if file_like := get_archive_file_like(file_location):
+        return file_like
 
     # Every usages will use `with` statement in the subsequent operations
     # pylint: disable=consider-using-with
@@ -90,8 +86,14 @@ class AssetBase(Generic[T, IT], ABC):
 
     def __init__(
             self, parser_cls: Type[ParserBase[T]], file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
+        """
+        Initializes the asset.
+
+        If ``snapshot_dir`` is given and the asset is loaded from a file on the disk,
+        the parsed data will be loaded from or stored to the snapshot in ``snapshot_dir``.
+        """
         if not file_location and not asset_dir and not file_like:
             raise ConfigError(
                 "Either `file_location`, `asset_dir` and `asset_file_name` (class attribute) or `file_like` "
@@ -100,6 +102,11 @@ class AssetBase(Generic[T, IT], ABC):
 
         if not file_like:
             self._file_path = get_file_path(self.asset_file_name, file_location=file_location, asset_dir=asset_dir)
+
+            if snapshot_dir and os.path.isfile(self._file_path):
+                self._data = parse_file_with_snapshot(parser_cls, self._file_path, snapshot_dir)
+                return
+
             file_like = get_file_like(self._file_path)
         else:
             self._file_path = file_like.name
@@ -126,25 +133,45 @@ class AssetBase(Generic[T, IT], ABC):
         return self._data
 
 
+def _to_lang_code(lang_code: str) -> str:
+    # `Language` is also a `str`, but its enum object should not be used as the key
+    if isinstance(lang_code, Language):
+        return lang_code.value
+
+    return lang_code
+
+
 XT = TypeVar("XT", bound=TextEntryBase)
 ParsedTextEntryDict = dict[str, XT]
 
 
 class MultilingualAssetBase(Generic[XT], ABC):
-    """Multilingual text asset base class."""
+    """
+    Multilingual text asset base class.
 
-    # pylint: disable=too-few-public-methods
+    The text of each language is loaded on its first use.
+    """
 
     def __init__(
             self, parser_cls: Type[ParserBase[ParsedTextEntryDict]], asset_dir: str, file_name: str, /,
-            is_custom: bool = False, include_partial_support: bool = False,
+            is_custom: bool = False, include_partial_support: bool = False, snapshot_dir: Optional[str] = None
     ):
         """
         Initializes a multilingual text asset.
 
         Files to be loaded should be a json. ``file_name`` must **not** include the extension.
+
+        The files are not loaded here. Each language will be loaded on its first use.
+        Call ``preload()`` to load the languages beforehand.
+
+        If ``snapshot_dir`` is given, the parsed data of the local files
+        will be loaded from or stored to the snapshots in ``snapshot_dir``.
         """
-        self._assets: dict[str, ParsedTextEntryDict] = {}
+        self._parser_cls = parser_cls
+        self._snapshot_dir = snapshot_dir
+
+        self._file_paths: dict[str, str] = {}  # K = language code, V = file path
+        self._assets: dict[str, ParsedTextEntryDict] = {}  # K = language code, V = loaded text entries
 
         lang: Language
         for lang in Language:
@@ -163,9 +190,66 @@ class MultilingualAssetBase(Generic[XT], ABC):
             if not lang.is_main and not is_custom:
                 file_path = localize_asset_path(file_path, lang)
 
-            file_like = get_file_like(file_path)
+            self._file_paths[lang.value] = file_path
+
+    def _load_lang(self, file_path: str) -> ParsedTextEntryDict:
+        if self._snapshot_dir and os.path.isfile(file_path):
+            return parse_file_with_snapshot(self._parser_cls, file_path, self._snapshot_dir)
+
+        with get_file_like(file_path) as file_like:
+            return cast(ParserBase[ParsedTextEntryDict], self._parser_cls).parse_file(file_like)
+
+    def _get_lang_asset(self, lang_code: str) -> ParsedTextEntryDict:
+        """
+        Get the text entries of ``lang_code``. Loads the language if not yet loaded.
+
+        :raises LanguageAssetNotFoundError: if the language asset for `lang_code` is not found
+        """
+        lang_code = _to_lang_code(lang_code)
+
+        if lang_code not in self._assets:
+            if not (file_path := self._file_paths.get(lang_code)):
+                raise LanguageAssetNotFoundError(lang_code)
+
+            self._assets[lang_code] = self._load_lang(file_path)
+
+        return self._assets[lang_code]
+
+    @property
+    def available_languages(self) -> list[str]:
+        """Get the codes of the languages available in this asset."""
+        return list(self._file_paths)
+
+    @property
+    def loaded_languages(self) -> list[str]:
+        """Get the codes of the languages currently loaded."""
+        return list(self._assets)
+
+    def preload(self, lang_codes: Optional[Iterable[str]] = None) -> None:
+        """
+        Load the languages of ``lang_codes``. Load all available languages if ``lang_codes`` is not given.
+
+        :raises LanguageAssetNotFoundError: if the language asset for any of `lang_codes` is not found
+        """
+        for lang_code in lang_codes if lang_codes is not None else self._file_paths:
+            self._get_lang_asset(lang_code)
+
+    def unload(self, lang_codes: Optional[Iterable[str]] = None) -> None:
+        """
+        Release the languages of ``lang_codes``. Release all languages if ``lang_codes`` is not given.
+
+        Released languages will be loaded again on their next use.
+        """
+        for lang_code in list(lang_codes if lang_codes is not None else self._assets):
+            self._assets.pop(_to_lang_code(lang_code), None)
 
-            self._assets[lang.value] = cast(ParserBase[ParsedTextEntryDict], parser_cls).parse_file(file_like)
+    def get_memory_usage(self) -> dict[str, int]:
+        """
+        Get the approximated memory held by each loaded language in bytes.
+
+        This includes the container, the entries and their field values. Shared objects are only counted once.
+        """
+        return {lang_code: get_deep_size(lang_asset) for lang_code, lang_asset in self._assets.items()}
 
     def get_text(self, lang_code: str, label: str, on_not_found: Any = THROW_ERROR_ON_FAIL) -> str:
         """
@@ -178,10 +262,7 @@ class MultilingualAssetBase(Generic[XT], ABC):
         :raises TextLabelNotFoundError: if the `label` in `lang_code` is not found and `on_not_found` indicates to
         throw an error
         """
-        if not (lang_asset := self._assets.get(lang_code)):
-            raise LanguageAssetNotFoundError(lang_code)
-
-        if not (lang_entry := lang_asset.get(label)):
+        if not (lang_entry := self._get_lang_asset(lang_code).get(label)):
             if on_not_found is THROW_ERROR_ON_FAIL:
                 raise TextLabelNotFoundError(label, lang_code)
 
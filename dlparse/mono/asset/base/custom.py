@@ -1,9 +1,9 @@
 """Classes for custom assets."""
-import json
 from abc import ABC
 from typing import Generic, TextIO, TypeVar
 
 from dlparse.errors import AssetKeyMissingError
+from dlparse.utils import load_json
 from .parser import ParserBase
 
 __all__ = ("CustomParserBase",)
@@ -27,7 +27,7 @@ class CustomParserBase(Generic[T], ParserBase[dict[int, T]], ABC):
         The ``key`` of the return will be the value of the data with ``key``.
         This can be overridden by providing the key name.
         """
-        data = json.load(file_like)
+        data = load_json(file_like)
 
         ret: dict[int, dict] = {}
 
@@ -13,6 +13,8 @@ EntryDataType = Mapping[str, Union[str, int, float, list[int]]]
 class EntryBase(ABC):
     """Base class for the entries in the mono behavior assets."""
 
+    __slots__ = ()
+
     @staticmethod
     @abstractmethod
     def parse_raw(data: EntryDataType) -> Optional["EntryBase"]:
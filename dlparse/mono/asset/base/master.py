@@ -1,15 +1,16 @@
 """Base object for the master assets."""
-import json
 from abc import ABC
 from dataclasses import dataclass
-from typing import Callable, Generic, Iterator, Optional, TextIO, Type, TypeVar, Union
+from functools import partialmethod
+from typing import Any, Callable, Generic, Iterable, Iterator, Optional, TextIO, Type, TypeVar, Union
 
-from dlparse.errors import AssetKeyMissingError
+from dlparse.errors import AssetKeyMissingError, ConfigError
+from dlparse.utils import JsonStreamReader, load_json
 from .asset import AssetBase
 from .entry import EntryBase
 from .parser import ParserBase
 
-__all__ = ("MasterEntryBase", "MasterAssetBase", "MasterParserBase", "MasterAssetIdType")
+__all__ = ("MasterEntryBase", "MasterAssetBase", "MasterAssetIndex", "MasterParserBase", "MasterAssetIdType")
 
 MasterAssetIdType = Union[int, str]
 
@@ -18,6 +19,8 @@ MasterAssetIdType = Union[int, str]
 class MasterEntryBase(EntryBase, ABC):
     """Base class for the entries in the master mono behavior asset."""
 
+    __slots__ = ()
+
     id: MasterAssetIdType  # pylint: disable=invalid-name
 
 
@@ -36,7 +39,7 @@ class MasterParserBase(Generic[T], ParserBase[ParsedEntryDict], ABC):
         The ``key`` of the return will be the value of the data with ``key``.
         This can be overridden by providing the key name.
         """
-        data = json.load(file_like)
+        data = load_json(file_like)
 
         if "dict" not in data:
             raise AssetKeyMissingError("dict")
@@ -52,10 +55,113 @@ class MasterParserBase(Generic[T], ParserBase[ParsedEntryDict], ABC):
 
         return {entry[key]: entry for entry in entry_values}
 
+    @staticmethod
+    def _parse_entries_streamed(
+            entries_raw: Iterable[dict], count: Optional[int], fn_parse_raw: Callable[[dict], T], key: str
+    ) -> list[Union[tuple[MasterAssetIdType, T], Exception]]:
+        """
+        Parse each of ``entries_raw`` right after it's read.
+
+        If ``count`` is known, the entries after ``count`` are not parsed.
+        Otherwise, all entries are parsed, and the errors are returned in place of the entries,
+        so the entries after ``count`` can be dropped once ``count`` is read.
+        """
+        entries: list[Union[tuple[MasterAssetIdType, T], Exception]] = []
+
+        for idx, entry in enumerate(entries_raw):
+            if count is not None and idx >= count:
+                # Slots after ``count`` are paddings of the dictionary dump, which may not be valid entries.
+                # Continue instead of break to consume all elements of ``entries_raw``.
+                continue
+
+            if count is not None:
+                entries.append((entry[key], fn_parse_raw(entry)))
+                continue
+
+            try:
+                entries.append((entry[key], fn_parse_raw(entry)))
+            except Exception as ex:  # pylint: disable=broad-except
+                # Raised later if the entry is not a padding
+                entries.append(ex)
+
+        return entries
+
+    @classmethod
+    def _parse_entries_dict_body(
+            cls, reader: JsonStreamReader, fn_parse_raw: Callable[[dict], T], key: str
+    ) -> dict[MasterAssetIdType, T]:
+        has_entries_key = False
+        entries: Optional[list[Union[tuple[MasterAssetIdType, T], Exception]]] = None
+        count: Optional[int] = None
+
+        for key_dict in reader.iter_object():
+            if key_dict == "entriesValue":
+                entries = cls._parse_entries_streamed(reader.iter_array(), count, fn_parse_raw, key)
+            elif key_dict == "entriesKey":
+                # ``entriesKey`` should not be used as ID because ``_Id`` offset was found in action condition asset
+                has_entries_key = True
+                reader.skip_value()
+            elif key_dict == "count":
+                count = reader.read_value()
+            else:
+                reader.skip_value()
+
+        if entries is None:
+            raise AssetKeyMissingError("dict.entriesValue")
+        if not has_entries_key:
+            raise AssetKeyMissingError("dict.entriesKey")
+        if count is None:
+            raise AssetKeyMissingError("dict.count")
+
+        ret: dict[MasterAssetIdType, T] = {}
+
+        for entry in entries[:count]:
+            if isinstance(entry, Exception):
+                raise entry
+
+            entry_id, entry_parsed = entry
+            ret[entry_id] = entry_parsed
+
+        return ret
+
+    @classmethod
+    def parse_entries(
+            cls, file_like: TextIO, fn_parse_raw: Callable[[dict], T], /, key: str = "_Id"
+    ) -> dict[MasterAssetIdType, T]:
+        """
+        Stream the data entries in ``file_like`` and parse each of them using ``fn_parse_raw``.
+
+        This gives the same result as parsing each value returned from ``get_entries_dict()``,
+        except that each raw entry is discarded right after it's parsed,
+        so the whole raw document is never held in the memory.
+
+        Streaming decodes about as fast as the standard library :mod:`json` decoding the whole file,
+        but it is slower than ``orjson``, which ``load_json()`` uses if installed.
+        The peak memory is much lower, though, which matters for the large master assets.
+
+        The ``key`` of the return will be the value of the raw data with ``key``.
+        This can be overridden by providing the key name.
+
+        :raises AssetKeyMissingError: if any of the required keys is missing
+        """
+        reader = JsonStreamReader(file_like)
+        ret: Optional[dict[MasterAssetIdType, T]] = None
+
+        for key_root in reader.iter_object():
+            if key_root == "dict":
+                ret = cls._parse_entries_dict_body(reader, fn_parse_raw, key)
+            else:
+                reader.skip_value()
+
+        if ret is None:
+            raise AssetKeyMissingError("dict")
+
+        return ret
+
     @classmethod
     def get_entries_list(cls, file_like: TextIO) -> list[dict]:
         """Get a list of data entries to be further parsed as a dict."""
-        data = json.load(file_like)
+        data = load_json(file_like)
 
         if "list" not in data:
             raise AssetKeyMissingError("list")
@@ -67,14 +173,73 @@ class MasterParserBase(Generic[T], ParserBase[ParsedEntryDict], ABC):
         raise NotImplementedError()
 
 
+@dataclass(frozen=True)
+class MasterAssetIndex:
+    """
+    Declaration of a secondary index of a master asset.
+
+    The index key of an entry is the value of the attribute in ``attrs`` if there is only one attribute.
+    Otherwise, the key is a tuple of the values of ``attrs`` in order.
+
+    If ``unique`` is ``True``, each key maps to a single entry. Otherwise, each key maps to a list of entries.
+
+    If ``eager`` is ``True``, the index is built once the asset is loaded. Otherwise, it's built on its first use.
+    """
+
+    name: str
+    attrs: tuple[str, ...]
+    unique: bool = False
+    eager: bool = False
+
+    def get_key(self, entry: MasterEntryBase) -> Any:
+        """Get the index key of ``entry``."""
+        if len(self.attrs) == 1:
+            return getattr(entry, self.attrs[0])
+
+        return tuple(getattr(entry, attr) for attr in self.attrs)
+
+    def get_key_from_values(self, values: dict[str, Any]) -> Any:
+        """Get the index key from ``values``, which key is the attribute name."""
+        if len(self.attrs) == 1:
+            return values[self.attrs[0]]
+
+        return tuple(values[attr] for attr in self.attrs)
+
+
 class MasterAssetBase(Generic[T], AssetBase[ParsedEntryDict, T], ABC):
-    """Base class for a master mono behavior asset."""
+    """
+    Base class for a master mono behavior asset.
+
+    Secondary indexes can be declared in ``indexes``.
+    For each declared index, a method ``get_by_<index name>(key, default=None)`` is added to the class.
+    """
+
+    indexes: tuple[MasterAssetIndex, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        for index in cls.__dict__.get("indexes", ()):
+            method_name = f"get_by_{index.name}"
+
+            if not hasattr(cls, method_name):
+                setattr(cls, method_name, partialmethod(MasterAssetBase.get_by_index, index.name))
 
     def __init__(
             self, parser_cls: Type[MasterParserBase[T]], file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(parser_cls, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            parser_cls, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
+
+        self._all_ids: Optional[frozenset[MasterAssetIdType]] = None
+        self._index_data: dict[str, dict[Any, Union[T, list[T]]]] = {}  # K = index name, V = index key to entries
+
+        for index in self.indexes:
+            if index.eager:
+                self._get_index_data(index)
 
     def __iter__(self) -> Iterator[T]:
         return iter(self._data.values())
@@ -87,13 +252,100 @@ class MasterAssetBase(Generic[T], AssetBase[ParsedEntryDict, T], ABC):
         return self._data
 
     @property
-    def all_ids(self) -> set[MasterAssetIdType]:
-        """Get the set of all data IDs."""
-        return set(self._data.keys())
+    def all_ids(self) -> frozenset[MasterAssetIdType]:
+        """
+        Get the set of all data IDs.
+
+        The set is computed once, then the same :class:`frozenset` is returned.
+        It used to be a new :class:`set` on each call, so use ``set(asset.all_ids)`` to get a mutable copy.
+        """
+        if self._all_ids is None:
+            self._all_ids = frozenset(self._data.keys())
+
+        return self._all_ids
+
+    # region Secondary indexes
+
+    def _get_index(self, index_name: str) -> MasterAssetIndex:
+        for index in self.indexes:
+            if index.name == index_name:
+                return index
+
+        raise ConfigError(f"Index `{index_name}` is not declared in {self.__class__.__name__}")
+
+    def _get_index_data(self, index: MasterAssetIndex) -> dict[Any, Union[T, list[T]]]:
+        if index.name in self._index_data:
+            return self._index_data[index.name]
+
+        index_data: dict[Any, Union[T, list[T]]] = {}
+
+        for entry in self:
+            key = index.get_key(entry)
+
+            if not index.unique:
+                index_data.setdefault(key, []).append(entry)
+                continue
+
+            if key in index_data:
+                raise ConfigError(
+                    f"Index `{index.name}` of {self.__class__.__name__} is declared unique, "
+                    f"but key `{key}` is shared by multiple entries"
+                )
+
+            index_data[key] = entry
+
+        self._index_data[index.name] = index_data
+
+        return index_data
+
+    def _find_index(self, attrs: Iterable[str]) -> Optional[MasterAssetIndex]:
+        """Find the index which attributes are all in ``attrs``. The index having the most attributes is preferred."""
+        attrs = set(attrs)
+
+        indexes = [index for index in self.indexes if attrs.issuperset(index.attrs)]
+        if not indexes:
+            return None
+
+        return max(indexes, key=lambda index: len(index.attrs))
+
+    def get_by_index(self, index_name: str, key: Any, default: Any = None) -> Any:
+        """
+        Get the entry or the list of the entries (if the index is not unique) having ``key`` in the index.
+
+        Returns ``default`` if not found. The returned list should not be modified.
+
+        :raises ConfigError: if the index is not declared
+        """
+        return self._get_index_data(self._get_index(index_name)).get(key, default)
+
+    # endregion
+
+    def filter(self, condition: Optional[Callable[[T], bool]] = None, /, **attrs: Any) -> list[T]:
+        """
+        Get a list of data which matches the ``condition`` and has the attribute values of ``attrs``.
+
+        If any of the declared indexes is composed by the attributes in ``attrs``, the index will be used.
+
+        For example, ``filter(group_id=7)`` uses the index on ``group_id`` if declared.
+        """
+        entries: Iterable[T] = self
+
+        if attrs and (index := self._find_index(attrs)):
+            index_data = self._get_index_data(index)
+            key = index.get_key_from_values(attrs)
+
+            if index.unique:
+                entries = [index_data[key]] if key in index_data else []
+            else:
+                entries = index_data.get(key, [])
+
+            attrs = {attr: value for attr, value in attrs.items() if attr not in index.attrs}
 
-    def filter(self, condition: Callable[[T], bool]) -> list[T]:
-        """Get a list of data which matches the ``condition``."""
-        return [data for data in self if condition(data)]
+        return [
+            data for data in entries
+            if all(getattr(data, attr) == value for attr, value in attrs.items())
+            and (condition is None or condition(data))
+        ]
 
     def get_data_by_id(self, data_id: MasterAssetIdType, default: Optional[T] = None) -> Optional[T]:
         """Get a data by its ``data_id``. Return ``default`` if not found."""
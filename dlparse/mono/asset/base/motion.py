@@ -1,19 +1,60 @@
 """Base implementations for handling the motion asset files."""
-import json
 from abc import ABC
 from typing import Any, TextIO
 
+from dlparse.utils import JsonFieldSelection, load_json, select_json_fields
+
 __all__ = ("parse_motion_data", "AnimationControllerBase")
 
+# Fields used by the animation controllers. The other fields, which are the majority of a file, are skipped.
+_MOTION_DATA_FIELDS: JsonFieldSelection = {
+    "$Name": True,
+    "$Controller": {
+        "m_Name": True,
+        "m_TOS": True,
+        "m_AnimationClips": True,
+        "m_Controller": {
+            "m_StateMachineArray": {
+                "data": {
+                    "m_StateConstantArray": {
+                        "data": {
+                            "m_NameID": True,
+                            "m_BlendTreeConstantArray": {
+                                "data": {
+                                    "m_NodeArray": {
+                                        "data": {
+                                            "m_ClipID": True,
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    "$Clips": {
+        "$PathID": True,
+        "$Name": True,
+        "$StopTime": True,
+        "$OriginalClip": True,
+        "$OverrideClip": True,
+    },
+}
+
 
 def parse_motion_data(file_like: TextIO) -> dict[str, Any]:
     """
     Parse ``file_like`` to a :class:`dict`.
 
+    Only the fields used by the animation controllers are kept in the return.
+    The whole file is still decoded, which is faster than streaming the file to skip the other fields.
+
     This method opens and closes ``file_like``.
     """
     with file_like:
-        data = json.load(file_like)
+        data = select_json_fields(load_json(file_like), _MOTION_DATA_FIELDS)
 
     return data
 
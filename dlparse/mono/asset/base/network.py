@@ -0,0 +1,344 @@
+"""
+Network source for fetching the remote asset files.
+
+Connections to the same host are kept alive and reused.
+Files can be prefetched concurrently, and optionally cached on the local disk.
+
+The local cache is content-addressed. The content of each file is stored once under its hash,
+and each URL is mapped to the content hash.
+Because a URL of the asset depot contains both the version tag and the path of the file,
+the cache is effectively keyed by the version tag and the path.
+Files of a version tag never change, so the cache entries never expire.
+
+Redirects are followed. URLs to be fetched via a proxy (configured by the environment variables
+such as ``HTTPS_PROXY``) are fetched by ``urllib`` without pooling the connections.
+"""
+import hashlib
+import io
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPConnection, HTTPException, HTTPMessage, HTTPSConnection
+from typing import Iterable, Optional, TextIO
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass, urlopen
+
+__all__ = ("NetworkSource", "get_network_source", "set_network_source")
+
+ConnectionKey = tuple[str, str]  # Scheme, host (with port)
+
+MAX_REDIRECTS: int = 10
+"""Maximum count of the redirects to follow for a single request. This is the same as ``urllib``."""
+
+_REDIRECT_STATUSES: frozenset[int] = frozenset({301, 302, 303, 307, 308})
+
+
+class NetworkSource:
+    """Source of the remote files, using pooled keep-alive connections and an optional local cache."""
+
+    def __init__(self, /, cache_dir: Optional[str] = None, max_connections: int = 8, timeout: float = 30):
+        """
+        Initializes a network source.
+
+        If ``cache_dir`` is given, fetched files will be cached in ``cache_dir``.
+
+        At most ``max_connections`` requests will be sent concurrently.
+        This is also the maximum count of idle connections kept for each host.
+        """
+        self._cache_dir = cache_dir
+        self._max_connections = max_connections
+        self._timeout = timeout
+
+        self._lock = threading.Lock()
+        self._request_slots = threading.BoundedSemaphore(max_connections)
+        self._idle_connections: dict[ConnectionKey, list[HTTPConnection]] = defaultdict(list)
+        self._pid = os.getpid()
+
+        # Prefetched contents are kept here until used or closed if there is no cache directory
+        self._prefetched: dict[str, bytes] = {}
+        # K = connection key, V = if the requests are sent via a proxy
+        self._is_proxied: dict[ConnectionKey, bool] = {}
+
+        self._request_count: int = 0
+        self._connection_count: int = 0
+
+    @property
+    def request_count(self) -> int:
+        """Count of the requests actually sent."""
+        return self._request_count
+
+    @property
+    def connection_count(self) -> int:
+        """Count of the connections opened."""
+        return self._connection_count
+
+    # region Connection pool
+
+    def _acquire_connection(self, key: ConnectionKey) -> tuple[HTTPConnection, bool]:
+        """Get a connection to ``key``. Returns the connection and a flag indicating if the connection is reused."""
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked process shares the sockets with the parent process, which should not be used
+                self._idle_connections = defaultdict(list)
+                self._pid = os.getpid()
+
+            if self._idle_connections[key]:
+                return self._idle_connections[key].pop(), True
+
+            self._connection_count += 1
+
+        scheme, host = key
+        connection_cls = HTTPSConnection if scheme == "https" else HTTPConnection
+
+        return connection_cls(host, timeout=self._timeout), False
+
+    def _release_connection(self, key: ConnectionKey, connection: HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle_connections[key]) < self._max_connections:
+                self._idle_connections[key].append(connection)
+                return
+
+        connection.close()
+
+    def close(self) -> None:
+        """Close all idle connections and drop the prefetched contents not used yet."""
+        with self._lock:
+            for connections in self._idle_connections.values():
+                for connection in connections:
+                    connection.close()
+
+            self._idle_connections.clear()
+            self._prefetched.clear()
+
+    def _is_proxied_key(self, key: ConnectionKey) -> bool:
+        with self._lock:
+            if (is_proxied := self._is_proxied.get(key)) is not None:
+                return is_proxied
+
+        scheme, host = key
+        is_proxied = scheme in getproxies() and not proxy_bypass(host)
+
+        with self._lock:
+            self._is_proxied[key] = is_proxied
+
+        return is_proxied
+
+    def _request_proxied(self, url: str) -> tuple[int, str, HTTPMessage, bytes]:
+        try:
+            # Only called for the URLs of the connection keys, no risk of passing ftp:// or file:// here
+            with urlopen(url, timeout=self._timeout) as response:  # nosec
+                return response.status, response.reason, response.headers, response.read()
+        except HTTPError as ex:
+            with ex:
+                return ex.code, ex.reason, ex.headers, ex.read()
+
+    def _request_once(self, url: str) -> tuple[int, str, HTTPMessage, bytes]:
+        """Send a GET request to ``url`` without following the redirects. Returns the status, headers and body."""
+        url_parts = urlsplit(url)
+        key = (url_parts.scheme, url_parts.netloc)
+        path = f"{url_parts.path}?{url_parts.query}" if url_parts.query else url_parts.path
+
+        if self._is_proxied_key(key):
+            with self._lock:
+                self._request_count += 1
+
+            return self._request_proxied(url)
+
+        while True:
+            connection, is_reused = self._acquire_connection(key)
+
+            try:
+                connection.request("GET", path)
+                response = connection.getresponse()
+                content = response.read()
+            except (OSError, HTTPException) as ex:
+                # ``OSError`` includes the timeouts
+                connection.close()
+
+                if is_reused and isinstance(ex, (ConnectionError, HTTPException)):
+                    # Idle connection could be closed by the server, retry with another connection
+                    continue
+
+                raise
+
+            with self._lock:
+                self._request_count += 1
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._release_connection(key, connection)
+
+            return response.status, response.reason, response.headers, content
+
+    def _request(self, url: str) -> bytes:
+        """
+        Send a GET request to ``url`` and return the response body. Redirects are followed.
+
+        :raises ValueError: if the file at `url` is not found
+        :raises HTTPError: if the response status is not OK or there are too many redirects
+        """
+        url_requested = url
+
+        with self._request_slots:
+            for _ in range(MAX_REDIRECTS + 1):
+                status, reason, headers, content = self._request_once(url)
+
+                if status not in _REDIRECT_STATUSES or not (location := headers.get("Location")):
+                    break
+
+                url = urljoin(url, location)
+            else:
+                raise HTTPError(url_requested, status, "Too many redirects", headers, None)
+
+        if status == 404:
+            raise ValueError(f"URL: {url_requested} not found")
+
+        if status != 200:
+            raise HTTPError(url_requested, status, reason, headers, None)
+
+        return content
+
+    # endregion
+
+    # region Local cache
+
+    def _get_ref_path(self, url: str) -> str:
+        url_hash = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+
+        return os.path.join(self._cache_dir, "refs", url_hash)
+
+    def _get_object_path(self, content_hash: str) -> str:
+        return os.path.join(self._cache_dir, "objects", content_hash[:2], content_hash)
+
+    @staticmethod
+    def _get_content_hash(content: bytes) -> str:
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+    @staticmethod
+    def _write_atomic(file_path: str, content: bytes) -> None:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        file_path_temp = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(file_path_temp, "wb") as f:
+            f.write(content)
+
+        os.replace(file_path_temp, file_path)
+
+    def _load_cached(self, url: str) -> Optional[bytes]:
+        if not self._cache_dir:
+            return None
+
+        try:
+            with open(self._get_ref_path(url), encoding="utf-8") as f:
+                content_hash = f.read().strip()
+
+            with open(self._get_object_path(content_hash), "rb") as f:
+                content = f.read()
+        except OSError:
+            return None
+
+        if self._get_content_hash(content) != content_hash:
+            # Corrupted cache
+            return None
+
+        return content
+
+    def _store_cached(self, url: str, content: bytes) -> None:
+        content_hash = self._get_content_hash(content)
+
+        try:
+            object_path = self._get_object_path(content_hash)
+            if not os.path.exists(object_path):
+                self._write_atomic(object_path, content)
+
+            self._write_atomic(self._get_ref_path(url), content_hash.encode("utf-8"))
+        except OSError:
+            # Cache is an optimization only, failing to store it should not fail the fetch
+            pass
+
+    # endregion
+
+    def fetch(self, url: str) -> bytes:
+        """
+        Get the content at ``url``.
+
+        The content comes from the prefetched data, the local cache or the network, in order.
+
+        :raises ValueError: if the file at `url` is not found
+        :raises HTTPError: if the response status is not OK
+        """
+        with self._lock:
+            content = self._prefetched.pop(url, None)
+
+        if content is not None:
+            return content
+
+        if (content := self._load_cached(url)) is not None:
+            return content
+
+        content = self._request(url)
+
+        if self._cache_dir:
+            self._store_cached(url, content)
+
+        return content
+
+    def open(self, url: str) -> TextIO:
+        """
+        Get the file-like object of the content at ``url``.
+
+        :raises ValueError: if the file at `url` is not found
+        :raises HTTPError: if the response status is not OK
+        """
+        return io.TextIOWrapper(io.BytesIO(self.fetch(url)), encoding="utf-8")
+
+    def _prefetch_single(self, url: str) -> None:
+        if self._load_cached(url) is not None:
+            return
+
+        content = self._request(url)
+
+        if self._cache_dir:
+            self._store_cached(url, content)
+            return
+
+        with self._lock:
+            self._prefetched[url] = content
+
+    def prefetch(self, urls: Iterable[str]) -> dict[str, Exception]:
+        """
+        Fetch the files at ``urls`` concurrently, so the later ``fetch()`` or ``open()`` does not wait for the network.
+
+        Without a cache directory, the prefetched contents are kept in the memory until they are used.
+
+        Returns the errors raised for each URL failed to be fetched.
+        """
+        urls = list(dict.fromkeys(urls))
+        errors: dict[str, Exception] = {}
+
+        with ThreadPoolExecutor(max_workers=self._max_connections) as executor:
+            futures = {url: executor.submit(self._prefetch_single, url) for url in urls}
+
+            for url, future in futures.items():
+                if ex := future.exception():
+                    errors[url] = ex
+
+        return errors
+
+
+_network_source: NetworkSource = NetworkSource()
+
+
+def get_network_source() -> NetworkSource:
+    """Get the network source used for fetching the remote files."""
+    return _network_source
+
+
+def set_network_source(network_source: NetworkSource) -> None:
+    """Set the network source used for fetching the remote files."""
+    global _network_source  # pylint: disable=global-statement,invalid-name
+
+    _network_source = network_source
@@ -1,11 +1,11 @@
 """Base object for the player action assets."""
-import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Callable, Iterator, Mapping, Optional, TextIO, Type, TypeVar, Union, cast
 
 from dlparse.enums import ActionConditionType, Condition, ConditionCategories
 from dlparse.errors import AssetKeyMissingError, EnumConversionError
+from dlparse.utils import load_json
 from .asset import AssetBase
 from .entry import EntryBase, EntryDataType
 from .parser import ParserBase
@@ -213,7 +213,7 @@ class ActionParserBase(ParserBase[list[T]], ABC):
 
         :raises AssetKeyMissingError: if key `Components` is not in the data
         """
-        data = json.load(file_like)
+        data = load_json(file_like)
 
         if "Components" not in data:
             raise AssetKeyMissingError("Components")
@@ -231,9 +231,9 @@ class ActionAssetBase(AssetBase[list[T], T], ABC):
 
     def __init__(
             self, parser_cls: Type[ActionParserBase], file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None
+            asset_dir: Optional[str] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(parser_cls, file_location, asset_dir=asset_dir)
+        super().__init__(parser_cls, file_location, asset_dir=asset_dir, snapshot_dir=snapshot_dir)
 
     def __iter__(self) -> Iterator[T]:
         return iter(self._data)
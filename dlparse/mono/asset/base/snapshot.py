@@ -0,0 +1,158 @@
+"""
+Functions for storing and loading the snapshots of the parsed asset data.
+
+A snapshot is the parsed data of an asset file stored in a binary form.
+Loading a snapshot skips both the json decoding and the entry parsing.
+
+Each snapshot records the path, size, modification time and the content hash of its source file.
+Whenever the source file changes, the snapshot is discarded and the file is parsed again.
+"""
+import hashlib
+import os
+import pickle  # nosec
+from dataclasses import dataclass, replace
+from typing import Any, Optional, Type, TypeVar
+
+from .parser import ParserBase
+
+__all__ = ("parse_file_with_snapshot", "get_snapshot_path")
+
+T = TypeVar("T")
+
+SNAPSHOT_FORMAT_VERSION: int = 2
+"""Version of the snapshot format. Bump this if the layout of the parsed data or the header changes."""
+
+_SNAPSHOT_LOAD_ERRORS: tuple[Type[Exception], ...] = (
+    OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, IndexError, TypeError, ValueError
+)
+"""Errors indicating that a snapshot is corrupted or incompatible with the current code."""
+
+_HASH_CHUNK_SIZE: int = 1 << 20
+
+
+@dataclass(frozen=True)
+class SnapshotHeader:
+    """Header of a snapshot, which is used to check if the snapshot is still valid."""
+
+    format_version: int
+    parser_name: str
+    file_path: str
+    file_size: int
+    file_mtime_ns: int
+    content_hash: str
+
+
+def _get_parser_name(parser_cls: Type[ParserBase[Any]]) -> str:
+    return f"{parser_cls.__module__}.{parser_cls.__qualname__}"
+
+
+def _get_content_hash(file_path: str) -> str:
+    content_hash = hashlib.blake2b(digest_size=16)
+
+    with open(file_path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            content_hash.update(chunk)
+
+    return content_hash.hexdigest()
+
+
+def get_snapshot_path(parser_cls: Type[ParserBase[Any]], file_path: str, snapshot_dir: str) -> str:
+    """
+    Get the path of the snapshot of ``file_path`` parsed by ``parser_cls``.
+
+    The snapshot file name is derived from both the parser and the absolute path of the source file,
+    so the same file parsed by different parsers will not collide.
+    """
+    path_hash = hashlib.blake2b(os.path.abspath(file_path).encode("utf-8"), digest_size=8).hexdigest()
+
+    return os.path.join(snapshot_dir, f"{parser_cls.__name__}-{path_hash}.pickle")
+
+
+def _load_snapshot(snapshot_path: str, header_expected: SnapshotHeader) -> tuple[Optional[Any], bool]:
+    """
+    Load the snapshot data at ``snapshot_path``.
+
+    Returns a tuple of the loaded data and a flag indicating if the snapshot header needs to be refreshed.
+    The loaded data is ``None`` if the snapshot is missing or invalid.
+
+    ``content_hash`` of ``header_expected`` will be ignored.
+    The hash will only be calculated if the modification time does not match.
+    """
+    if not os.path.exists(snapshot_path):
+        return None, False
+
+    try:
+        with open(snapshot_path, "rb") as f:
+            header: SnapshotHeader = pickle.load(f)  # nosec
+
+            if (
+                    not isinstance(header, SnapshotHeader)
+                    or header.format_version != header_expected.format_version
+                    or header.parser_name != header_expected.parser_name
+                    or header.file_path != header_expected.file_path
+                    or header.file_size != header_expected.file_size
+            ):
+                return None, False
+
+            if header.file_mtime_ns == header_expected.file_mtime_ns:
+                return pickle.load(f), False  # nosec
+
+            # Modification time changed, but the content may be the same (for example, git checkout)
+            if header.content_hash != _get_content_hash(header_expected.file_path):
+                return None, False
+
+            return pickle.load(f), True  # nosec
+    except _SNAPSHOT_LOAD_ERRORS:
+        return None, False
+
+
+def _store_snapshot(snapshot_path: str, header: SnapshotHeader, data: Any) -> None:
+    os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+
+    # Write to a temporary file first, then replace the snapshot to avoid leaving a partially written snapshot
+    snapshot_path_temp = f"{snapshot_path}.{os.getpid()}.tmp"
+
+    try:
+        with open(snapshot_path_temp, "wb") as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(snapshot_path_temp, snapshot_path)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError, RecursionError):
+        # Snapshot is an optimization only, failing to store it should not fail the parsing
+        if os.path.exists(snapshot_path_temp):
+            os.remove(snapshot_path_temp)
+
+
+def parse_file_with_snapshot(parser_cls: Type[ParserBase[T]], file_path: str, snapshot_dir: str) -> T:
+    """
+    Parse the local file at ``file_path`` using ``parser_cls``, using the snapshot in ``snapshot_dir`` if possible.
+
+    If the snapshot is missing or outdated, the file will be parsed normally,
+    then the parsed data will be stored as a snapshot in ``snapshot_dir``.
+
+    ``file_path`` must be a local file path.
+    """
+    file_stat = os.stat(file_path)
+    header = SnapshotHeader(
+        format_version=SNAPSHOT_FORMAT_VERSION,
+        parser_name=_get_parser_name(parser_cls),
+        file_path=os.path.abspath(file_path),
+        file_size=file_stat.st_size,
+        file_mtime_ns=file_stat.st_mtime_ns,
+        content_hash="",
+    )
+    snapshot_path = get_snapshot_path(parser_cls, file_path, snapshot_dir)
+
+    data, need_refresh = _load_snapshot(snapshot_path, header)
+
+    if data is None:
+        with open(file_path, encoding="utf-8") as file_like:
+            data = parser_cls.parse_file(file_like)
+
+        need_refresh = True
+
+    if need_refresh:
+        _store_snapshot(snapshot_path, replace(header, content_hash=_get_content_hash(file_path)), data)
+
+    return data
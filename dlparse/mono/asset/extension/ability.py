@@ -16,6 +16,8 @@ VT = TypeVar("VT", bound=AbilityVariantEntryBase)
 class AbilityEntryExtension(Generic[CT, VT], DescribedNameEntry, MasterEntryBase, ABC):
     """Base class of an ability entry."""
 
+    __slots__ = ()
+
     condition: CT
 
     ability_icon_name: str
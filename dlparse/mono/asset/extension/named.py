@@ -16,6 +16,8 @@ __all__ = ("UnitNameEntry", "DescribedNameEntry")
 class DescribedNameEntry(ABC):
     """Interface for an entry that has a name and a description."""
 
+    __slots__ = ()
+
     name_label: str
     description_label: str
 
@@ -24,6 +26,8 @@ class DescribedNameEntry(ABC):
 class UnitNameEntry(ABC):
     """Interface for a named unit data entry."""
 
+    __slots__ = ()
+
     name_label: str
     name_label_2: str
     emblem_id: int
@@ -9,5 +9,7 @@ __all__ = ("SkillEntry",)
 class SkillEntry(ABC):
     """Interface for a data entry with skills."""
 
+    __slots__ = ()
+
     skill_1_id: int
     skill_2_id: int
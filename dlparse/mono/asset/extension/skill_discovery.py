@@ -193,6 +193,8 @@ The key is the character ID (an 8-digit number); the value is a list of the skil
 class SkillDiscoverableEntry(SkillEntry, MasterEntryBase, ABC):
     """An interface that allows an entry to discover its possible skills."""
 
+    __slots__ = ()
+
     ss_skill_id: int
     ss_skill_num: SkillNumber
     ss_skill_cost: int
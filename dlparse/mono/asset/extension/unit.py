@@ -20,6 +20,8 @@ __all__ = ("UnitEntry", "UnitAsset", "SkillReverseSearchResult")
 class UnitEntry(UnitNameEntry, VariedEntry, SkillDiscoverableEntry, MasterEntryBase, ABC):
     """Interface for an unit."""
 
+    __slots__ = ()
+
     element: Element
     rarity: int
 
@@ -77,9 +79,12 @@ class UnitAsset(Generic[T], MasterAssetBase[T], ABC):
 
     def __init__(
             self, parser_cls: Type[MasterParserBase[T]], file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(parser_cls, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            parser_cls, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
         # Cache for getting the unit data by skill ID
         self._cache_skill_id: dict[int, SkillReverseSearchResult] = {}  # K = skill ID, V = reverse search result
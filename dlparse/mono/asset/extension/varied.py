@@ -17,6 +17,8 @@ VariationIdentifier = tuple[int, int]
 class VariedEntry(ABC):
     """Interface for a varied entry."""
 
+    __slots__ = ()
+
     base_id: int
     variation_id: int
 
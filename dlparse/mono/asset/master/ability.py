@@ -136,7 +136,7 @@ class AbilityVariantEntry(AbilityVariantEntryBase):
         return self._skill_boost_data[gauge_filled] / 100
 
 
-@dataclass
+@dataclass(slots=True)
 class AbilityEntry(AbilityEntryExtension[AbilityConditionEntry, AbilityVariantEntry], MasterEntryBase):
     """Single entry of an ability data."""
 
@@ -308,9 +308,12 @@ class AbilityAsset(MasterAssetBase[AbilityEntry]):
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(AbilityParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            AbilityParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
 
 class AbilityParser(MasterParserBase[AbilityEntry]):
@@ -318,6 +321,4 @@ class AbilityParser(MasterParserBase[AbilityEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[int, AbilityEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: AbilityEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, AbilityEntry.parse_raw)
@@ -31,9 +31,12 @@ class AbilityLimitGroupAsset(MasterAssetBase[AbilityLimitGroupEntry]):
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(AbilityLimitGroupParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            AbilityLimitGroupParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
     def get_max_value(self, data_id: int, on_not_found: Any = THROW_ERROR) -> float:
         """
@@ -57,6 +60,4 @@ class AbilityLimitGroupParser(MasterParserBase[AbilityLimitGroupEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[int, AbilityLimitGroupEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: AbilityLimitGroupEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, AbilityLimitGroupEntry.parse_raw)
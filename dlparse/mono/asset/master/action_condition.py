@@ -3,12 +3,12 @@ from dataclasses import dataclass
 from typing import Optional, TextIO, Union
 
 from dlparse.enums import Condition, ConditionCategories, EfficacyType, Element, ElementFlag, Status
-from dlparse.mono.asset.base import MasterAssetBase, MasterEntryBase, MasterParserBase
+from dlparse.mono.asset.base import ColumnarView, MasterAssetBase, MasterEntryBase, MasterParserBase
 
 __all__ = ("ActionConditionEntry", "ActionConditionAsset")
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionConditionEntry(MasterEntryBase):
     """Single entry of an action condition data."""
 
@@ -214,9 +214,28 @@ class ActionConditionAsset(MasterAssetBase[ActionConditionEntry]):
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(ActionConditionParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            ActionConditionParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
+
+        self._columnar: Optional[ColumnarView[ActionConditionEntry]] = None
+
+    @property
+    def columnar(self) -> ColumnarView[ActionConditionEntry]:
+        """
+        Get the columnar view of the action conditions.
+
+        The view is built on the first access.
+
+        For example, ``columnar.get_ids_nonzero("buff_atk")`` gives the IDs of all action conditions buffing ATK.
+        """
+        if self._columnar is None:
+            self._columnar = ColumnarView(self)
+
+        return self._columnar
 
 
 class ActionConditionParser(MasterParserBase[ActionConditionEntry]):
@@ -224,6 +243,4 @@ class ActionConditionParser(MasterParserBase[ActionConditionEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[int, ActionConditionEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: ActionConditionEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, ActionConditionEntry.parse_raw)
@@ -33,9 +33,12 @@ class ActionGrantAsset(MasterAssetBase[ActionGrantEntry]):
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(ActionGrantParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            ActionGrantParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
 
 class ActionGrantParser(MasterParserBase[ActionGrantEntry]):
@@ -43,6 +46,4 @@ class ActionGrantParser(MasterParserBase[ActionGrantEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[int, ActionGrantEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: ActionGrantEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, ActionGrantEntry.parse_raw)
@@ -1,16 +1,20 @@
 """Classes for handling the player action hit attribute asset."""
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Optional, TextIO, Union
 
 from dlparse.enums import HitExecType, HitTarget, Status
-from dlparse.mono.asset.base import MasterAssetBase, MasterEntryBase, MasterParserBase
+from dlparse.mono.asset.base import ColumnarView, MasterAssetBase, MasterEntryBase, MasterParserBase
 from dlparse.mono.asset.extension import ComboBoostValueExtension
+from dlparse.utils import get_hit_label_data, make_hit_label
 from .action_condition import ActionConditionAsset
 
 __all__ = ("HitAttrEntry", "HitAttrAsset")
 
+HitLabelVariantKey = tuple[Optional[int], bool]  # Level, shifted
 
-@dataclass
+
+@dataclass(slots=True)
 class HitAttrEntry(MasterEntryBase):
     """
     Single entry of a hit attribute data.
@@ -288,9 +292,82 @@ class HitAttrAsset(MasterAssetBase[HitAttrEntry]):
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(HitAttrParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            HitAttrParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
+
+        self._columnar: Optional[ColumnarView[HitAttrEntry]] = None
+        # K = original label
+        self._label_variants: Optional[dict[str, dict[HitLabelVariantKey, HitAttrEntry]]] = None
+
+    @property
+    def columnar(self) -> ColumnarView[HitAttrEntry]:
+        """
+        Get the columnar view of the hit attributes.
+
+        The view is built on the first access.
+        Other than the numeric fields, the view also has a ``punisher_state_count`` column.
+
+        For example, ``columnar.get_ids_nonzero("punisher_state_count")`` gives the IDs
+        of all hit attributes having punisher states.
+        """
+        if self._columnar is None:
+            self._columnar = ColumnarView(
+                self, extra_columns={"punisher_state_count": lambda entry: len(entry.punisher_states)}
+            )
+
+        return self._columnar
+
+    def _get_label_variants_index(self) -> dict[str, dict[HitLabelVariantKey, HitAttrEntry]]:
+        if self._label_variants is not None:
+            return self._label_variants
+
+        label_variants: defaultdict[str, dict[HitLabelVariantKey, HitAttrEntry]] = defaultdict(dict)
+
+        for entry in self:
+            try:
+                label_data = get_hit_label_data(entry.id)
+            except ValueError:
+                # Label not following the naming convention, for example, having `LV` not followed by a number
+                continue
+
+            variants = label_variants[label_data.original]
+            key = (label_data.level, label_data.shifted)
+
+            # Labels made by ``make_hit_label()`` take precedence if multiple labels share the same variant
+            if key not in variants or entry.id == make_hit_label(label_data.original, level=key[0], shifted=key[1]):
+                variants[key] = entry
+
+        self._label_variants = dict(label_variants)
+
+        return self._label_variants
+
+    def get_label_variants(self, label: str) -> dict[HitLabelVariantKey, HitAttrEntry]:
+        """
+        Get the hit attributes of all leveled or shifted variants of ``label``, keyed by ``(level, shifted)``.
+
+        ``label`` can be any of its variants. The variants are indexed on the first call.
+        """
+        return self._get_label_variants_index().get(get_hit_label_data(label).original, {})
+
+    def get_label_variant(
+            self, label: str, /, level: Optional[int] = None, shifted: Optional[bool] = None
+    ) -> Optional[HitAttrEntry]:
+        """
+        Get the hit attribute of the variant of ``label`` with the specified properties.
+
+        The properties not specified are kept, same as ``make_hit_label()``.
+        Returns ``None`` if such variant does not exist.
+        """
+        label_data = get_hit_label_data(label)
+
+        if shifted is None:
+            shifted = label_data.shifted
+
+        return self.get_label_variants(label).get((level or label_data.level, shifted))
 
 
 class HitAttrParser(MasterParserBase[HitAttrEntry]):
@@ -298,6 +375,4 @@ class HitAttrParser(MasterParserBase[HitAttrEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[int, HitAttrEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: HitAttrEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, HitAttrEntry.parse_raw)
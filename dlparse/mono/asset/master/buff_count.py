@@ -71,9 +71,12 @@ class BuffCountAsset(MasterAssetBase[BuffCountEntry]):
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(BuffCountParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            BuffCountParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
 
 class BuffCountParser(MasterParserBase[BuffCountEntry]):
@@ -81,6 +84,4 @@ class BuffCountParser(MasterParserBase[BuffCountEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[int, BuffCountEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: BuffCountEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, BuffCountEntry.parse_raw)
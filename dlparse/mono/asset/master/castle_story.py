@@ -26,9 +26,12 @@ class CastleStoryAsset(MasterAssetBase[CastleStoryEntry]):
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(CastleStoryParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            CastleStoryParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
 
 class CastleStoryParser(MasterParserBase[CastleStoryEntry]):
@@ -36,6 +39,4 @@ class CastleStoryParser(MasterParserBase[CastleStoryEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[int, CastleStoryEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: CastleStoryEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, CastleStoryEntry.parse_raw)
@@ -16,7 +16,7 @@ if TYPE_CHECKING:
 __all__ = ("CharaDataEntry", "CharaDataAsset")
 
 
-@dataclass
+@dataclass(slots=True)
 class CharaDataEntry(UnitEntry, MasterEntryBase):
     """Single entry of a character data."""
 
@@ -540,9 +540,12 @@ class CharaDataAsset(UnitAsset[CharaDataEntry], MasterAssetBase[CharaDataEntry])
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(CharaDataParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            CharaDataParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
 
 class CharaDataParser(MasterParserBase[CharaDataEntry]):
@@ -550,6 +553,4 @@ class CharaDataParser(MasterParserBase[CharaDataEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[int, CharaDataEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: CharaDataEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, CharaDataEntry.parse_raw)
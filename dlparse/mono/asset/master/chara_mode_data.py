@@ -50,9 +50,12 @@ class CharaModeAsset(MasterAssetBase[CharaModeEntry]):
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(CharaModeParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            CharaModeParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
         self._init_fill_name_label()
 
@@ -62,6 +65,4 @@ class CharaModeParser(MasterParserBase[CharaModeEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[int, CharaModeEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: CharaModeEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, CharaModeEntry.parse_raw)
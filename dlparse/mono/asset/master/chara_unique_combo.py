@@ -30,9 +30,12 @@ class CharaUniqueComboAsset(MasterAssetBase[CharaUniqueComboEntry]):
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(CharaUniqueComboParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            CharaUniqueComboParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
 
 class CharaUniqueComboParser(MasterParserBase[CharaUniqueComboEntry]):
@@ -40,6 +43,4 @@ class CharaUniqueComboParser(MasterParserBase[CharaUniqueComboEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[int, CharaUniqueComboEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: CharaUniqueComboEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, CharaUniqueComboEntry.parse_raw)
@@ -36,9 +36,12 @@ class CheatDetectionAsset(MasterAssetBase[CheatDetectionEntry]):
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(CheatDetectionParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            CheatDetectionParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
 
 class CheatDetectionParser(MasterParserBase[CheatDetectionEntry]):
@@ -46,6 +49,4 @@ class CheatDetectionParser(MasterParserBase[CheatDetectionEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[int, CheatDetectionEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: CheatDetectionEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, CheatDetectionEntry.parse_raw)
@@ -125,9 +125,12 @@ class DragonDataAsset(UnitAsset[DragonDataEntry], MasterAssetBase[DragonDataEntr
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(DragonDataParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            DragonDataParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
 
 class DragonDataParser(MasterParserBase[DragonDataEntry]):
@@ -135,6 +138,4 @@ class DragonDataParser(MasterParserBase[DragonDataEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[int, DragonDataEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: DragonDataEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, DragonDataEntry.parse_raw)
@@ -80,9 +80,12 @@ class DungeonPlannerAsset(MasterAssetBase[DungeonPlannerEntry]):
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(DungeonPlannerParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            DungeonPlannerParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
 
 class DungeonPlannerParser(MasterParserBase[DungeonPlannerEntry]):
@@ -90,6 +93,4 @@ class DungeonPlannerParser(MasterParserBase[DungeonPlannerEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[str, DungeonPlannerEntry]:
-        entries = cls.get_entries_dict(file_like, key="_Area")
-
-        return {key: DungeonPlannerEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, DungeonPlannerEntry.parse_raw, key="_Area")
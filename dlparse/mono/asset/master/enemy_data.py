@@ -43,9 +43,12 @@ class EnemyDataAsset(MasterAssetBase[EnemyDataEntry]):
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(EnemyDataParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            EnemyDataParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
 
 class EnemyDataParser(MasterParserBase[EnemyDataEntry]):
@@ -53,6 +56,4 @@ class EnemyDataParser(MasterParserBase[EnemyDataEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[int, EnemyDataEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: EnemyDataEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, EnemyDataEntry.parse_raw)
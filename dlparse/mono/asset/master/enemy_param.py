@@ -161,9 +161,12 @@ class EnemyParamAsset(MasterAssetBase[EnemyParamEntry]):
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(EnemyParamParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            EnemyParamParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
 
 class EnemyParamParser(MasterParserBase[EnemyParamEntry]):
@@ -171,6 +174,4 @@ class EnemyParamParser(MasterParserBase[EnemyParamEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[int, EnemyParamEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: EnemyParamEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, EnemyParamEntry.parse_raw)
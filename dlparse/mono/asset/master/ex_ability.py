@@ -78,9 +78,12 @@ class ExAbilityAsset(MasterAssetBase[ExAbilityEntry]):
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(ExAbilityParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            ExAbilityParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
 
 class ExAbilityParser(MasterParserBase[ExAbilityEntry]):
@@ -88,6 +91,4 @@ class ExAbilityParser(MasterParserBase[ExAbilityEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[int, ExAbilityEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: ExAbilityEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, ExAbilityEntry.parse_raw)
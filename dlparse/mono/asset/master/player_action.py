@@ -76,9 +76,12 @@ class PlayerActionInfoAsset(MasterAssetBase[PlayerActionInfoEntry]):
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(PlayerActionInfoParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            PlayerActionInfoParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
     def get_action_id_chain(self, parent_action_id: int) -> list[int]:
         """Get action ID chain starting from ``parent_action_id``."""
@@ -98,6 +101,4 @@ class PlayerActionInfoParser(MasterParserBase[PlayerActionInfoEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[int, PlayerActionInfoEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: PlayerActionInfoEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, PlayerActionInfoEntry.parse_raw)
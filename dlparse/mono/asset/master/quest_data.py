@@ -51,9 +51,12 @@ class QuestDataAsset(MasterAssetBase[QuestDataEntry]):
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(QuestDataParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            QuestDataParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
 
 class QuestDataParser(MasterParserBase[QuestDataEntry]):
@@ -61,6 +64,4 @@ class QuestDataParser(MasterParserBase[QuestDataEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[int, QuestDataEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: QuestDataEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, QuestDataEntry.parse_raw)
@@ -29,9 +29,12 @@ class QuestStoryAsset(GroupedStoryAssetBase[QuestStoryEntry]):
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(QuestStoryParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            QuestStoryParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
 
 class QuestStoryParser(MasterParserBase[QuestStoryEntry]):
@@ -39,6 +42,4 @@ class QuestStoryParser(MasterParserBase[QuestStoryEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[MasterAssetIdType, QuestStoryEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: QuestStoryEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, QuestStoryEntry.parse_raw)
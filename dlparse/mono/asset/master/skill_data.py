@@ -14,7 +14,7 @@ __all__ = ("SkillDataEntry", "SkillDataAsset", "CHARA_SKILL_MAX_LEVEL")
 CHARA_SKILL_MAX_LEVEL = 4
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillDataEntry(MasterEntryBase):
     """Single entry of a skill data."""
 
@@ -305,9 +305,12 @@ class SkillDataAsset(MasterAssetBase[SkillDataEntry]):
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(SkillDataParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            SkillDataParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
 
 class SkillDataParser(MasterParserBase[SkillDataEntry]):
@@ -315,6 +318,4 @@ class SkillDataParser(MasterParserBase[SkillDataEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[int, SkillDataEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: SkillDataEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, SkillDataEntry.parse_raw)
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Optional, TextIO, Union
 
 from dlparse.enums import SkillChainCondition
-from dlparse.mono.asset.base import MasterAssetBase, MasterEntryBase, MasterParserBase
+from dlparse.mono.asset.base import MasterAssetBase, MasterAssetIndex, MasterEntryBase, MasterParserBase
 
 __all__ = ("SkillChainEntry", "SkillChainAsset")
 
@@ -29,15 +29,22 @@ class SkillChainAsset(MasterAssetBase[SkillChainEntry]):
 
     asset_file_name = "SkillChainData.json"
 
+    indexes = (
+        MasterAssetIndex("group_id", ("group_id",)),
+    )
+
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(SkillChainParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            SkillChainParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
     def get_data_by_group_id(self, group_id: int) -> list[SkillChainEntry]:
         """Get a list of skill chain data by its ``group_id``."""
-        return self.filter(lambda entry: entry.group_id == group_id)
+        return self.filter(group_id=group_id)
 
 
 class SkillChainParser(MasterParserBase[SkillChainEntry]):
@@ -45,6 +52,4 @@ class SkillChainParser(MasterParserBase[SkillChainEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[int, SkillChainEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: SkillChainEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, SkillChainEntry.parse_raw)
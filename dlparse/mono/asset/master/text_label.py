@@ -1,6 +1,6 @@
 """Classes for handling the text label asset."""
 from dataclasses import dataclass
-from typing import TextIO, cast
+from typing import Optional, TextIO, cast
 
 from dlparse.mono.asset.base import (
     CustomParserBase, EntryDataType, MasterAssetIdType, MasterEntryBase, MasterParserBase,
@@ -27,9 +27,7 @@ class MasterTextParser(MasterParserBase[TextEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[MasterAssetIdType, TextEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: TextEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, TextEntry.parse_raw)
 
 
 class CustomTextParser(CustomParserBase[TextEntry]):
@@ -47,5 +45,7 @@ class TextAssetMultilingual(MultilingualAssetBase[TextEntry]):
 
     # pylint: disable=too-few-public-methods
 
-    def __init__(self, asset_dir: str):
-        super().__init__(MasterTextParser, asset_dir, "TextLabel", include_partial_support=True)
+    def __init__(self, asset_dir: str, snapshot_dir: Optional[str] = None):
+        super().__init__(
+            MasterTextParser, asset_dir, "TextLabel", include_partial_support=True, snapshot_dir=snapshot_dir
+        )
@@ -1,10 +1,10 @@
 """Classes for handling the unit story asset."""
-from collections import defaultdict
 from dataclasses import dataclass
 from typing import Optional, TextIO, cast
 
 from dlparse.mono.asset.base import (
-    EntryDataType, GroupedStoryAssetBase, GroupedStoryEntryBase, MasterAssetIdType, MasterEntryBase, MasterParserBase,
+    EntryDataType, GroupedStoryAssetBase, GroupedStoryEntryBase, MasterAssetIdType, MasterAssetIndex, MasterEntryBase,
+    MasterParserBase,
 )
 from dlparse.mono.asset.extension import VariationIdentifier, VariedEntry
 
@@ -31,22 +31,23 @@ class UnitStoryAsset(GroupedStoryAssetBase[UnitStoryEntry]):
 
     asset_file_name = "UnitStory.json"
 
-    def _init_lookup_by_var(self):
-        self._lookup_by_var: dict[VariationIdentifier, list[UnitStoryEntry]] = defaultdict(list)
-        for entry in self.data.values():
-            self._lookup_by_var[entry.var_identifier].append(entry)
+    indexes = GroupedStoryAssetBase.indexes + (
+        # Key is the same as `var_identifier` of the entry
+        MasterAssetIndex("variation_identifier", ("base_id", "variation_id")),
+    )
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(UnitStoryParser, file_location, asset_dir=asset_dir, file_like=file_like)
-
-        self._init_lookup_by_var()
+        super().__init__(
+            UnitStoryParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
     def get_data_by_variation_identifier(self, var_identifier: VariationIdentifier) -> Optional[list[UnitStoryEntry]]:
         """Get the story entries that has ``var_identifier`` as its variation identifier."""
-        return self._lookup_by_var.get(var_identifier)
+        return self.get_by_index("variation_identifier", var_identifier)
 
 
 class UnitStoryParser(MasterParserBase[UnitStoryEntry]):
@@ -54,6 +55,4 @@ class UnitStoryParser(MasterParserBase[UnitStoryEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[MasterAssetIdType, UnitStoryEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: UnitStoryEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, UnitStoryEntry.parse_raw)
@@ -29,9 +29,12 @@ class WeaponTypeAsset(MasterAssetBase[WeaponTypeEntry]):
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(WeaponTypeParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            WeaponTypeParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
     def get_data_by_weapon(self, weapon: Weapon) -> WeaponTypeEntry:
         """Get the weapon type data of ``weapon``."""
@@ -43,6 +46,4 @@ class WeaponTypeParser(MasterParserBase[WeaponTypeEntry]):
 
     @classmethod
     def parse_file(cls, file_like: TextIO) -> dict[int, WeaponTypeEntry]:
-        entries = cls.get_entries_dict(file_like)
-
-        return {key: WeaponTypeEntry.parse_raw(value) for key, value in entries.items()}
+        return cls.parse_entries(file_like, WeaponTypeEntry.parse_raw)
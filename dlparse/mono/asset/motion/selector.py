@@ -1,6 +1,6 @@
 """Base classes for a motion selector."""
 from abc import ABC
-from typing import Generic, Type, TypeVar
+from typing import Generic, Optional, Type, TypeVar
 
 from dlparse.mono.asset.base import get_file_like, get_file_path, parse_motion_data
 from dlparse.mono.asset.extension import AnimatorController
@@ -16,8 +16,9 @@ class MotionSelectorBase(Generic[KT, CT], ABC):
     A selector selects a the controller to be used.
 
     A difference between ``MotionSelector`` and ``MotionLoader`` is that
-    ``MotionSelector`` preloads all controllers during initialization, while
-    ``MotionLoader`` loads the controllers on-demand.
+    ``MotionSelector`` selects from a fixed set of controllers known during initialization, while
+    ``MotionLoader`` derives the controller to load from the unit data.
+    Both of them load the controllers on-demand.
     """
 
     # pylint: disable=too-few-public-methods
@@ -28,15 +29,35 @@ class MotionSelectorBase(Generic[KT, CT], ABC):
 
         The key of ``motion_map`` will be used for selecting the motion controller;
         the value of ``motion_map`` is the file path of the motion controller excluding ``motion_dir``.
+
+        The controllers are not loaded until they are requested by ``get_controller()``.
         """
+        self._controller_cls: Type[CT] = controller_cls
+        self._motion_dir: str = motion_dir
+        self._motion_map: dict[KT, str] = motion_map
+
         self._motion_controller: dict[KT, CT] = {}
 
-        for motion_key, motion_file_path in motion_map.items():
-            file_path = get_file_path(motion_file_path, asset_dir=motion_dir)
-            file_like = get_file_like(file_path)
+    @property
+    def loaded_keys(self) -> list[KT]:
+        """Get the keys of the controllers loaded."""
+        return list(self._motion_controller)
+
+    def get_controller(self, key: KT) -> Optional[CT]:
+        """
+        Get the controller mapped to ``key``. Returns ``None`` if not found.
+
+        The controller is loaded on the first request of ``key``.
+        """
+        if (controller := self._motion_controller.get(key)) is not None:
+            return controller
+
+        if key not in self._motion_map:
+            return None
+
+        file_path = get_file_path(self._motion_map[key], asset_dir=self._motion_dir)
+        file_like = get_file_like(file_path)
 
-            self._motion_controller[motion_key] = controller_cls.parse_raw(parse_motion_data(file_like))
+        controller = self._motion_controller[key] = self._controller_cls.parse_raw(parse_motion_data(file_like))
 
-    def get_controller(self, key: KT) -> CT:
-        """Get the controller mapped to ``key``. Returns ``None`` if not found."""
-        return self._motion_controller.get(key)
+        return controller
@@ -57,9 +57,12 @@ class ActionPartsListAsset(MasterAssetBase[ActionPartsListEntry]):
 
     def __init__(
             self, file_location: Optional[str] = None, /,
-            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None
+            asset_dir: Optional[str] = None, file_like: Optional[TextIO] = None, snapshot_dir: Optional[str] = None
     ):
-        super().__init__(ActionPartsListParser, file_location, asset_dir=asset_dir, file_like=file_like)
+        super().__init__(
+            ActionPartsListParser, file_location,
+            asset_dir=asset_dir, file_like=file_like, snapshot_dir=snapshot_dir
+        )
 
 
 class ActionPartsListParser(MasterParserBase[ActionPartsListEntry]):
@@ -1,6 +1,6 @@
 """Prefab file class for getting the components."""
 import re
-from typing import Optional, TextIO, Type, TypeVar
+from typing import Iterable, Optional, TextIO, Type, TypeVar
 
 from dlparse.mono.asset.base import (
     ActionAssetBase, ActionComponentBase, ActionComponentHasHitLabels, ActionParserBase,
@@ -25,6 +25,12 @@ __all__ = ("PlayerActionPrefab",)
 
 T = TypeVar("T", bound=ActionComponentBase)
 
+HitActions = tuple[tuple[str, ActionComponentHasHitLabels], ...]
+
+
+def _compile_omitted_label_regex(omitted_label_starts: Iterable[str]) -> re.Pattern:
+    return re.compile(f"(?!{'|'.join(omitted_label_starts)})")
+
 
 class PlayerActionParser(ActionParserBase):
     """Player action prefab file parser."""
@@ -78,16 +84,33 @@ class PlayerActionPrefab(ActionAssetBase):
     }
     """List of label starting keywords to be omitted."""
 
-    def __init__(self, action_id: int, file_location: str):
-        super().__init__(PlayerActionParser, file_location)
+    _omitted_label_regex: re.Pattern = _compile_omitted_label_regex(omitted_label_starts)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Compiled for each class, so the subclasses can override ``omitted_label_starts``
+        cls._omitted_label_regex = _compile_omitted_label_regex(cls.omitted_label_starts)
+
+    def __init__(self, action_id: int, file_location: str, /, snapshot_dir: Optional[str] = None):
+        """
+        Initializes the prefab of ``action_id`` at ``file_location``.
+
+        If ``snapshot_dir`` is given, the parsed components are loaded from or stored to the snapshot
+        in ``snapshot_dir``. The snapshot only contains the recognized components,
+        and it is invalidated if the prefab file changes.
+        """
+        super().__init__(PlayerActionParser, file_location, snapshot_dir=snapshot_dir)
 
         # Properties
         self.action_id = action_id
 
         # Pre-categorize components for faster access
-        self._damaging_hits: list[ActionComponentHasHitLabels] = [
-            component for component in self if isinstance(component, ActionComponentHasHitLabels)
-        ]
+        # - Hitting components are sorted by its starting time
+        self._damaging_hits: list[ActionComponentHasHitLabels] = sorted(
+            (component for component in self if isinstance(component, ActionComponentHasHitLabels)),
+            key=lambda component: component.time_start
+        )
         self._cancel_actions: list[ActionActiveCancel] = [
             component for component in self if isinstance(component, ActionActiveCancel)
         ]
@@ -99,19 +122,13 @@ class PlayerActionPrefab(ActionAssetBase):
             component for component in self if isinstance(component, ActionMotion)
         ]
 
-    def get_hit_actions(self, skill_lv: int = None) -> list[tuple[str, ActionComponentHasHitLabels]]:
-        """
-        Get a list of effective hitting actions in tuple ``(label name, action component)``.
-
-        Specify ``skill_lv`` as ``None``, to get un-leveled hit actions.
+        # Hit actions of each skill level, built on the first request of the level
+        self._hit_actions: dict[Optional[int], HitActions] = {}  # K = skill level
 
-        .. note::
-            Each component contains hit label(s) which each of them corresponds to a hit attribute.
-        """
+    def _make_hit_actions(self, skill_lv: Optional[int]) -> HitActions:
         hit_actions: list[tuple[str, ActionComponentHasHitLabels]] = []
 
-        # Sort hitting components by its starting time
-        for action_hit in sorted(self._damaging_hits, key=lambda component: component.time_start):
+        for action_hit in self._damaging_hits:
             for hit_label in filter(self.is_effective_label, action_hit.hit_labels):  # Effective labels only
                 hit_label_data = get_hit_label_data(hit_label)
 
@@ -124,7 +141,23 @@ class PlayerActionPrefab(ActionAssetBase):
                         action_hit
                     ))
 
-        return hit_actions
+        return tuple(hit_actions)
+
+    def get_hit_actions(self, skill_lv: int = None) -> list[tuple[str, ActionComponentHasHitLabels]]:
+        """
+        Get a list of effective hitting actions in tuple ``(label name, action component)``.
+
+        Specify ``skill_lv`` as ``None``, to get un-leveled hit actions.
+
+        The hit actions of each level are computed once. A new list of them is returned on each call.
+
+        .. note::
+            Each component contains hit label(s) which each of them corresponds to a hit attribute.
+        """
+        if (hit_actions := self._hit_actions.get(skill_lv)) is None:
+            hit_actions = self._hit_actions[skill_lv] = self._make_hit_actions(skill_lv)
+
+        return list(hit_actions)
 
     @property
     def component_cancel_to_next(self) -> Optional[ActionTerminateOthers]:
@@ -148,4 +181,4 @@ class PlayerActionPrefab(ActionAssetBase):
     @classmethod
     def is_effective_label(cls, label: str) -> bool:
         """Check if the label is an effective hitting label."""
-        return bool(re.match(f"(?!{'|'.join(cls.omitted_label_starts)})", label))
+        return bool(cls._omitted_label_regex.match(label))
@@ -1,8 +1,8 @@
 """Base class for story asset parser."""
-import json
 from typing import TextIO
 
 from dlparse.mono.asset.base import ParserBase
+from dlparse.utils import load_json
 
 __all__ = ("StoryAssetParser",)
 
@@ -16,7 +16,7 @@ class StoryAssetParser(ParserBase[StoryAssetDataMapping]):
 
     @staticmethod
     def parse_file(file_like: TextIO) -> StoryAssetDataMapping:
-        data = json.load(file_like)
+        data = load_json(file_like)
         data = data["functions"][0]["variables"]
 
         keys = data["entriesKey"]
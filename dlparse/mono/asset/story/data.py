@@ -1,9 +1,9 @@
 """Class representing a story data entity."""
-import json
 from typing import Iterator, TextIO, TypeVar
 
 from dlparse.enums import Language
 from dlparse.mono.asset.base import AssetBase, ParserBase
+from dlparse.utils import load_json
 from .command import StoryCommandBase
 from .image import StoryImageAsset
 from .name import StoryNameAsset
@@ -65,7 +65,7 @@ class StoryDataParser(ParserBase[list[T]]):
 
     @staticmethod
     def parse_file(file_like: TextIO) -> list[T]:
-        data = json.load(file_like)
+        data = load_json(file_like)
         raw_commands = data["functions"][0]["commandList"]
 
         return [parse_raw_command(raw_command) for raw_command in raw_commands]
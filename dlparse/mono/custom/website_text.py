@@ -31,10 +31,10 @@ class WebsiteTextAsset(MultilingualAssetBase[WebsiteTextEntry]):
 
     def get_all_ids(self, lang_code: str) -> list[str]:
         """Get all text entry IDs in ``lang_code``. If ``lang_code`` is unavailable, returns empty list."""
-        if lang_code not in self._assets:
+        if lang_code not in self.available_languages:
             return []
 
-        return list(self._assets[lang_code].keys())
+        return list(self._get_lang_asset(lang_code).keys())
 
 
 class WebsiteTextParser(CustomParserBase[WebsiteTextEntry]):
@@ -1,4 +1,6 @@
 """Classes for loading some file collections."""
-from .action import ActionFileLoader
+from .action import ActionFileLoader, PrefabPreloadFailure, PrefabPreloadResult
+from .action_graph import ActionEdge, ActionGraph, get_next_combo_action_id
 from .motion import *  # noqa
+from .skill_index import SkillUnitIndex, get_sources_fingerprint
 from .story import StoryLoader
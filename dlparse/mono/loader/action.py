@@ -1,11 +1,62 @@
 """Classes for managing the action files."""
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional
 
 from dlparse.errors import ActionDataNotFoundError
 from dlparse.mono.asset import ActionPartsListAsset, PlayerActionPrefab
-from dlparse.utils import is_url
+from dlparse.utils import LRUCache, get_deep_size, is_url
 
-__all__ = ("ActionFileLoader",)
+__all__ = ("ActionFileLoader", "PrefabPreloadFailure", "PrefabPreloadResult")
+
+PREFAB_CACHE_MAX_ENTRIES = 4096  # Default count of the parsed prefabs to be cached
+
+
+@dataclass(frozen=True)
+class PrefabPreloadFailure:
+    """A prefab file failed to be parsed during the preload."""
+
+    action_id: int
+    file_path: str
+    error: str
+
+
+@dataclass
+class PrefabPreloadResult:
+    """Result of preloading the prefabs."""
+
+    load_time: dict[int, float] = field(default_factory=dict)  # K = action ID, V = seconds spent to parse
+    failures: list[PrefabPreloadFailure] = field(default_factory=list)
+
+    @property
+    def failed_file_paths(self) -> list[str]:
+        """Get the paths of the files failed to be parsed."""
+        return [failure.file_path for failure in self.failures]
+
+
+def _load_prefab_timed(
+        action_id: int, file_path: str, snapshot_dir: Optional[str],
+        fn_get_size: Optional[Callable[[PlayerActionPrefab], int]]
+) -> tuple[Optional[PlayerActionPrefab], Optional[int], float, Optional[str]]:
+    """
+    Load the prefab of ``action_id`` at ``file_path``, using the snapshot in ``snapshot_dir`` if given.
+
+    Returns the loaded prefab (``None`` if failed), its size measured by ``fn_get_size`` (``None`` if not given),
+    the time spent in seconds, and the error message if failed.
+    """
+    start = time.perf_counter()
+
+    try:
+        prefab = PlayerActionPrefab(action_id, file_path, snapshot_dir=snapshot_dir)
+    except Exception as ex:  # pylint: disable=broad-except
+        # Any error is reported as a failure instead, so a single bad file does not abort the whole preload
+        return None, None, time.perf_counter() - start, f"{ex.__class__.__name__}: {ex}"
+
+    size = fn_get_size(prefab) if fn_get_size else None
+
+    return prefab, size, time.perf_counter() - start, None
 
 
 class ActionFileLoader:
@@ -22,11 +73,38 @@ class ActionFileLoader:
 
             self._path_index[parts_entry.id] = path
 
-    def __init__(self, asset_parts_list: ActionPartsListAsset, file_root_path: str):
+    def __init__(
+            self, asset_parts_list: ActionPartsListAsset, file_root_path: str, /,
+            cache: Optional[LRUCache[int, PlayerActionPrefab]] = None, snapshot_dir: Optional[str] = None
+    ):
+        """
+        Initializes an action file loader.
+
+        Parsed prefabs are cached in ``cache``.
+        If ``cache`` is not given, a cache bounded by ``PREFAB_CACHE_MAX_ENTRIES`` is used.
+        The prefabs grow after being cached, so the default cache is bounded by the count instead of the size.
+
+        If ``snapshot_dir`` is given, the parsed components of the prefabs on the disk are persisted
+        as the snapshots in ``snapshot_dir``, so the prefabs evicted from ``cache`` or loaded by another process
+        are constructed without parsing the files again.
+        """
         self._path_index: dict[int, str] = {}  # K = action ID; V = file path
         self._init_path_index(asset_parts_list, file_root_path)
 
-        self._prefab_cache: dict[int, PlayerActionPrefab] = {}
+        self._snapshot_dir: Optional[str] = snapshot_dir
+        self._prefab_cache: LRUCache[int, PlayerActionPrefab] = (
+            cache if cache is not None else LRUCache(max_entries=PREFAB_CACHE_MAX_ENTRIES)
+        )
+
+    @property
+    def file_paths(self) -> list[str]:
+        """Get the file paths of all known prefabs."""
+        return list(self._path_index.values())
+
+    @property
+    def prefab_cache(self) -> LRUCache[int, PlayerActionPrefab]:
+        """Cache of the parsed prefabs."""
+        return self._prefab_cache
 
     def get_file_path(self, action_id: int) -> str:
         """
@@ -51,10 +129,59 @@ class ActionFileLoader:
         """
         file_path = self.get_file_path(action_id)
 
-        if action_id not in self._prefab_cache:
-            self._prefab_cache[action_id] = PlayerActionPrefab(action_id, file_path)
+        if (prefab := self._prefab_cache.get(action_id)) is None:
+            prefab = PlayerActionPrefab(action_id, file_path, snapshot_dir=self._snapshot_dir)
+            self._prefab_cache.put(action_id, prefab)
+
+        return prefab
+
+    def preload(self, action_ids: Optional[Iterable[int]] = None, /, workers: int = 1) -> PrefabPreloadResult:
+        """
+        Parse the prefabs of ``action_ids`` and cache them. Parse all known prefabs if ``action_ids`` is not given.
+
+        If ``workers`` is greater than 1, the prefabs are parsed by a process pool with ``workers`` processes.
+
+        Prefabs already cached are skipped. Files failed to be parsed are reported in the return
+        instead of raising an error, so that the later ``get_prefab()`` raises the error on demand.
+
+        Preloading more prefabs than the cache can hold evicts the earlier preloaded ones.
+        Use an unbounded cache to preload all prefabs.
+
+        If the cache measures the sizes by ``get_deep_size()``, the sizes are measured by the workers as well.
+
+        :raises ActionDataNotFoundError: if any of `action_ids` does not have a corresponding file
+        """
+        action_ids = list(dict.fromkeys(action_ids if action_ids is not None else self._path_index))
+        action_ids = [action_id for action_id in action_ids if action_id not in self._prefab_cache]
+        file_paths = [self.get_file_path(action_id) for action_id in action_ids]
+        snapshot_dirs = [self._snapshot_dir] * len(action_ids)
+
+        if workers > 1 and len(action_ids) > 1:
+            # Custom size function may not be picklable, so the prefabs are measured in this process for it
+            fn_get_size = get_deep_size if self._prefab_cache.fn_get_size is get_deep_size else None
+            fn_get_sizes = [fn_get_size] * len(action_ids)
+
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # Larger chunks reduce the inter-process communication overhead of the small files
+                chunk_size = max(1, len(action_ids) // (workers * 4))
+                results = list(executor.map(
+                    _load_prefab_timed, action_ids, file_paths, snapshot_dirs, fn_get_sizes, chunksize=chunk_size
+                ))
+        else:
+            results = list(map(_load_prefab_timed, action_ids, file_paths, snapshot_dirs, [None] * len(action_ids)))
+
+        preload_result = PrefabPreloadResult()
+
+        for action_id, file_path, (prefab, size, load_time, error) in zip(action_ids, file_paths, results):
+            preload_result.load_time[action_id] = load_time
+
+            if error:
+                preload_result.failures.append(PrefabPreloadFailure(action_id, file_path, error))
+                continue
+
+            self._prefab_cache.put(action_id, prefab, size=size)
 
-        return self._prefab_cache[action_id]
+        return preload_result
 
     @staticmethod
     def to_action_file_name(action_id: int) -> str:
@@ -0,0 +1,247 @@
+"""Graph of the transitions between the player actions."""
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from dlparse.enums import ActionEdgeType, SkillCancelAction, SkillCancelType
+from dlparse.errors import ActionDataNotFoundError
+from dlparse.mono.asset import PlayerActionInfoAsset, PlayerActionPrefab
+from .action import ActionFileLoader
+
+__all__ = ("ActionEdge", "ActionGraph", "get_next_combo_action_id")
+
+# - Faris (10950102) root normal attack action (901000) have action cancel component goes to `901201`.
+#   However, such action does not exist. (Should be `901001` instead).
+# --------------------
+# No manual fix because it won't reflect the actual game playing data,
+# despite the action may exist, such as `901001` as mentioned above.
+MISSING_ACTION_IDS: set[int] = {901201, 1016141}
+
+# Dirty fix for forcing the next action ID
+# This is needed for Basileus (10750304) because
+# it branches to both closed and ranged variant of auto
+MANUAL_NEXT_ACTION_ID: dict[int, Optional[int]] = {
+    701400: 701401,
+    701401: 701402,
+    701402: 701403,
+    701403: 701404,
+    701404: None,
+}
+
+EdgeTypes = frozenset[ActionEdgeType]
+
+_ALL_EDGE_TYPES: EdgeTypes = frozenset(ActionEdgeType)
+
+
+def get_next_combo_action_id(prefab: PlayerActionPrefab) -> Optional[int]:
+    """Get the action ID of the next combo of a normal attack or a force strike. Returns ``None`` if not available."""
+    for cancel_action in prefab.cancel_actions:
+        if cancel_action.cancel_type != SkillCancelType.NONE:
+            # Next combo action type should be `NONE`; things like `FS` should be excluded
+            continue
+
+        if SkillCancelAction(cancel_action.action_id).is_common_action:
+            # Excludes common actions (such as roll dodge)
+            # - legacy actions does not have cancel type assigned
+            continue
+
+        if not cancel_action.action_id:
+            continue  # Action ID = 0 means any action, definitely not the next combo
+
+        if cancel_action.time_start == 0:
+            continue  # Next combo should not be able to change immediately
+
+        if cancel_action.action_id in MISSING_ACTION_IDS:
+            continue  # Check the notes for `MISSING_ACTION_IDS`
+
+        if prefab.action_id in MANUAL_NEXT_ACTION_ID:
+            return MANUAL_NEXT_ACTION_ID[prefab.action_id]
+
+        return cancel_action.action_id
+
+    return None
+
+
+@dataclass(frozen=True)
+class ActionEdge:
+    """A transition from the action ``source`` to the action ``target``."""
+
+    source: int
+    target: int
+    edge_type: ActionEdgeType
+
+
+class ActionGraph:
+    """
+    Graph of the transitions between the player actions.
+
+    Nodes are the action IDs. Check :class:`ActionEdgeType` for the types of the edges.
+
+    The edges of an action are determined on the first query involving it, or by ``build()`` beforehand.
+    The edges requiring the prefab load the prefab at that time.
+    Actions without the prefab or the action info do not have the corresponding edges.
+
+    The successors, the reachable actions and the chains are cached once computed,
+    so repeated queries are dictionary lookups.
+    """
+
+    def __init__(self, asset_action_info: PlayerActionInfoAsset, loader_action: ActionFileLoader):
+        self._asset_action_info = asset_action_info
+        self._loader_action = loader_action
+
+        # K = action ID, edge type; V = target action IDs
+        self._targets: dict[tuple[int, ActionEdgeType], tuple[int, ...]] = {}
+        # K = action ID, edge types; V = reachable action IDs
+        self._reachable: dict[tuple[int, EdgeTypes], frozenset[int]] = {}
+        # K = action ID, edge type; V = action ID chain
+        self._chains: dict[tuple[int, ActionEdgeType], tuple[int, ...]] = {}
+
+    @staticmethod
+    def _to_edge_types(edge_types: Optional[Iterable[ActionEdgeType]]) -> EdgeTypes:
+        return _ALL_EDGE_TYPES if edge_types is None else frozenset(edge_types)
+
+    def _get_prefab(self, action_id: int) -> Optional[PlayerActionPrefab]:
+        try:
+            return self._loader_action.get_prefab(action_id)
+        except ActionDataNotFoundError:
+            return None
+
+    def _make_targets(self, action_id: int, edge_type: ActionEdgeType) -> tuple[int, ...]:
+        action_info = self._asset_action_info.get_data_by_id(action_id)
+
+        if edge_type == ActionEdgeType.NEXT_ACTION:
+            return (action_info.next_action_id,) if action_info and action_info.next_action_id else ()
+
+        if not (prefab := self._get_prefab(action_id)):
+            return ()
+
+        if edge_type == ActionEdgeType.CANCEL_TO_NEXT:
+            if prefab.component_cancel_to_next and action_info and action_info.next_action_id:
+                return (action_info.next_action_id,)
+
+            return ()
+
+        if edge_type == ActionEdgeType.ACTIVE_CANCEL:
+            return tuple(dict.fromkeys(
+                cancel_action.action_id for cancel_action in prefab.cancel_actions
+                if cancel_action.has_specific_cancel_action
+            ))
+
+        if edge_type == ActionEdgeType.COMBO_NEXT:
+            next_action_id = get_next_combo_action_id(prefab)
+
+            return (next_action_id,) if next_action_id else ()
+
+        raise ValueError(f"Unhandled action edge type: {edge_type}")
+
+    def get_targets(self, action_id: int, edge_type: ActionEdgeType) -> tuple[int, ...]:
+        """Get the actions transitioned from ``action_id`` by the edges of ``edge_type``."""
+        key = (action_id, edge_type)
+
+        if (targets := self._targets.get(key)) is None:
+            targets = self._targets[key] = self._make_targets(action_id, edge_type)
+
+        return targets
+
+    def build(self, action_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        Compute all types of edges of ``action_ids`` and the actions reachable from them, then return the count
+        of the actions whose edges are computed. All player actions in the action info are used if not given.
+
+        The later queries on these actions do not load any prefab.
+        Call ``preload()`` of the action file loader beforehand to parse the prefabs concurrently.
+        """
+        pending: list[int] = list(action_ids if action_ids is not None else self._asset_action_info.all_ids)
+        built: set[int] = set()
+
+        while pending:
+            if (action_id := pending.pop()) in built:
+                continue
+
+            built.add(action_id)
+
+            for edge_type in ActionEdgeType:
+                pending.extend(self.get_targets(action_id, edge_type))
+
+        return len(built)
+
+    def get_edges(self, action_id: int, edge_types: Optional[Iterable[ActionEdgeType]] = None) -> list[ActionEdge]:
+        """Get the edges from ``action_id``. If ``edge_types`` is not given, all types of edges are returned."""
+        return [
+            ActionEdge(action_id, target, edge_type)
+            for edge_type in ActionEdgeType if edge_type in self._to_edge_types(edge_types)
+            for target in self.get_targets(action_id, edge_type)
+        ]
+
+    def get_successors(self, action_id: int, edge_types: Optional[Iterable[ActionEdgeType]] = None) -> set[int]:
+        """Get the actions directly transitioned from ``action_id`` via any of ``edge_types``."""
+        return {edge.target for edge in self.get_edges(action_id, edge_types)}
+
+    def get_reachable(
+            self, action_id: int, edge_types: Optional[Iterable[ActionEdgeType]] = None
+    ) -> frozenset[int]:
+        """
+        Get the actions reachable from ``action_id`` via any of ``edge_types`` (transitive closure).
+
+        ``action_id`` itself is included only if it is in a cycle.
+        """
+        edge_types = self._to_edge_types(edge_types)
+        key = (action_id, edge_types)
+
+        if (reachable := self._reachable.get(key)) is not None:
+            return reachable
+
+        visited: set[int] = set()
+        pending: list[int] = [action_id]
+
+        while pending:
+            for successor in self.get_successors(pending.pop(), edge_types):
+                if successor in visited:
+                    continue
+
+                visited.add(successor)
+                pending.append(successor)
+
+        reachable = self._reachable[key] = frozenset(visited)
+
+        return reachable
+
+    def is_reachable(
+            self, source: int, target: int, edge_types: Optional[Iterable[ActionEdgeType]] = None
+    ) -> bool:
+        """Check if ``target`` is reachable from ``source`` via any of ``edge_types``."""
+        return target in self.get_reachable(source, edge_types)
+
+    def is_in_cycle(self, action_id: int, edge_types: Optional[Iterable[ActionEdgeType]] = None) -> bool:
+        """Check if ``action_id`` transitions back to itself via any of ``edge_types``."""
+        return self.is_reachable(action_id, action_id, edge_types)
+
+    def has_cycle(self, action_id: int, edge_types: Optional[Iterable[ActionEdgeType]] = None) -> bool:
+        """Check if any cycle is reachable from ``action_id`` via any of ``edge_types``."""
+        return any(
+            self.is_in_cycle(reachable_id, edge_types)
+            for reachable_id in self.get_reachable(action_id, edge_types) | {action_id}
+        )
+
+    def get_chain(self, action_id: int, edge_type: ActionEdgeType) -> tuple[int, ...]:
+        """
+        Get the action ID chain starting from ``action_id`` following the first edge of ``edge_type``.
+
+        The chain includes ``action_id`` itself. The chain stops before any action visited again.
+        """
+        key = (action_id, edge_type)
+
+        if (chain := self._chains.get(key)) is not None:
+            return chain
+
+        chain_list: list[int] = []
+        current_id: Optional[int] = action_id
+
+        while current_id and current_id not in chain_list:
+            chain_list.append(current_id)
+
+            targets = self.get_targets(current_id, edge_type)
+            current_id = targets[0] if targets else None
+
+        chain = self._chains[key] = tuple(chain_list)
+
+        return chain
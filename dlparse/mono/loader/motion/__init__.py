@@ -2,3 +2,4 @@
 from .base import MotionLoaderBase
 from .character import CharacterMotionLoader
 from .dragon import DragonMotionLoader
+from .stop_time import MotionStopTimeIndex
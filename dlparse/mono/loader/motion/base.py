@@ -3,10 +3,14 @@ from abc import ABC, abstractmethod
 from typing import Callable, Generic, Optional, TypeVar
 
 from dlparse.errors import MotionDataNotFoundError
-from dlparse.mono.asset.base import AnimationControllerBase
+from dlparse.mono.asset.base import AnimationControllerBase, get_file_path
+from dlparse.utils import LRUCache
+from .stop_time import MotionStopTimeIndex
 
 __all__ = ("MotionLoaderBase",)
 
+MOTION_CACHE_MAX_ENTRIES = 512  # Default count of the loaded controllers to be cached
+
 CT = TypeVar("CT", bound=AnimationControllerBase)
 ET = TypeVar("ET")
 
@@ -16,13 +20,38 @@ class MotionLoaderBase(Generic[CT, ET], ABC):
     Base class of a motion loader.
 
     A difference between ``MotionSelector`` and ``MotionLoader`` is that
-    ``MotionSelector`` preloads all controllers during initialization, while
-    ``MotionLoader`` loads the controllers on-demand.
+    ``MotionSelector`` selects from a fixed set of controllers known during initialization, while
+    ``MotionLoader`` derives the controller to load from the unit data.
+    Both of them load the controllers on-demand.
     """
 
-    def __init__(self, motion_root_dir: str):
+    def __init__(
+            self, motion_root_dir: str, /, cache: Optional[LRUCache[str, Optional[CT]]] = None,
+            stop_time_index: Optional[MotionStopTimeIndex] = None
+    ):
+        """
+        Initializes a motion loader.
+
+        Loaded controllers are cached in ``cache``. Controllers not found are cached as ``None``.
+        If ``cache`` is not given, a cache bounded by ``MOTION_CACHE_MAX_ENTRIES`` is used.
+
+        If ``stop_time_index`` is given, the motion stop times in it are returned without loading any controller.
+        Motions not in the index fall back to the controllers.
+        """
         self._motion_root: str = motion_root_dir
-        self._motion_cache: dict[str, Optional[CT]] = {}  # K = name, V = controller
+        self._stop_time_index: Optional[MotionStopTimeIndex] = stop_time_index
+        self._motion_cache: LRUCache[str, Optional[CT]] = (  # K = name, V = controller
+            cache if cache is not None else LRUCache(max_entries=MOTION_CACHE_MAX_ENTRIES)
+        )
+
+    @property
+    def motion_cache(self) -> LRUCache[str, Optional[CT]]:
+        """Cache of the loaded controllers."""
+        return self._motion_cache
+
+    def get_file_path(self, entry: ET) -> str:
+        """Get the path of the motion controller file of ``entry``. The file may not exist."""
+        return get_file_path(f"{self.get_controller_name(entry)}.json", asset_dir=self._motion_root)
 
     def _get_motion_ctrl(self, entry: ET, fn_load_ctrl: Callable[[str, str], CT]) -> CT:
         """
@@ -38,17 +67,28 @@ class MotionLoaderBase(Generic[CT, ET], ABC):
         """
         name = self.get_controller_name(entry)
 
-        if name not in self._motion_cache:
+        try:
+            ctrl = self._motion_cache[name]
+        except KeyError:
             try:
-                self._motion_cache[name] = fn_load_ctrl(self._motion_root, f"{name}.json")
+                ctrl = fn_load_ctrl(self._motion_root, f"{name}.json")
             except FileNotFoundError as ex:
-                self._motion_cache[name] = None
+                self._motion_cache.put(name, None)
                 raise MotionDataNotFoundError(name) from ex
-        elif not self._motion_cache[name]:
+
+            self._motion_cache.put(name, ctrl)
+
+        if not ctrl:
             # Previously not found (recorded to cache)
             raise MotionDataNotFoundError(name)
 
-        return self._motion_cache[name]
+        return ctrl
+
+    def _get_indexed_stop_time(self, controller_name: str, motion_name: str) -> Optional[float]:
+        if self._stop_time_index is None or self._stop_time_index.is_excluded(controller_name):
+            return None
+
+        return self._stop_time_index.get_stop_time(controller_name, motion_name)
 
     @abstractmethod
     def get_motion_stop_time(self, entry: ET, motion_name: str) -> float:
@@ -1,7 +1,11 @@
 """Classes for loading the character motions."""
+from typing import Optional
+
 from dlparse.errors import MotionDataNotFoundError
 from dlparse.mono.asset import CharaDataEntry, MotionControllerChara, MotionSelectorWeapon
+from dlparse.utils import LRUCache
 from .base import MotionLoaderBase
+from .stop_time import MotionStopTimeIndex
 
 __all__ = ("CharacterMotionLoader",)
 
@@ -9,12 +13,35 @@ __all__ = ("CharacterMotionLoader",)
 class CharacterMotionLoader(MotionLoaderBase[MotionControllerChara, CharaDataEntry]):
     """Class to load the motion controller of a single character."""
 
-    def __init__(self, motion_root_dir: str):
-        super().__init__(motion_root_dir)
-        self._motion_weapon: MotionSelectorWeapon = MotionSelectorWeapon(motion_root_dir)
+    def __init__(
+            self, motion_root_dir: str, /, cache: Optional[LRUCache[str, Optional[MotionControllerChara]]] = None,
+            motion_weapon: Optional[MotionSelectorWeapon] = None, stop_time_index: Optional[MotionStopTimeIndex] = None
+    ):
+        """
+        Initializes a character motion loader.
+
+        ``motion_weapon`` is the selector of the weapon motion controllers.
+        If not given, a selector loading the controllers in ``motion_root_dir`` is used.
+        """
+        super().__init__(motion_root_dir, cache=cache, stop_time_index=stop_time_index)
+        self._motion_weapon: MotionSelectorWeapon = (
+            motion_weapon if motion_weapon is not None else MotionSelectorWeapon(motion_root_dir)
+        )
 
     def get_motion_stop_time(self, entry: CharaDataEntry, motion_name: str) -> float:
         """Get the stop time of ``motion_name`` of a character."""
+        controller_name = self.get_controller_name(entry)
+        if (
+                self._stop_time_index is not None
+                and controller_name not in self._stop_time_index
+                and not self._stop_time_index.is_excluded(controller_name)
+        ):
+            # Character without its own controller uses the weapon controller only
+            controller_name = entry.weapon.weapon_str
+
+        if (stop_time := self._get_indexed_stop_time(controller_name, motion_name)) is not None:
+            return stop_time
+
         ctrl_weapon = self._motion_weapon.get_controller(entry.weapon)
 
         try:
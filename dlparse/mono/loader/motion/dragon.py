@@ -14,6 +14,9 @@ class DragonMotionLoader(MotionLoaderBase[MotionControllerDragon, DragonDataEntr
 
         :raises MotionDataNotFoundError: if the motion data of ``dragon_data`` is not found
         """
+        if (stop_time := self._get_indexed_stop_time(self.get_controller_name(entry), motion_name)) is not None:
+            return stop_time
+
         ctrl_dragon = self._get_motion_ctrl(entry, MotionControllerDragon.load_from_file)
 
         return ctrl_dragon.get_stop_time_by_motion_name(motion_name)
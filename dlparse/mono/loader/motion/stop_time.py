@@ -0,0 +1,205 @@
+"""Index of the motion stop times."""
+import os
+from typing import Iterable, Optional, Type
+
+from dlparse.enums import Weapon
+from dlparse.errors import EnumConversionError, MotionDataNotFoundError
+from dlparse.mono.asset import MotionControllerChara, MotionControllerDragon
+from dlparse.mono.asset.base import get_file_like, get_file_path, parse_motion_data
+from dlparse.mono.asset.extension import AnimatorController
+from dlparse.mono.asset.motion.ctrl_weapon import MotionControllerWeapon
+from dlparse.utils import dump_json, load_json
+
+__all__ = ("MotionStopTimeIndex",)
+
+MOTION_STOP_TIME_INDEX_VERSION: int = 2
+"""Version of the stored index. Bump this if the stored layout changes."""
+
+_CONTROLLER_PARSE_ERRORS: tuple[Type[Exception], ...] = (KeyError, IndexError, TypeError, ValueError)
+"""Errors indicating that a file is not a controller of the expected type."""
+
+_INDEX_LOAD_ERRORS: tuple[Type[Exception], ...] = (OSError, AttributeError, KeyError, TypeError, ValueError)
+"""Errors indicating that a stored index is corrupted."""
+
+
+def _get_motion_stop_times(controller: AnimatorController) -> dict[str, float]:
+    stop_times = {}
+
+    for motion_name in controller.tos:
+        try:
+            stop_times[motion_name] = controller.get_stop_time_by_clip_id(
+                controller.get_clip_id_by_motion_name(motion_name)
+            )
+        except KeyError:
+            continue  # State or clip missing, the motion is unavailable
+
+    return stop_times
+
+
+def _get_override_stop_times(
+        weapon_controller: MotionControllerWeapon, override: MotionControllerChara, motion_names: Iterable[str]
+) -> dict[str, float]:
+    stop_times = {}
+
+    for motion_name in motion_names:
+        try:
+            stop_times[motion_name] = weapon_controller.get_stop_time_by_motion_name(motion_name, override=override)
+        except (*_CONTROLLER_PARSE_ERRORS, MotionDataNotFoundError):
+            continue  # Clip missing, the motion falls back to the controllers
+
+    return stop_times
+
+
+def _get_json_file_names(motion_dir: str) -> list[str]:
+    if not os.path.isdir(motion_dir):
+        return []
+
+    return sorted(file_name for file_name in os.listdir(motion_dir) if file_name.endswith(".json"))
+
+
+class MotionStopTimeIndex:
+    """
+    Flat index of ``(controller name, motion name)`` to the motion stop time.
+
+    The index covers the weapon controllers, the character override controllers and the dragon controllers.
+    The stop times of a character are resolved against its weapon controller,
+    so looking up a character does not need any controller.
+
+    Controllers failed to be indexed are recorded as excluded.
+    The motion loaders load the controllers for these instead of using the index.
+
+    The index reflects the motion files when it is built. Rebuild it if the motion files change.
+    """
+
+    def __init__(self, stop_times: dict[str, dict[str, float]], /, excluded: Iterable[str] = ()):
+        self._stop_times: dict[str, dict[str, float]] = stop_times  # K = controller name, V = {motion: stop time}
+        self._excluded: set[str] = set(excluded)  # Controller names
+
+    def __len__(self) -> int:
+        return len(self._stop_times)
+
+    def __contains__(self, controller_name: str) -> bool:
+        return controller_name in self._stop_times
+
+    def is_excluded(self, controller_name: str) -> bool:
+        """Check if the controller of ``controller_name`` failed to be indexed."""
+        return controller_name in self._excluded
+
+    def get_stop_time(self, controller_name: str, motion_name: str) -> Optional[float]:
+        """Get the stop time of ``motion_name`` of ``controller_name``. Returns ``None`` if not indexed."""
+        if not (stop_times := self._stop_times.get(controller_name)):
+            return None
+
+        return stop_times.get(motion_name)
+
+    @staticmethod
+    def _build_chara(chara_motion_dir: str, excluded: set[str]) -> dict[str, dict[str, float]]:
+        weapon_strs = {weapon.weapon_str for weapon in Weapon.get_all_valid_weapons()}
+
+        stop_times: dict[str, dict[str, float]] = {}
+        overrides: dict[str, tuple[str, MotionControllerChara]] = {}  # K = controller name, V = weapon str, ctrl
+        weapon_controllers: dict[str, MotionControllerWeapon] = {}  # K = weapon str
+
+        for file_name in _get_json_file_names(chara_motion_dir):
+            controller_name = file_name[:-len(".json")]
+            weapon_str = controller_name.split("_", 1)[0]
+
+            if weapon_str not in weapon_strs:
+                continue
+
+            try:
+                if controller_name == weapon_str:
+                    controller = MotionControllerWeapon.parse_raw(parse_motion_data(
+                        get_file_like(get_file_path(file_name, asset_dir=chara_motion_dir))
+                    ))
+                    weapon_controllers[weapon_str] = controller
+                    stop_times[controller_name] = _get_motion_stop_times(controller)
+                else:
+                    overrides[controller_name] = (
+                        weapon_str, MotionControllerChara.load_from_file(chara_motion_dir, file_name)
+                    )
+            except (*_CONTROLLER_PARSE_ERRORS, EnumConversionError):
+                # Possibly a controller failed to be parsed, the loaders should not use the index for it
+                excluded.add(controller_name)
+
+        for controller_name, (weapon_str, override) in overrides.items():
+            if not (weapon_controller := weapon_controllers.get(weapon_str)):
+                excluded.add(controller_name)
+                continue
+
+            stop_times[controller_name] = _get_override_stop_times(
+                weapon_controller, override, stop_times[weapon_str]
+            )
+
+        return stop_times
+
+    @staticmethod
+    def _build_dragon(dragon_motion_dir: str, excluded: set[str]) -> dict[str, dict[str, float]]:
+        stop_times: dict[str, dict[str, float]] = {}
+
+        for file_name in _get_json_file_names(dragon_motion_dir):
+            controller_name = file_name[:-len(".json")]
+
+            try:
+                controller = MotionControllerDragon.load_from_file(dragon_motion_dir, file_name)
+            except _CONTROLLER_PARSE_ERRORS:
+                excluded.add(controller_name)
+                continue
+
+            stop_times[controller_name] = _get_motion_stop_times(controller)
+
+        return stop_times
+
+    @staticmethod
+    def build(chara_motion_dir: str, dragon_motion_dir: str) -> "MotionStopTimeIndex":
+        """
+        Build the index from the motion controllers in ``chara_motion_dir`` and ``dragon_motion_dir``.
+
+        Both directories must be local directories.
+        Files failed to be parsed as the motion controllers are excluded.
+        """
+        excluded: set[str] = set()
+
+        return MotionStopTimeIndex(
+            MotionStopTimeIndex._build_chara(chara_motion_dir, excluded)
+            | MotionStopTimeIndex._build_dragon(dragon_motion_dir, excluded),
+            excluded=excluded
+        )
+
+    def save(self, file_path: str, /, fingerprint: str = "") -> None:
+        """
+        Store the index to ``file_path``.
+
+        ``fingerprint`` identifies the motion files used to build the index. Check ``get_sources_fingerprint()``.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+
+        with open(file_path, "w", encoding="utf-8") as f:
+            dump_json({
+                "version": MOTION_STOP_TIME_INDEX_VERSION,
+                "fingerprint": fingerprint,
+                "stopTimes": self._stop_times,
+                "excluded": sorted(self._excluded),
+            }, f)
+
+    @staticmethod
+    def load(file_path: str, /, fingerprint: str = "") -> Optional["MotionStopTimeIndex"]:
+        """
+        Load the index stored at ``file_path``.
+
+        Returns ``None`` if the file is missing, outdated, corrupted,
+        or ``fingerprint`` is different from the one used when the index was saved.
+        """
+        if not os.path.exists(file_path):
+            return None
+
+        try:
+            with open(file_path, encoding="utf-8") as f:
+                data = load_json(f)
+
+            if data.get("version") != MOTION_STOP_TIME_INDEX_VERSION or data.get("fingerprint") != fingerprint:
+                return None
+
+            return MotionStopTimeIndex(data["stopTimes"], excluded=data["excluded"])
+        except _INDEX_LOAD_ERRORS:
+            return None
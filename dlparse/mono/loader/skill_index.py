@@ -0,0 +1,229 @@
+"""Index of the skills to the units having them."""
+import hashlib
+import multiprocessing
+import os
+import pickle  # nosec
+from concurrent.futures import ProcessPoolExecutor
+from typing import ItemsView, Iterable, Optional, TYPE_CHECKING, Type
+
+from dlparse.enums import UnitType
+from dlparse.mono.asset import SkillIdEntry, SkillReverseSearchResult, UnitEntry
+
+if TYPE_CHECKING:
+    from dlparse.mono.manager import AssetManager
+
+__all__ = ("SkillUnitIndex", "get_sources_fingerprint")
+
+SKILL_UNIT_INDEX_VERSION: int = 1
+"""Version of the stored index. Bump this if the stored layout or the skill discovery changes."""
+
+_INDEX_LOAD_ERRORS: tuple[Type[Exception], ...] = (
+    OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, IndexError, KeyError, TypeError, ValueError
+)
+"""Errors indicating that a stored index is corrupted or incompatible with the current code."""
+
+# Asset manager used by the worker processes, which is inherited from the parent process by forking
+_worker_asset_manager: Optional["AssetManager"] = None
+
+# K = skill ID, V = unit type, unit ID, skill ID entry
+StoredIndex = dict[int, tuple[UnitType, int, SkillIdEntry]]
+
+
+def _get_skill_id_entries(unit_id: int, is_dragon: bool) -> list[SkillIdEntry]:
+    asset_unit = _worker_asset_manager.asset_dragon_data if is_dragon else _worker_asset_manager.asset_chara_data
+
+    return asset_unit.get_data_by_id(unit_id).get_skill_id_entries(_worker_asset_manager, is_dragon=is_dragon)
+
+
+def get_sources_fingerprint(source_paths: Iterable[str]) -> str:
+    """
+    Get the fingerprint of the files at ``source_paths`` from their paths, sizes and modification times.
+
+    Directories in ``source_paths`` are walked recursively. Missing paths are skipped.
+    """
+    fingerprint = hashlib.blake2b(digest_size=16)
+
+    for source_path in sorted(source_paths):
+        if os.path.isdir(source_path):
+            file_paths = sorted(
+                os.path.join(dir_path, file_name)
+                for dir_path, _, file_names in os.walk(source_path)
+                for file_name in file_names
+            )
+        elif os.path.exists(source_path):
+            file_paths = [source_path]
+        else:
+            continue
+
+        for file_path in file_paths:
+            file_stat = os.stat(file_path)
+            fingerprint.update(f"{os.path.abspath(file_path)}|{file_stat.st_size}|{file_stat.st_mtime_ns}\n".encode())
+
+    return fingerprint.hexdigest()
+
+
+class SkillUnitIndex:
+    """
+    Index of the skill ID to the playable unit having the skill.
+
+    The skills of all playable characters and dragons are discovered in a single pass when the index is built.
+    If multiple units have the same skill, the character comes first, then the unit comes first in the asset.
+    """
+
+    def __init__(self, results: dict[int, SkillReverseSearchResult]):
+        self._results: dict[int, SkillReverseSearchResult] = results  # K = skill ID
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __contains__(self, skill_id: int) -> bool:
+        return skill_id in self._results
+
+    def items(self) -> ItemsView[int, SkillReverseSearchResult]:
+        """Get the skill IDs and the units having them."""
+        return self._results.items()
+
+    def get(self, skill_id: int) -> Optional[SkillReverseSearchResult]:
+        """Get the unit having the skill of ``skill_id``. Returns ``None`` if no playable unit has the skill."""
+        return self._results.get(skill_id)
+
+    @staticmethod
+    def _get_units(asset_manager: "AssetManager") -> list[tuple[UnitEntry, bool]]:
+        # Characters come first, so the characters take priority over the dragons having the same skill
+        return [(unit_data, False) for unit_data in asset_manager.asset_chara_data.playable_data] + [
+            (unit_data, True) for unit_data in asset_manager.asset_dragon_data.playable_data
+        ]
+
+    @staticmethod
+    def build(asset_manager: "AssetManager", /, workers: int = 1) -> "SkillUnitIndex":
+        """
+        Build the index by discovering the skills of all playable units.
+
+        If ``workers`` is greater than 1, the skills are discovered by a process pool with ``workers`` processes.
+        The worker processes inherit ``asset_manager`` by forking,
+        so the index is built serially if forking is not available on the platform.
+        The index is identical either way.
+        """
+        global _worker_asset_manager  # pylint: disable=global-statement
+
+        units = SkillUnitIndex._get_units(asset_manager)
+        unit_ids = [unit_data.id for unit_data, _ in units]
+        is_dragons = [is_dragon for _, is_dragon in units]
+
+        _worker_asset_manager = asset_manager
+
+        try:
+            if workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+                mp_context = multiprocessing.get_context("fork")
+
+                with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+                    chunk_size = max(1, len(units) // (workers * 4))
+                    entries_of_units = list(executor.map(
+                        _get_skill_id_entries, unit_ids, is_dragons, chunksize=chunk_size
+                    ))
+            else:
+                entries_of_units = list(map(_get_skill_id_entries, unit_ids, is_dragons))
+        finally:
+            _worker_asset_manager = None
+
+        results: dict[int, SkillReverseSearchResult] = {}
+
+        for (unit_data, _), entries in zip(units, entries_of_units):
+            for entry in entries:
+                results.setdefault(
+                    entry.skill_id, SkillReverseSearchResult(unit_data=unit_data, skill_id_entry=entry)
+                )
+
+        return SkillUnitIndex(results)
+
+    def save(self, file_path: str, /, fingerprint: str = "") -> None:
+        """
+        Store the index to ``file_path``.
+
+        ``fingerprint`` identifies the source files used to build the index. Check ``get_sources_fingerprint()``.
+        """
+        stored: StoredIndex = {
+            skill_id: (result.unit_data.unit_type, result.unit_data.id, result.skill_id_entry)
+            for skill_id, result in self._results.items()
+        }
+
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+
+        # Write to a temporary file first, then replace the index to avoid leaving a partially written index
+        file_path_temp = f"{file_path}.{os.getpid()}.tmp"
+
+        try:
+            with open(file_path_temp, "wb") as f:
+                pickle.dump((SKILL_UNIT_INDEX_VERSION, fingerprint), f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(stored, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(file_path_temp, file_path)
+        finally:
+            if os.path.exists(file_path_temp):
+                os.remove(file_path_temp)
+
+    @staticmethod
+    def load(
+            file_path: str, asset_manager: "AssetManager", /, fingerprint: str = ""
+    ) -> Optional["SkillUnitIndex"]:
+        """
+        Load the index stored at ``file_path``, resolving the units using ``asset_manager``.
+
+        Returns ``None`` if the file is missing, outdated, corrupted,
+        or ``fingerprint`` is different from the one used when the index was saved.
+        """
+        if not os.path.exists(file_path):
+            return None
+
+        try:
+            with open(file_path, "rb") as f:
+                if pickle.load(f) != (SKILL_UNIT_INDEX_VERSION, fingerprint):  # nosec
+                    return None
+
+                stored: StoredIndex = pickle.load(f)  # nosec
+
+            results: dict[int, SkillReverseSearchResult] = {}
+
+            for skill_id, (unit_type, unit_id, skill_id_entry) in stored.items():
+                asset_unit = (
+                    asset_manager.asset_dragon_data if unit_type == UnitType.DRAGON else asset_manager.asset_chara_data
+                )
+
+                if not (unit_data := asset_unit.get_data_by_id(unit_id)):
+                    return None  # Unit removed from the asset
+
+                results[skill_id] = SkillReverseSearchResult(unit_data=unit_data, skill_id_entry=skill_id_entry)
+        except _INDEX_LOAD_ERRORS:
+            return None
+
+        return SkillUnitIndex(results)
+
+    @staticmethod
+    def load_or_build(
+            file_path: Optional[str], asset_manager: "AssetManager", /,
+            source_paths: Iterable[str] = (), workers: int = 1
+    ) -> "SkillUnitIndex":
+        """
+        Load the index stored at ``file_path``. Build and store the index there if it cannot be loaded.
+
+        The stored index is discarded if any of the files at ``source_paths`` changes.
+        If ``file_path`` is ``None``, the index is always built and not stored.
+
+        Check ``build()`` for ``workers``.
+        """
+        if not file_path:
+            return SkillUnitIndex.build(asset_manager, workers=workers)
+
+        fingerprint = get_sources_fingerprint(source_paths)
+
+        if index := SkillUnitIndex.load(file_path, asset_manager, fingerprint=fingerprint):
+            return index
+
+        index = SkillUnitIndex.build(asset_manager, workers=workers)
+
+        try:
+            index.save(file_path, fingerprint=fingerprint)
+        except (OSError, pickle.PicklingError):
+            pass  # Storing the index is an optimization only
+
+        return index
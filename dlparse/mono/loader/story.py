@@ -22,8 +22,6 @@ _unit_type_path: dict[UnitType, str] = {
 class StoryLoader:
     """Class to load the story data."""
 
-    # pylint: disable=too-few-public-methods
-
     def __init__(self, story_dir: str, story_img_dir: str, asset_manager: "AssetManager") -> None:
         self._story_dir = story_dir
         self._name_asset = StoryNameAsset(story_dir)
@@ -38,12 +36,15 @@ class StoryLoader:
 
         raise UnknownStoryTypeError(story_type)
 
+    def _get_story_path(self, path_in_dir: str, lang: Language, story_id: MasterAssetIdType) -> str:
+        return localize_asset_path(os.path.join(self._story_dir, path_in_dir, f"{story_id}.json"), lang)
+
     @cache
     def _get_story_data(
             self, path_in_dir: str, story_type: StoryType, lang: Language, story_id: MasterAssetIdType
     ) -> StoryData:
         return StoryData(
-            localize_asset_path(os.path.join(self._story_dir, path_in_dir, f"{story_id}.json"), lang),
+            self._get_story_path(path_in_dir, lang, story_id),
             lang,
             self._get_story_name(story_type, lang, story_id),
             story_id,
@@ -51,10 +52,22 @@ class StoryLoader:
             image_asset=self._image_asset,
         )
 
-    def load_unit_story(self, lang: Language, unit_type: UnitType, story_id: MasterAssetIdType) -> StoryData:
-        """Load the unit story given ``unit_type`` and ``story_id`` in ``lang``."""
+    @staticmethod
+    def _get_unit_story_dir(unit_type: UnitType) -> str:
         unit_story_dir = _unit_type_path.get(unit_type)
         if not unit_story_dir:
             raise StoryUnavailableError(f"Unit type {unit_type} does not have story")
 
-        return self._get_story_data(os.path.join("unitstory", unit_story_dir), StoryType.UNIT, lang, story_id)
+        return os.path.join("unitstory", unit_story_dir)
+
+    def get_unit_story_path(self, lang: Language, unit_type: UnitType, story_id: MasterAssetIdType) -> str:
+        """
+        Get the path of the unit story file given ``unit_type`` and ``story_id`` in ``lang``. The file may not exist.
+
+        :raises StoryUnavailableError: if `unit_type` does not have story
+        """
+        return self._get_story_path(self._get_unit_story_dir(unit_type), lang, story_id)
+
+    def load_unit_story(self, lang: Language, unit_type: UnitType, story_id: MasterAssetIdType) -> StoryData:
+        """Load the unit story given ``unit_type`` and ``story_id`` in ``lang``."""
+        return self._get_story_data(self._get_unit_story_dir(unit_type), StoryType.UNIT, lang, story_id)
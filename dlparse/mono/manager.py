@@ -1,24 +1,52 @@
 """Classes for loading all the assets and loaders."""
-from typing import Optional
-
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain
+from typing import Any, Callable, Iterable, Optional, Type, TypeVar
+
+from dlparse.enums import Language
 from dlparse.errors import ConfigError
 from dlparse.transformer import (
     AbilityTransformer, AttackingActionTransformer,
     EnemyTransformer, InfoTransformer, QuestTransformer, SkillTransformer,
 )
-from dlparse.utils import make_path
+from dlparse.utils import LRUCache, make_path
 from .asset import (
     AbilityAsset, AbilityLimitGroupAsset, ActionConditionAsset, ActionGrantAsset, ActionPartsListAsset, BuffCountAsset,
     CastleStoryAsset, CharaDataAsset, CharaModeAsset, CharaUniqueComboAsset, DragonDataAsset, DungeonPlannerAsset,
     EnemyDataAsset, EnemyParamAsset, ExAbilityAsset, HitAttrAsset, MotionSelectorWeapon, PlayerActionInfoAsset,
-    QuestDataAsset, QuestStoryAsset, SkillChainAsset, SkillDataAsset, TextAssetMultilingual, UnitStoryAsset,
-    WeaponTypeAsset,
+    PlayerActionPrefab, QuestDataAsset, QuestStoryAsset, SkillChainAsset, SkillDataAsset, TextAssetMultilingual,
+    UnitStoryAsset, WeaponTypeAsset,
+)
+from .asset.base import (
+    AssetArchive, AssetBase, NetworkSource, get_file_path, get_network_source, mount_archive, set_network_source,
+    unmount_archive,
 )
 from .custom import WebsiteTextAsset
-from .loader import ActionFileLoader, CharacterMotionLoader, DragonMotionLoader, StoryLoader
+from .loader import (
+    ActionFileLoader, ActionGraph, CharacterMotionLoader, DragonMotionLoader, MotionStopTimeIndex, SkillUnitIndex,
+    StoryLoader, get_sources_fingerprint,
+)
 
 __all__ = ("AssetManager",)
 
+T = TypeVar("T")
+
+
+def _load_asset_timed(fn_load: Callable[[], T]) -> tuple[T, float]:
+    """Call ``fn_load`` to load an asset. Returns the loaded asset and the time spent in seconds."""
+    start = time.perf_counter()
+    asset = fn_load()
+
+    return asset, time.perf_counter() - start
+
+
+def _load_motion_stop_time_index(index_path: str, motion_dirs: list[str]) -> Optional[MotionStopTimeIndex]:
+    """Load the motion stop time index at ``index_path`` if it is built from the files in ``motion_dirs``."""
+    return MotionStopTimeIndex.load(index_path, fingerprint=get_sources_fingerprint(motion_dirs))
+
 
 class AssetManager:
     """A class for loading and managing all the assets and loaders."""
@@ -28,8 +56,52 @@ class AssetManager:
 
     def __init__(
             self, root_resources_dir: str, /,
-            is_network_source: bool = False, custom_asset_dir: Optional[str] = None
+            is_network_source: bool = False, custom_asset_dir: Optional[str] = None,
+            snapshot_dir: Optional[str] = None, lazy: bool = False, load_workers: int = 1,
+            network_cache_dir: Optional[str] = None, archive_path: Optional[str] = None,
+            archive_mount_dir: Optional[str] = None, motion_index_path: Optional[str] = None,
+            prefab_cache: Optional[LRUCache[int, PlayerActionPrefab]] = None
     ):
+        """
+        Initializes the asset manager.
+
+        If ``snapshot_dir`` is given, the parsed data of the master assets will be loaded from or stored to
+        the snapshots in ``snapshot_dir``. Snapshots are invalidated automatically if the source files change.
+        The parsed components of the player action prefabs are stored in the ``actions`` directory of it.
+        The skill to unit index is also stored in it, which is rebuilt if any of the master asset files
+        or the player action files changes.
+
+        If ``lazy`` is ``True``, each asset, loader and transformer will only be loaded on its first access.
+        Otherwise, all of them will be loaded during the initialization,
+        except the action graph and the skill to unit index, which are always built on their first access.
+
+        If ``load_workers`` is greater than 1 and ``lazy`` is ``False``, the assets that do not depend on the others
+        (master assets, motion assets and custom assets) will be loaded concurrently by a process pool
+        with ``load_workers`` processes. The time spent on loading each asset is available in ``asset_load_time``.
+        ``load_workers`` is also used to build the skill to unit index, regardless of ``lazy``.
+
+        If ``is_network_source`` is ``True``, the remote files are fetched using pooled keep-alive connections.
+        If ``network_cache_dir`` is also given, the fetched files will be cached in ``network_cache_dir``.
+        In this case, the network source of this manager is used by all remote file fetching until ``close()``.
+        If the assets are loaded serially, the master asset files will be prefetched concurrently beforehand.
+        The files of the loaders are not prefetched. Call ``prefetch_loader_files()`` to prefetch them.
+
+        If ``archive_path`` is given, the asset archive (packed by ``pack_archive()``) will be memory-mapped
+        and mounted to ``archive_mount_dir``, which defaults to ``root_resources_dir``.
+        The files under ``archive_mount_dir`` (for example, player actions, motion controllers and stories)
+        will then be served from the archive. Files not in the archive are still read from the disk.
+        To serve the localized files, pack and mount the directory containing both ``assets`` and ``localized``.
+        The archive is unmounted and closed on ``close()``.
+
+        If ``motion_index_path`` is given, the motion stop time index (built by ``MotionStopTimeIndex.build()``)
+        stored at that path will be used by the motion loaders, so that the controllers are loaded
+        only for the motions not in the index. The index is not used if the file does not exist,
+        or the index is not built from the current local motion files.
+        The index is also not used for network sources, because their files cannot be fingerprinted.
+
+        ``prefab_cache`` is the cache of the parsed player action prefabs.
+        If not given, the default cache of :class:`ActionFileLoader` is used.
+        """
         # No need to categorize initializations. It's fine to leave all of them here
         # pylint: disable=too-many-statements
 
@@ -41,61 +113,234 @@ class AssetManager:
         story_asset_dir = make_path(root_resources_dir, "story", is_net=is_network_source)
         story_image_dir = make_path(root_resources_dir, "emotion", is_net=is_network_source)
 
-        # Master Assets
-        # --- Battle-related (Player)
-        self._asset_ability_data = AbilityAsset(asset_dir=master_asset_dir)
-        self._asset_ability_limit = AbilityLimitGroupAsset(asset_dir=master_asset_dir)
-        self._asset_action_cond = ActionConditionAsset(asset_dir=master_asset_dir)
-        self._asset_action_grant = ActionGrantAsset(asset_dir=master_asset_dir)
-        self._asset_buff_count = BuffCountAsset(asset_dir=master_asset_dir)
-        self._asset_chara_data = CharaDataAsset(asset_dir=master_asset_dir)
-        self._asset_chara_mode = CharaModeAsset(asset_dir=master_asset_dir)
-        self._asset_chara_unique_combo = CharaUniqueComboAsset(asset_dir=master_asset_dir)
-        self._asset_dragon_data = DragonDataAsset(asset_dir=master_asset_dir)
-        self._asset_ex_ability = ExAbilityAsset(asset_dir=master_asset_dir)
-        self._asset_hit_attr = HitAttrAsset(asset_dir=master_asset_dir)
-        self._asset_skill_data = SkillDataAsset(asset_dir=master_asset_dir)
-        self._asset_skill_chain = SkillChainAsset(asset_dir=master_asset_dir)
-
-        # --- Battle-related (Enemy)
-        self._asset_dungeon_planner = DungeonPlannerAsset(asset_dir=master_asset_dir)
-        self._asset_enemy_data = EnemyDataAsset(asset_dir=master_asset_dir)
-        self._asset_enemy_param = EnemyParamAsset(asset_dir=master_asset_dir)
-        self._asset_quest_data = QuestDataAsset(asset_dir=master_asset_dir)
-
-        # --- Actions
-        self._asset_pa_info = PlayerActionInfoAsset(asset_dir=master_asset_dir)
-        self._asset_action_list = ActionPartsListAsset(asset_dir=action_asset_dir)
-
-        # --- Story
-        self._asset_story_main = QuestStoryAsset(asset_dir=master_asset_dir)
-        self._asset_story_unit = UnitStoryAsset(asset_dir=master_asset_dir)
-        self._asset_story_castle = CastleStoryAsset(asset_dir=master_asset_dir)
-
-        # --- Misc
-        self._asset_text_multi = TextAssetMultilingual(master_asset_dir)
-        self._asset_weapon_type = WeaponTypeAsset(asset_dir=master_asset_dir)
-
-        # Motion Assets
-        self._motion_weapon = MotionSelectorWeapon(chara_motion_asset_dir)
-
+        skill_unit_index_path = (
+            os.path.join(snapshot_dir, "skill_unit_index.pickle") if snapshot_dir and not is_network_source else None
+        )
+
+        master_asset_paths: list[str] = []
+
+        def master_asset(asset_cls: Type[AssetBase], asset_dir: str = master_asset_dir) -> Callable[[], AssetBase]:
+            master_asset_paths.append(get_file_path(asset_cls.asset_file_name, asset_dir=asset_dir))
+
+            return partial(asset_cls, asset_dir=asset_dir, snapshot_dir=snapshot_dir)
+
+        # K = name of the property to access the asset, V = function to load the asset
+        # - Assets here do not depend on the others. These functions should be picklable for parallel loading.
+        asset_init_independent: dict[str, Callable[[], Any]] = {
+            # Master Assets
+            # --- Battle-related (Player)
+            "asset_ability_data": master_asset(AbilityAsset),
+            "asset_ability_limit": master_asset(AbilityLimitGroupAsset),
+            "asset_action_cond": master_asset(ActionConditionAsset),
+            "asset_action_grant": master_asset(ActionGrantAsset),
+            "asset_buff_count": master_asset(BuffCountAsset),
+            "asset_chara_data": master_asset(CharaDataAsset),
+            "asset_chara_mode": master_asset(CharaModeAsset),
+            "asset_chara_unique_combo": master_asset(CharaUniqueComboAsset),
+            "asset_dragon_data": master_asset(DragonDataAsset),
+            "asset_ex_ability": master_asset(ExAbilityAsset),
+            "asset_hit_attr": master_asset(HitAttrAsset),
+            "asset_skill_data": master_asset(SkillDataAsset),
+            "asset_skill_chain": master_asset(SkillChainAsset),
+            # --- Battle-related (Enemy)
+            "asset_dungeon_planner": master_asset(DungeonPlannerAsset),
+            "asset_enemy_data": master_asset(EnemyDataAsset),
+            "asset_enemy_param": master_asset(EnemyParamAsset),
+            "asset_quest_data": master_asset(QuestDataAsset),
+            # --- Actions
+            "asset_action_info_player": master_asset(PlayerActionInfoAsset),
+            "asset_action_list": master_asset(ActionPartsListAsset, action_asset_dir),
+            # --- Story
+            "asset_story_main": master_asset(QuestStoryAsset),
+            "asset_story_unit": master_asset(UnitStoryAsset),
+            "asset_story_castle": master_asset(CastleStoryAsset),
+            # --- Misc
+            "asset_text_multi": partial(TextAssetMultilingual, master_asset_dir, snapshot_dir=snapshot_dir),
+            "asset_weapon_type": master_asset(WeaponTypeAsset),
+            # Motion Assets
+            "motion_weapon": partial(MotionSelectorWeapon, chara_motion_asset_dir),
+        }
         # Custom Assets
         # - If custom asset directory is not provided, do not load the asset
-        self._asset_text_website = WebsiteTextAsset(asset_dir=custom_asset_dir) if custom_asset_dir else None
-
-        # Loaders
-        self._loader_action = ActionFileLoader(self._asset_action_list, action_asset_dir)
-        self._loader_chara_motion = CharacterMotionLoader(chara_motion_asset_dir)
-        self._loader_dragon_motion = DragonMotionLoader(dragon_motion_asset_dir)
-        self._loader_story = StoryLoader(story_asset_dir, story_image_dir, self)
-
-        # Transformers
-        self._transformer_ability = AbilityTransformer(self)
-        self._transformer_atk = AttackingActionTransformer(self)
-        self._transformer_enemy = EnemyTransformer(self)
-        self._transformer_info = InfoTransformer(self)
-        self._transformer_skill = SkillTransformer(self)
-        self._transformer_quest = QuestTransformer(self)
+        if custom_asset_dir:
+            asset_init_independent["asset_text_website"] = partial(WebsiteTextAsset, asset_dir=custom_asset_dir)
+        # Motion stop time index
+        # - If the path of the index is not provided, or the source is network, do not load the index
+        if motion_index_path and not is_network_source:
+            asset_init_independent["motion_stop_time_index"] = partial(
+                _load_motion_stop_time_index, motion_index_path, [chara_motion_asset_dir, dragon_motion_asset_dir]
+            )
+
+        # - Assets, loaders and transformers here depend on the other assets or the manager itself
+        asset_init_dependent: dict[str, Callable[[], Any]] = {
+            # Loaders
+            "loader_action": lambda: ActionFileLoader(
+                self.asset_action_list, action_asset_dir, cache=prefab_cache,
+                snapshot_dir=os.path.join(snapshot_dir, "actions") if snapshot_dir else None
+            ),
+            "loader_chara_motion": lambda: CharacterMotionLoader(
+                chara_motion_asset_dir, motion_weapon=self.motion_weapon, stop_time_index=self.motion_stop_time_index
+            ),
+            "loader_dragon_motion": lambda: DragonMotionLoader(
+                dragon_motion_asset_dir, stop_time_index=self.motion_stop_time_index
+            ),
+            "loader_story": lambda: StoryLoader(story_asset_dir, story_image_dir, self),
+            # Transformers
+            "transformer_ability": partial(AbilityTransformer, self),
+            "transformer_atk": partial(AttackingActionTransformer, self),
+            "transformer_enemy": partial(EnemyTransformer, self),
+            "transformer_info": partial(InfoTransformer, self),
+            "transformer_skill": partial(SkillTransformer, self),
+            "transformer_quest": partial(QuestTransformer, self),
+        }
+        # - Loaders here are always loaded on demand, even if ``lazy`` is ``False``,
+        #   because building them is expensive and not needed unless they are used
+        asset_init_on_demand: dict[str, Callable[[], Any]] = {
+            "action_graph": lambda: ActionGraph(self.asset_action_info_player, self.loader_action),
+            "skill_unit_index": lambda: SkillUnitIndex.load_or_build(
+                skill_unit_index_path, self, source_paths=[*master_asset_paths, action_asset_dir], workers=load_workers
+            ),
+        }
+
+        self._asset_init: dict[str, Callable[[], Any]] = (
+            asset_init_independent | asset_init_dependent | asset_init_on_demand
+        )
+        self._assets: dict[str, Any] = {}  # K = name of the property to access the asset, V = loaded asset
+        self._asset_load_time: dict[str, float] = {}  # K = name of the property to access the asset, V = seconds
+
+        self._is_network_source: bool = is_network_source
+
+        # Network source set by this manager, and the one replaced by it
+        self._network_source: Optional[NetworkSource] = None
+        self._network_source_replaced: Optional[NetworkSource] = None
+
+        if is_network_source and network_cache_dir:
+            self._network_source = NetworkSource(cache_dir=network_cache_dir)
+            self._network_source_replaced = get_network_source()
+            set_network_source(self._network_source)
+
+        # Archive mounted by this manager, and the directory it's mounted to
+        self._archive: Optional[AssetArchive] = None
+        self._archive_mount_dir: Optional[str] = None
+
+        if archive_path:
+            self._archive = AssetArchive(archive_path)
+            self._archive_mount_dir = archive_mount_dir or root_resources_dir
+            mount_archive(self._archive, self._archive_mount_dir)
+
+        if lazy:
+            return
+
+        if load_workers > 1:
+            self._load_assets_parallel(list(asset_init_independent), load_workers)
+        elif is_network_source:
+            # Failed ones are not handled here, the error will be raised again when loading the asset
+            get_network_source().prefetch(master_asset_paths)
+
+        for name in asset_init_independent | asset_init_dependent:
+            self._get_asset(name)
+
+    def __enter__(self) -> "AssetManager":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the global resources taken by this manager.
+
+        The network source of this manager is closed. The network source replaced by it is restored,
+        unless another network source has been set afterwards.
+
+        The archive mounted by this manager is unmounted and closed.
+
+        Assets not loaded yet should not be accessed after closing.
+        """
+        if self._network_source:
+            if get_network_source() is self._network_source:
+                set_network_source(self._network_source_replaced)
+
+            self._network_source.close()
+            self._network_source = None
+            self._network_source_replaced = None
+
+        if self._archive:
+            unmount_archive(self._archive_mount_dir, archive=self._archive)
+
+            self._archive.close()
+            self._archive = None
+            self._archive_mount_dir = None
+
+    def prefetch_loader_files(self, languages: Optional[Iterable[Language]] = None) -> dict[str, Exception]:
+        """
+        Fetch the files of the loaders concurrently, so loading them later does not wait for the network.
+
+        The files are the player action prefabs, the motion controllers of the characters and the dragons,
+        and the unit stories in ``languages``. The unit stories of all languages are fetched if not given.
+
+        Does nothing if the files are not from the network.
+        Without ``network_cache_dir``, the fetched files are kept in the memory until they are loaded.
+
+        Returns the errors raised for each file failed to be fetched.
+        Some units do not have their own motion controller or story, so errors on these files are expected.
+        """
+        if not self._is_network_source:
+            return {}
+
+        languages = list(languages) if languages is not None else list(Language)
+
+        file_paths: list[str] = self.loader_action.file_paths
+        file_paths.extend(self.loader_chara_motion.get_file_path(entry) for entry in self.asset_chara_data)
+        file_paths.extend(self.loader_dragon_motion.get_file_path(entry) for entry in self.asset_dragon_data)
+
+        for unit_entry in chain(self.asset_chara_data, self.asset_dragon_data):
+            for unit_story in self.asset_story_unit.get_data_by_variation_identifier(unit_entry.var_identifier) or ():
+                file_paths.extend(
+                    self.loader_story.get_unit_story_path(lang, unit_entry.unit_type, unit_story.id)
+                    for lang in languages
+                )
+
+        return get_network_source().prefetch(file_paths)
+
+    def _load_assets_parallel(self, names: list[str], workers: int) -> None:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {name: executor.submit(_load_asset_timed, self._asset_init[name]) for name in names}
+
+            # Store the results in the order of ``names`` to keep the loading result deterministic
+            for name, future in futures.items():
+                self._assets[name], self._asset_load_time[name] = future.result()
+
+    def _get_asset(self, name: str) -> Any:
+        if name not in self._assets:
+            self._assets[name], self._asset_load_time[name] = _load_asset_timed(self._asset_init[name])
+
+        return self._assets[name]
+
+    @property
+    def asset_load_time(self) -> dict[str, float]:
+        """
+        Get the time spent on loading each asset, loader and transformer in seconds.
+
+        The key is the name of the property to access the asset. Only the loaded ones are included.
+
+        For the assets loaded in parallel, the time is measured in the worker process,
+        so the sum of these could be greater than the actual time spent.
+        """
+        return dict(self._asset_load_time)
+
+    @property
+    def asset_load_state(self) -> dict[str, bool]:
+        """
+        Get the load state of each asset, loader and transformer.
+
+        The key is the name of the property to access the asset, the value indicates if it's loaded.
+        """
+        return {name: name in self._assets for name in self._asset_init}
+
+    def is_asset_loaded(self, name: str) -> bool:
+        """Check if the asset, loader or transformer accessed by the property ``name`` is loaded."""
+        return name in self._assets
 
     # region Master Assets
 
@@ -104,128 +349,128 @@ class AssetManager:
     @property
     def asset_ability_data(self) -> AbilityAsset:
         """Get the ability data asset."""
-        return self._asset_ability_data
+        return self._get_asset("asset_ability_data")
 
     @property
     def asset_ability_limit(self) -> AbilityLimitGroupAsset:
         """Get the ability limit data asset."""
-        return self._asset_ability_limit
+        return self._get_asset("asset_ability_limit")
 
     @property
     def asset_action_cond(self) -> ActionConditionAsset:
         """Get the action condition data asset."""
-        return self._asset_action_cond
+        return self._get_asset("asset_action_cond")
 
     @property
     def asset_action_grant(self) -> ActionGrantAsset:
         """Get the action grant asset."""
-        return self._asset_action_grant
+        return self._get_asset("asset_action_grant")
 
     @property
     def asset_buff_count(self) -> BuffCountAsset:
         """Get the buff count data asset."""
-        return self._asset_buff_count
+        return self._get_asset("asset_buff_count")
 
     @property
     def asset_chara_data(self) -> CharaDataAsset:
         """Get the character data asset."""
-        return self._asset_chara_data
+        return self._get_asset("asset_chara_data")
 
     @property
     def asset_chara_mode(self) -> CharaModeAsset:
         """Get the character mode asset."""
-        return self._asset_chara_mode
+        return self._get_asset("asset_chara_mode")
 
     @property
     def asset_chara_unique_combo(self) -> CharaUniqueComboAsset:
         """Get the character unique combo asset."""
-        return self._asset_chara_unique_combo
+        return self._get_asset("asset_chara_unique_combo")
 
     @property
     def asset_dragon_data(self) -> DragonDataAsset:
         """Get the dragon data asset."""
-        return self._asset_dragon_data
+        return self._get_asset("asset_dragon_data")
 
     @property
     def asset_ex_ability(self) -> ExAbilityAsset:
         """Get the EX ability data asset."""
-        return self._asset_ex_ability
+        return self._get_asset("asset_ex_ability")
 
     @property
     def asset_hit_attr(self) -> HitAttrAsset:
         """Get the hit attribute asset."""
-        return self._asset_hit_attr
+        return self._get_asset("asset_hit_attr")
 
     @property
     def asset_skill_data(self) -> SkillDataAsset:
         """Get the skill data asset."""
-        return self._asset_skill_data
+        return self._get_asset("asset_skill_data")
 
     @property
     def asset_skill_chain(self) -> SkillChainAsset:
         """Get the skill chain data asset."""
-        return self._asset_skill_chain
+        return self._get_asset("asset_skill_chain")
 
     @property
     def asset_text_multi(self) -> TextAssetMultilingual:
         """Get the multilingual text label asset."""
-        return self._asset_text_multi
+        return self._get_asset("asset_text_multi")
 
     @property
     def asset_weapon_type(self) -> WeaponTypeAsset:
         """Get the weapon type asset."""
-        return self._asset_weapon_type
+        return self._get_asset("asset_weapon_type")
 
     # --- Battle-related (Enemy)
 
     @property
     def asset_dungeon_planner(self) -> DungeonPlannerAsset:
         """Get the dungeon planner asset."""
-        return self._asset_dungeon_planner
+        return self._get_asset("asset_dungeon_planner")
 
     @property
     def asset_enemy_data(self) -> EnemyDataAsset:
         """Get the enemy data."""
-        return self._asset_enemy_data
+        return self._get_asset("asset_enemy_data")
 
     @property
     def asset_enemy_param(self) -> EnemyParamAsset:
         """Get the enemy param data."""
-        return self._asset_enemy_param
+        return self._get_asset("asset_enemy_param")
 
     @property
     def asset_quest_data(self) -> QuestDataAsset:
         """Get the quest data asset."""
-        return self._asset_quest_data
+        return self._get_asset("asset_quest_data")
 
     # --- Actions
 
     @property
     def asset_action_info_player(self) -> PlayerActionInfoAsset:
         """Get the player action info asset."""
-        return self._asset_pa_info
+        return self._get_asset("asset_action_info_player")
 
     @property
     def asset_action_list(self) -> ActionPartsListAsset:
         """Get the action parts list asset."""
-        return self._asset_action_list
+        return self._get_asset("asset_action_list")
 
     # --- Story
 
     @property
     def asset_story_main(self) -> QuestStoryAsset:
         """Get the main quest story asset."""
-        return self._asset_story_main
+        return self._get_asset("asset_story_main")
 
     @property
     def asset_story_unit(self) -> UnitStoryAsset:
         """Get the unit story asset."""
-        return self._asset_story_unit
+        return self._get_asset("asset_story_unit")
 
     @property
     def asset_story_castle(self) -> CastleStoryAsset:
         """Get the castle story asset."""
-        return self._asset_story_castle
+        return self._get_asset("asset_story_castle")
 
     # endregion
 
@@ -233,7 +478,15 @@ class AssetManager:
     @property
     def motion_weapon(self) -> MotionSelectorWeapon:
         """Get the character weapon motion asset."""
-        return self._motion_weapon
+        return self._get_asset("motion_weapon")
+
+    @property
+    def motion_stop_time_index(self) -> Optional[MotionStopTimeIndex]:
+        """Get the motion stop time index. Returns ``None`` if the index is not provided or not found."""
+        if "motion_stop_time_index" not in self._asset_init:
+            return None
+
+        return self._get_asset("motion_stop_time_index")
 
     # endregion
 
@@ -245,12 +498,12 @@ class AssetManager:
 
         :raises ConfigError: if custom asset directory was not given
         """
-        if not self._asset_text_website:
+        if "asset_text_website" not in self._asset_init:
             # Case when the custom asset directory was not given
             raise ConfigError("Custom asset directory not specified. "
                               "Specify the custom asset directory then try again.")
 
-        return self._asset_text_website
+        return self._get_asset("asset_text_website")
 
     # endregion
 
@@ -258,22 +511,32 @@ class AssetManager:
     @property
     def loader_action(self) -> ActionFileLoader:
         """Get the action file loader."""
-        return self._loader_action
+        return self._get_asset("loader_action")
 
     @property
     def loader_chara_motion(self) -> CharacterMotionLoader:
         """Get the character motion loader."""
-        return self._loader_chara_motion
+        return self._get_asset("loader_chara_motion")
 
     @property
     def loader_dragon_motion(self) -> DragonMotionLoader:
         """Get the dragon motion loader."""
-        return self._loader_dragon_motion
+        return self._get_asset("loader_dragon_motion")
 
     @property
     def loader_story(self) -> StoryLoader:
         """Get the story data loader."""
-        return self._loader_story
+        return self._get_asset("loader_story")
+
+    @property
+    def action_graph(self) -> ActionGraph:
+        """Get the graph of the transitions between the player actions."""
+        return self._get_asset("action_graph")
+
+    @property
+    def skill_unit_index(self) -> SkillUnitIndex:
+        """Get the index of the skill ID to the playable unit having the skill."""
+        return self._get_asset("skill_unit_index")
 
     # endregion
 
@@ -281,32 +544,32 @@ class AssetManager:
     @property
     def transformer_skill(self) -> SkillTransformer:
         """Get the skill transformer."""
-        return self._transformer_skill
+        return self._get_asset("transformer_skill")
 
     @property
     def transformer_ability(self) -> AbilityTransformer:
         """Get the ability transformer."""
-        return self._transformer_ability
+        return self._get_asset("transformer_ability")
 
     @property
     def transformer_atk(self) -> AttackingActionTransformer:
         """Get the attacking action transformer."""
-        return self._transformer_atk
+        return self._get_asset("transformer_atk")
 
     @property
     def transformer_enemy(self) -> EnemyTransformer:
         """Get the enemy data transformer."""
-        return self._transformer_enemy
+        return self._get_asset("transformer_enemy")
 
     @property
     def transformer_info(self) -> InfoTransformer:
         """Get the info transformer."""
-        return self._transformer_info
+        return self._get_asset("transformer_info")
 
     @property
     def transformer_quest(self) -> QuestTransformer:
         """Get the quest data transformer."""
-        return self._transformer_quest
+        return self._get_asset("transformer_quest")
 
     # endregion
 
@@ -4,4 +4,4 @@ from .atk import AttackingActionTransformer
 from .enemy import EnemyTransformer
 from .info import InfoTransformer
 from .quest import QuestTransformer
-from .skill import SkillHitData, SkillTransformer
+from .skill import SkillHitData, SkillResultKey, SkillTransformArgs, SkillTransformer, SkillTransformResult
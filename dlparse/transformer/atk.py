@@ -13,6 +13,7 @@ This includes things like:
 """
 from typing import Optional, TYPE_CHECKING
 
+from dlparse.enums import ActionEdgeType
 from dlparse.errors import ActionDataNotFoundError
 from dlparse.model import NormalAttackChain, NormalAttackCombo
 
@@ -46,25 +47,19 @@ class AttackingActionTransformer:
     ) -> Optional[NormalAttackChain]:
         """Get the normal attack or FS info rooted from ``root_action_id``."""
         try:
-            current_prefab = self._asset_manager.loader_action.get_prefab(root_action_id)
+            self._asset_manager.loader_action.get_prefab(root_action_id)
         except ActionDataNotFoundError as ex:
             if self._is_allowed_empty_combo(root_action_id):
                 return NormalAttackChain([])
 
             raise ex
 
-        parsed_action_ids = set()
-        combos = []
-
-        while current_prefab.action_id not in parsed_action_ids:
-            combo = NormalAttackCombo(self._asset_manager, current_prefab, level=level, ability_ids=ability_ids)
-            combos.append(combo)
-
-            parsed_action_ids.add(current_prefab.action_id)
-
-            # Next prefab
-            if not combo.next_combo_action_id:
-                break
-            current_prefab = self._asset_manager.loader_action.get_prefab(combo.next_combo_action_id)
+        combos = [
+            NormalAttackCombo(
+                self._asset_manager, self._asset_manager.loader_action.get_prefab(action_id),
+                level=level, ability_ids=ability_ids
+            )
+            for action_id in self._asset_manager.action_graph.get_chain(root_action_id, ActionEdgeType.COMBO_NEXT)
+        ]
 
         return NormalAttackChain(combos)
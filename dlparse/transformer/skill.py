@@ -1,33 +1,113 @@
 """Skill data transformer."""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional, TYPE_CHECKING, Type, TypeVar
+from typing import Any, Callable, Generic, Iterable, Optional, TYPE_CHECKING, Type, TypeVar, Union
 
 from dlparse.enums import Condition, ConditionCategories, ConditionComposite
 from dlparse.errors import (
-    ActionInfoNotFoundError, HitDataUnavailableError, NoUniqueDragonError, SkillDataNotFoundError, UnhandledUnitError,
-    UnitDataNotFoundError,
+    ActionDataNotFoundError, ActionInfoNotFoundError, AppValueError, HitDataUnavailableError, MotionDataNotFoundError,
+    NoUniqueDragonError, SkillDataNotFoundError, UnhandledUnitError, UnitDataNotFoundError,
 )
 from dlparse.model import (
-    AttackingSkillData, BuffingHitData, DamagingHitData, HitData, SkillCancelActionUnit, SupportiveSkillData,
+    AttackingSkillData, BuffingHitData, DamagingHitData, HitData, SkillCancelActionUnit, SkillDataBase,
+    SupportiveSkillData,
 )
 from dlparse.mono.asset import (
-    ActionConditionEntry, CharaDataEntry, DragonDataEntry, HitAttrEntry, PlayerActionInfoEntry, SkillDataEntry,
-    SkillIdEntry, UnitEntry,
+    AbilityAsset, ActionConditionAsset, ActionConditionEntry, BuffCountAsset, CharaDataEntry, DragonDataAsset,
+    DragonDataEntry, HitAttrAsset, HitAttrEntry, PlayerActionInfoAsset, PlayerActionInfoEntry, SkillDataAsset,
+    SkillDataEntry, SkillIdEntry, UnitEntry,
 )
 from dlparse.mono.asset.base import ActionComponentHasHitLabels
 from dlparse.mono.asset.extension import SkillReverseSearchResult
-from dlparse.utils import get_ability_data_to_shift_hit_attr, make_hit_label
+from dlparse.utils import LRUCache, get_ability_data_to_shift_hit_attr
 
 if TYPE_CHECKING:
+    from dlparse.mono.loader import ActionFileLoader, CharacterMotionLoader, DragonMotionLoader, SkillUnitIndex
     from dlparse.mono.manager import AssetManager
 
-__all__ = ("SkillHitData", "SkillTransformer")
+__all__ = ("SkillHitData", "SkillTransformer", "SkillResultKey", "SkillTransformArgs", "SkillTransformResult")
 
 T = TypeVar("T", bound=HitData)
 AT = TypeVar("AT", bound=ActionComponentHasHitLabels)
+DT = TypeVar("DT", bound=SkillDataBase)
 
 HitDataList = list[T]
 
+SKILL_RESULT_CACHE_MAX_ENTRIES = 8192  # Default count of the transformed skills to be cached
+
+# Transform method name, skill ID, max level, ability IDs, is exporting (always ``False`` for the supportive skills)
+SkillResultKey = tuple[str, int, int, tuple[int, ...], bool]
+
+
+@dataclass(frozen=True)
+class _SkillResultError:
+    """Error raised during the transformation. The cached error is stored in this form."""
+
+    error_type: Type[AppValueError]
+    args: tuple[Any, ...]
+
+    @staticmethod
+    def from_error(error: AppValueError) -> "_SkillResultError":
+        """Get the stored form of ``error``."""
+        return _SkillResultError(type(error), error.args)
+
+    def make_error(self) -> AppValueError:
+        """Make a new error to be raised, so the errors raised do not share the traceback or the context."""
+        # ``__init__()`` is not called because ``args`` is the formatted message instead of the init arguments
+        error = self.error_type.__new__(self.error_type)
+        error.args = self.args
+
+        return error
+
+
+# Transformed skill, or the error raised during the transformation
+SkillResult = Union[SkillDataBase, _SkillResultError]
+
+# Skill ID, max level, ability IDs
+SkillTransformArgs = tuple[int, int, Optional[list[int]]]
+
+SKIPPABLE_TRANSFORM_ERRORS: tuple[Type[AppValueError], ...] = (
+    HitDataUnavailableError, MotionDataNotFoundError, ActionDataNotFoundError
+)
+"""Errors which skip the skill in a batch transformation instead of being raised."""
+
+# Transformer used by the worker processes, which is inherited from the parent process by forking
+_worker_transformer: Optional["SkillTransformer"] = None
+
+# Transformed skill, skip error, is failed with an error not to be skipped
+_WorkerResult = tuple[Optional[SkillDataBase], Optional[_SkillResultError], bool]
+
+
+def _transform_in_worker(method_name: str, args: SkillTransformArgs, kwargs: dict[str, Any]) -> _WorkerResult:
+    try:
+        return getattr(_worker_transformer, method_name)(*args, **kwargs), None, False
+    except SKIPPABLE_TRANSFORM_ERRORS as ex:
+        # Errors are not sent back as is because they may fail to be unpickled
+        return None, _SkillResultError.from_error(ex), False
+    except Exception:  # pylint: disable=broad-except
+        # The parent process transforms it again to raise the error
+        return None, None, True
+
+
+@dataclass
+class SkillTransformResult(Generic[DT]):
+    """Result of a skill in a batch transformation."""
+
+    skill_id: int
+    max_lv: int
+    ability_ids: Optional[list[int]]
+
+    skill_data: Optional[DT] = None
+
+    skip_error_type: Optional[Type[AppValueError]] = None
+    skip_message: str = ""
+
+    @property
+    def is_skipped(self) -> bool:
+        """Check if the skill is skipped because of any of ``SKIPPABLE_TRANSFORM_ERRORS``."""
+        return self.skill_data is None
+
 
 @dataclass
 class SkillHitData:
@@ -76,21 +156,81 @@ class SkillInfo:
 class SkillTransformer:
     """Class to transform the skill data."""
 
-    def __init__(self, asset_manager: "AssetManager"):
+    def __init__(
+            self, asset_manager: "AssetManager", /,
+            result_cache: Optional[LRUCache[SkillResultKey, SkillResult]] = None
+    ):
+        """
+        Initializes a skill transformer using the assets of ``asset_manager``.
+
+        The results of ``transform_attacking()`` and ``transform_supportive()`` are cached in ``result_cache``.
+        If ``result_cache`` is not given, a cache bounded by ``SKILL_RESULT_CACHE_MAX_ENTRIES`` is used.
+        """
         self._asset_manager = asset_manager
+        # The transformed skills reference the asset manager, so measuring their size in bytes is meaningless
+        self._result_cache: LRUCache[SkillResultKey, SkillResult] = (
+            result_cache if result_cache is not None
+            else LRUCache(max_entries=SKILL_RESULT_CACHE_MAX_ENTRIES)
+        )
+
+    @property
+    def result_cache(self) -> LRUCache[SkillResultKey, SkillResult]:
+        """
+        Get the cache of the transformed skills.
+
+        The cached skills are returned to every call as-is, so they must not be modified.
+        Check ``result_cache.stats`` for the hit statistics. Clear it if the assets are changed.
+        """
+        return self._result_cache
+
+    # region Assets & Loaders
+    # Accessed through the asset manager on demand, so only the assets used get loaded if it's lazy
+
+    @property
+    def _asset_ability(self) -> AbilityAsset:
+        return self._asset_manager.asset_ability_data
+
+    @property
+    def _asset_action_cond(self) -> ActionConditionAsset:
+        return self._asset_manager.asset_action_cond
+
+    @property
+    def _asset_buff_count(self) -> BuffCountAsset:
+        return self._asset_manager.asset_buff_count
 
-        self._asset_ability = asset_manager.asset_ability_data
-        self._asset_action_cond = asset_manager.asset_action_cond
-        self._asset_buff_count = asset_manager.asset_buff_count
-        self._asset_chara_data = asset_manager.asset_chara_data
-        self._asset_dragon_data = asset_manager.asset_dragon_data
-        self._asset_hit_attr = asset_manager.asset_hit_attr
-        self._asset_action_info_player = asset_manager.asset_action_info_player
-        self._asset_skill = asset_manager.asset_skill_data
+    @property
+    def _asset_dragon_data(self) -> DragonDataAsset:
+        return self._asset_manager.asset_dragon_data
+
+    @property
+    def _asset_hit_attr(self) -> HitAttrAsset:
+        return self._asset_manager.asset_hit_attr
+
+    @property
+    def _asset_action_info_player(self) -> PlayerActionInfoAsset:
+        return self._asset_manager.asset_action_info_player
+
+    @property
+    def _asset_skill(self) -> SkillDataAsset:
+        return self._asset_manager.asset_skill_data
 
-        self._loader_action = asset_manager.loader_action
-        self._loader_chara_motion = asset_manager.loader_chara_motion
-        self._loader_dragon_motion = asset_manager.loader_dragon_motion
+    @property
+    def _loader_action(self) -> "ActionFileLoader":
+        return self._asset_manager.loader_action
+
+    @property
+    def _loader_chara_motion(self) -> "CharacterMotionLoader":
+        return self._asset_manager.loader_chara_motion
+
+    @property
+    def _loader_dragon_motion(self) -> "DragonMotionLoader":
+        return self._asset_manager.loader_dragon_motion
+
+    @property
+    def _skill_unit_index(self) -> "SkillUnitIndex":
+        return self._asset_manager.skill_unit_index
+
+    # endregion
 
     def _get_hit_data_from_hit_attr(
             self, hit_data_cls: Type[T], action_id: int, ability_ids: list[int],
@@ -292,11 +432,9 @@ class SkillTransformer:
         ret: HitDataList = []
 
         for hit_data in hit_data_list:
-            hit_label_shifted = make_hit_label(hit_data.hit_attr.id, shifted=True)
-
             ability_data = hit_data.ability_data or []
 
-            hit_attr = self._asset_hit_attr.get_data_by_id(hit_label_shifted)
+            hit_attr = self._asset_hit_attr.get_label_variant(hit_data.hit_attr.id, shifted=True)
             if not hit_attr:
                 # Because the ability variant for hit attr shift does not have target action assigned,
                 # skipping non-existed hit attribute is likely to mean "no enhanced hit attribute available"
@@ -338,13 +476,7 @@ class SkillTransformer:
         :raises SkillDataNotFoundError: if the skill data of `skill_id` is not found
         """
         # Get the unit data
-        rev_result: Optional[SkillReverseSearchResult] = self._asset_chara_data.get_unit_data_by_skill_id(
-            self._asset_manager, skill_id
-        )
-        if not rev_result:
-            rev_result = self._asset_dragon_data.get_unit_data_by_skill_id(
-                self._asset_manager, skill_id, is_dragon=True
-            )
+        rev_result: Optional[SkillReverseSearchResult] = self._skill_unit_index.get(skill_id)
 
         # Error on not found
         if not rev_result:
@@ -516,6 +648,30 @@ class SkillTransformer:
             self._loader_chara_motion, unit_data, prefab, pre_conditions
         )
 
+    @staticmethod
+    def _make_result_key(
+            method_name: str, skill_id: int, max_lv: int = 0, ability_ids: Optional[list[int]] = None,
+            is_exporting: bool = False
+    ) -> SkillResultKey:
+        return method_name, skill_id, max_lv, tuple(ability_ids or ()), is_exporting
+
+    def _transform_cached(
+            self, key: SkillResultKey, fn_transform: Callable[[], DT]
+    ) -> DT:
+        if (result := self._result_cache.get(key)) is None:
+            try:
+                result = fn_transform()
+            except AppValueError as ex:
+                # Errors depend on the assets only, so the same error will be raised again
+                result = _SkillResultError.from_error(ex)
+
+            self._result_cache.put(key, result)
+
+        if isinstance(result, _SkillResultError):
+            raise result.make_error()
+
+        return result
+
     def transform_supportive(
             self, skill_id: int, max_lv: int = 0, ability_ids: Optional[list[int]] = None
     ) -> SupportiveSkillData:
@@ -528,18 +684,27 @@ class SkillTransformer:
         ``ability_ids`` are the ability IDs to be additionally considered when parsing the skills.
         When the user enhance their skills via the character ability, this will be required to get the accurate result.
 
+        The result is cached, so the same object is returned to every call with the same arguments.
+        The result must not be modified, or the later calls get the modified result.
+        Errors raised are also cached.
+
         :raises SkillDataNotFoundError: if the skill data is not found
         :raises ActionDataNotFoundError: if the action data file of the skill is not found
         :raises HitDataUnavailableError: if no hit data is available
         """
-        skill_hit_data = self.get_skill_hit_data(
-            skill_id, BuffingHitData,
-            effective_to_enemy=False, max_lv=max_lv, ability_ids=ability_ids
-        )
+        def transform() -> SupportiveSkillData:
+            skill_hit_data = self.get_skill_hit_data(
+                skill_id, BuffingHitData,
+                effective_to_enemy=False, max_lv=max_lv, ability_ids=ability_ids
+            )
 
-        return SupportiveSkillData(
-            asset_manager=self._asset_manager,
-            skill_hit_data=skill_hit_data
+            return SupportiveSkillData(
+                asset_manager=self._asset_manager,
+                skill_hit_data=skill_hit_data
+            )
+
+        return self._transform_cached(
+            self._make_result_key("transform_supportive", skill_id, max_lv, ability_ids), transform
         )
 
     def transform_attacking(
@@ -562,22 +727,130 @@ class SkillTransformer:
         Setting this to ``False`` can give you a quick overview of the skill,
         if iterating through all the possible conditions.
 
+        The result is cached, so the same object is returned to every call with the same arguments.
+        The result must not be modified, or the later calls get the modified result.
+        Errors raised are also cached.
+
         :raises SkillDataNotFoundError: if the skill data is not found
         :raises ActionDataNotFoundError: if the action data file of the skill is not found
         :raises HitDataUnavailableError: if no hit data is available
         """
-        skill_hit_data = self.get_skill_hit_data(
-            skill_id, DamagingHitData, max_lv=max_lv, ability_ids=ability_ids
-        )
+        def transform() -> AttackingSkillData:
+            skill_hit_data = self.get_skill_hit_data(
+                skill_id, DamagingHitData, max_lv=max_lv, ability_ids=ability_ids
+            )
+
+            ret: AttackingSkillData = AttackingSkillData(
+                asset_manager=self._asset_manager,
+                skill_hit_data=skill_hit_data,
+                is_exporting=is_exporting
+            )
 
-        ret: AttackingSkillData = AttackingSkillData(
-            asset_manager=self._asset_manager,
-            skill_hit_data=skill_hit_data,
-            is_exporting=is_exporting
+            if not any(entry.has_effects_on_enemy for entry in ret.get_all_possible_entries()):
+                # All effects does not target enemy at all level
+                raise HitDataUnavailableError()
+
+            return ret
+
+        return self._transform_cached(
+            self._make_result_key("transform_attacking", skill_id, max_lv, ability_ids, is_exporting), transform
         )
 
-        if not any(entry.has_effects_on_enemy for entry in ret.get_all_possible_entries()):
-            # All effects does not target enemy at all level
-            raise HitDataUnavailableError()
+    def _transform_one(
+            self, method_name: str, args: SkillTransformArgs, kwargs: dict[str, Any]
+    ) -> SkillTransformResult:
+        try:
+            return SkillTransformResult(*args, skill_data=getattr(self, method_name)(*args, **kwargs))
+        except SKIPPABLE_TRANSFORM_ERRORS as ex:
+            return SkillTransformResult(*args, skip_error_type=type(ex), skip_message=str(ex))
 
-        return ret
+    def _transform_many(
+            self, method_name: str, args_iter: Iterable[SkillTransformArgs], workers: int, kwargs: dict[str, Any]
+    ) -> list[SkillTransformResult]:
+        global _worker_transformer  # pylint: disable=global-statement
+
+        args_list = list(args_iter)
+        results: list[Optional[SkillTransformResult]] = [None] * len(args_list)
+
+        use_workers = workers > 1 and "fork" in multiprocessing.get_all_start_methods()
+        pending_idx: list[int] = []  # Indexes of the args to be transformed by the workers
+
+        for idx, args in enumerate(args_list):
+            if use_workers and self._make_result_key(method_name, *args, **kwargs) not in self._result_cache:
+                pending_idx.append(idx)
+                continue
+
+            results[idx] = self._transform_one(method_name, args, kwargs)
+
+        if not pending_idx:
+            return results
+
+        _worker_transformer = self
+
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as executor:
+                chunk_size = max(1, len(pending_idx) // (workers * 4))
+                worker_results = list(executor.map(
+                    _transform_in_worker,
+                    [method_name] * len(pending_idx), [args_list[idx] for idx in pending_idx],
+                    [kwargs] * len(pending_idx),
+                    chunksize=chunk_size
+                ))
+        finally:
+            _worker_transformer = None
+
+        for idx, (skill_data, skip_error, is_failed) in zip(pending_idx, worker_results):
+            args = args_list[idx]
+
+            if is_failed:
+                # Raises the error in this process
+                results[idx] = self._transform_one(method_name, args, kwargs)
+                continue
+
+            # Skip errors are cached as well, same as transforming the skills in this process
+            key = self._make_result_key(method_name, *args, **kwargs)
+
+            if skip_error:
+                self._result_cache.put(key, skip_error)
+                results[idx] = SkillTransformResult(
+                    *args, skip_error_type=skip_error.error_type, skip_message=str(skip_error.make_error())
+                )
+                continue
+
+            skill_data.asset_manager = self._asset_manager
+            self._result_cache.put(key, skill_data)
+            results[idx] = SkillTransformResult(*args, skill_data=skill_data)
+
+        return results
+
+    def transform_supportive_many(
+            self, args_iter: Iterable[SkillTransformArgs], /, workers: int = 1
+    ) -> list[SkillTransformResult[SupportiveSkillData]]:
+        """
+        Transform the skills of ``args_iter`` to :class:`SupportiveSkillData`.
+
+        Check ``transform_attacking_many()`` for the details.
+        """
+        return self._transform_many("transform_supportive", args_iter, workers, {})
+
+    def transform_attacking_many(
+            self, args_iter: Iterable[SkillTransformArgs], /, workers: int = 1, is_exporting: bool = True
+    ) -> list[SkillTransformResult[AttackingSkillData]]:
+        """
+        Transform the skills of ``args_iter`` to :class:`AttackingSkillData`.
+
+        Each element of ``args_iter`` is the skill ID, the max level and the ability IDs of a skill,
+        which are the same as the arguments of ``transform_attacking()``.
+
+        The results are in the same order as ``args_iter``.
+        Skills failed with any of ``SKIPPABLE_TRANSFORM_ERRORS`` are reported as skipped in their results.
+        Any other error is raised.
+
+        If ``workers`` is greater than 1, the skills are transformed by a process pool with ``workers`` processes.
+        The worker processes inherit the asset manager by forking,
+        so the skills are transformed serially if forking is not available on the platform.
+        The results are identical either way, and are cached as if they are transformed serially.
+
+        The skill data in the results are shared with the other calls, so they must not be modified.
+        """
+        return self._transform_many("transform_attacking", args_iter, workers, {"is_exporting": is_exporting})
@@ -1,8 +1,11 @@
 """Util functions."""
 from .ability import get_ability_data_to_shift_hit_attr
+from .cache import CacheStats, LRUCache
 from .calc import multiply_matrix, multiply_vector
 from .game import calculate_crisis_mod
-from .hit_label import get_hit_label_data, make_hit_label
-from .misc import remove_duplicates_preserve_order, time_exec
+from .hit_label import HitLabelData, clear_hit_label_tables, get_hit_label_data, make_hit_label
+from .json_backend import JsonBackend, dump_json, get_json_backend, load_json, set_json_backend
+from .json_stream import JsonFieldSelection, JsonStreamReader, select_json_fields
+from .misc import get_deep_size, remove_duplicates_preserve_order, time_exec
 from .path import localize_asset_path, localize_path, make_path
 from .string import is_url
@@ -0,0 +1,200 @@
+"""Size-bounded in-memory cache with LRU eviction."""
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+from .misc import get_deep_size
+
+__all__ = ("LRUCache", "CacheStats")
+
+KT = TypeVar("KT", bound=Hashable)
+VT = TypeVar("VT")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Statistics of a cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+
+    entry_count: int
+    size_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of the lookups that hit the cache. ``0`` if there is no lookup."""
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0
+
+
+class LRUCache(Generic[KT, VT]):
+    """
+    Size-bounded cache evicting the least recently used entries.
+
+    The cache is bounded by the total size of the values in bytes, the count of the entries, or both.
+    Measuring the sizes is opt-in. The size of each value is measured once when it is stored, unless the size is given.
+    Values growing after being stored are not measured again, so ``max_bytes`` is only approximate for these.
+
+    ``None`` is a valid value. It can be stored as a negative entry, for example, to mark a key as not found.
+    Use ``cache[key]`` or ``get()`` with a sentinel default to tell a negative entry from a missing one.
+
+    A single instance can be shared by multiple owners to share the memory budget,
+    as long as their keys do not collide.
+    """
+
+    def __init__(
+            self, /, max_bytes: Optional[int] = None, max_entries: Optional[int] = None,
+            fn_get_size: Optional[Callable[[VT], int]] = None
+    ):
+        """
+        Initializes a cache holding at most ``max_bytes`` bytes and ``max_entries`` entries.
+
+        ``None`` on any of the limits means unbounded.
+
+        ``fn_get_size`` returns the size of a value in bytes.
+        If not given, the values are measured by ``get_deep_size()`` if ``max_bytes`` is given.
+        Otherwise, the values are not measured, and their sizes are ``0``.
+        """
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._fn_get_size: Optional[Callable[[VT], int]] = (
+            fn_get_size if fn_get_size is not None or max_bytes is None else get_deep_size
+        )
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[KT, tuple[VT, int]] = OrderedDict()  # V = value, size in bytes
+        self._size_bytes: int = 0
+
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: KT) -> bool:
+        # Checking the existence does not count as a lookup nor refreshes the entry
+        return key in self._entries
+
+    def __getitem__(self, key: KT) -> VT:
+        """
+        Get the value of ``key`` and mark it as the most recently used.
+
+        :raises KeyError: if `key` is not cached
+        """
+        with self._lock:
+            if key not in self._entries:
+                self._misses += 1
+                raise KeyError(key)
+
+            self._hits += 1
+            self._entries.move_to_end(key)
+
+            return self._entries[key][0]
+
+    def __setitem__(self, key: KT, value: VT) -> None:
+        self.put(key, value)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} ({len(self)} entries, {self._size_bytes} bytes)>"
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        """Maximum total size of the values in bytes. ``None`` if unbounded."""
+        return self._max_bytes
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        """Maximum count of the entries. ``None`` if unbounded."""
+        return self._max_entries
+
+    @property
+    def fn_get_size(self) -> Optional[Callable[[VT], int]]:
+        """Function measuring the size of a value in bytes. ``None`` if the values are not measured."""
+        return self._fn_get_size
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the cached values in bytes."""
+        return self._size_bytes
+
+    @property
+    def stats(self) -> CacheStats:
+        """Get the statistics of the cache."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits, misses=self._misses, evictions=self._evictions,
+                entry_count=len(self._entries), size_bytes=self._size_bytes
+            )
+
+    def reset_stats(self) -> None:
+        """Reset the hit, miss and eviction counters."""
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def get(self, key: KT, default: Optional[VT] = None) -> Optional[VT]:
+        """Get the value of ``key`` and mark it as the most recently used. Returns ``default`` if not cached."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def _evict(self) -> None:
+        # Caller should hold the lock
+        while self._entries and (
+                (self._max_bytes is not None and self._size_bytes > self._max_bytes)
+                or (self._max_entries is not None and len(self._entries) > self._max_entries)
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._size_bytes -= size
+            self._evictions += 1
+
+    def put(self, key: KT, value: VT, /, size: Optional[int] = None) -> bool:
+        """
+        Store ``value`` as ``key`` and mark it as the most recently used.
+
+        ``size`` is the size of ``value`` in bytes measured in advance by ``fn_get_size``.
+        If not given, ``value`` is measured here.
+
+        The least recently used entries are evicted until the cache is within its limits.
+
+        Returns ``False`` if the value alone exceeds ``max_bytes``, which is not cached then.
+        """
+        if size is None:
+            size = self._fn_get_size(value) if self._fn_get_size is not None else 0
+
+        with self._lock:
+            if (old_entry := self._entries.pop(key, None)) is not None:
+                self._size_bytes -= old_entry[1]
+
+            if self._max_bytes is not None and size > self._max_bytes:
+                return False
+
+            self._entries[key] = (value, size)
+            self._size_bytes += size
+
+            self._evict()
+
+        return True
+
+    def invalidate(self, key: KT) -> bool:
+        """Remove the entry of ``key``. Returns ``False`` if ``key`` is not cached."""
+        with self._lock:
+            if (entry := self._entries.pop(key, None)) is None:
+                return False
+
+            self._size_bytes -= entry[1]
+
+        return True
+
+    def clear(self) -> None:
+        """Remove all entries. The statistics are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
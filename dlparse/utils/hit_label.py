@@ -1,11 +1,17 @@
-"""Utils for processing the hit attribute labels."""
+"""
+Utils for processing the hit attribute labels.
+
+Each distinct label is parsed once. The parsed data and the made labels are kept in process-wide tables,
+so the repeated calls are dictionary lookups. The label strings in the tables are interned.
+"""
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
-__all__ = ("get_hit_label_data", "make_hit_label")
+__all__ = ("HitLabelData", "get_hit_label_data", "make_hit_label", "clear_hit_label_tables")
 
 
-@dataclass
+@dataclass(frozen=True)
 class HitLabelData:
     """A data class representing the attributes of a hit label."""
 
@@ -16,8 +22,11 @@ class HitLabelData:
     shifted: bool
 
 
-def get_hit_label_data(label: str) -> HitLabelData:
-    """Get the attributes of the hit ``label``."""
+_label_data_table: dict[str, HitLabelData] = {}  # K = label
+_made_label_table: dict[tuple[str, Optional[int], Optional[bool]], str] = {}  # K = label, level, shifted
+
+
+def _parse_hit_label(label: str) -> HitLabelData:
     parts = label.split("_")
 
     original_parts = []
@@ -34,7 +43,15 @@ def get_hit_label_data(label: str) -> HitLabelData:
 
         original_parts.append(part)
 
-    return HitLabelData(raw=label, original="_".join(original_parts), level=level, shifted=shifted)
+    return HitLabelData(raw=label, original=sys.intern("_".join(original_parts)), level=level, shifted=shifted)
+
+
+def get_hit_label_data(label: str) -> HitLabelData:
+    """Get the attributes of the hit ``label``."""
+    if (label_data := _label_data_table.get(label)) is None:
+        label_data = _label_data_table[sys.intern(label)] = _parse_hit_label(label)
+
+    return label_data
 
 
 def make_hit_label(label: str, /, level: Optional[int] = None, shifted: Optional[bool] = None) -> str:
@@ -46,13 +63,26 @@ def make_hit_label(label: str, /, level: Optional[int] = None, shifted: Optional
 
     Nothing related will change if the corresponding property is not specified.
     """
+    key = (label, level, shifted)
+
+    if (label_made := _made_label_table.get(key)) is not None:
+        return label_made
+
     label_data = get_hit_label_data(label)
-    label = label_data.original
+    label_made = label_data.original
 
     if shifted or (shifted is None and label_data.shifted):
-        label += "_HAS"
+        label_made += "_HAS"
 
     if label_lv := level or label_data.level:
-        label += f"_LV{label_lv:02}"
+        label_made += f"_LV{label_lv:02}"
+
+    label_made = _made_label_table[key] = sys.intern(label_made)
+
+    return label_made
+
 
-    return label
+def clear_hit_label_tables() -> None:
+    """Clear the tables of the parsed labels and the made labels."""
+    _label_data_table.clear()
+    _made_label_table.clear()
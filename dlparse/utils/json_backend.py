@@ -0,0 +1,88 @@
+"""
+Json backend used for reading and writing all json files.
+
+A faster json library (``orjson``) is used for reading if installed.
+Otherwise, the standard library :mod:`json` is used.
+"""
+import json
+from enum import Enum
+from json import JSONEncoder
+from typing import Any, Optional, TextIO, Type
+
+from dlparse.errors import ConfigError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # pylint: disable=invalid-name
+
+__all__ = ("JsonBackend", "get_json_backend", "set_json_backend", "load_json", "dump_json")
+
+
+class JsonBackend(Enum):
+    """Available json backends."""
+
+    STDLIB = "stdlib"
+    ORJSON = "orjson"
+
+    @property
+    def is_available(self) -> bool:
+        """Check if the backend can be used."""
+        if self == JsonBackend.ORJSON:
+            return orjson is not None
+
+        return True
+
+
+_backend: JsonBackend = JsonBackend.ORJSON if JsonBackend.ORJSON.is_available else JsonBackend.STDLIB
+
+
+def get_json_backend() -> JsonBackend:
+    """Get the json backend in use."""
+    return _backend
+
+
+def set_json_backend(backend: JsonBackend) -> None:
+    """
+    Set the json backend to use.
+
+    :raises ConfigError: if ``backend`` is not available
+    """
+    global _backend  # pylint: disable=global-statement,invalid-name
+
+    if not backend.is_available:
+        raise ConfigError(f"Json backend `{backend.value}` is not available")
+
+    _backend = backend
+
+
+def load_json(file_like: TextIO, /, backend: Optional[JsonBackend] = None) -> Any:
+    """
+    Read and decode the json document from ``file_like``.
+
+    Uses the backend set by ``set_json_backend()`` if ``backend`` is not given.
+    """
+    content = file_like.read()
+
+    if (backend or _backend) == JsonBackend.ORJSON:
+        try:
+            return orjson.loads(content)  # pylint: disable=no-member
+        except orjson.JSONDecodeError:  # pylint: disable=no-member
+            # `orjson` is stricter than the standard library, for example, `NaN` is not accepted
+            pass
+
+    return json.loads(content)
+
+
+def dump_json(obj: Any, file_like: TextIO, /, encoder_cls: Optional[Type[JSONEncoder]] = None) -> None:
+    """
+    Encode ``obj`` as json and write it to ``file_like``.
+
+    The keys will be sorted and the non-ascii characters are kept as-is.
+
+    The output always comes from the standard library, regardless of the backend in use,
+    because ``orjson`` cannot produce the same separators and float representations.
+    The whole document is encoded at once, so the C encoder of the standard library is used,
+    which is much faster than ``json.dump()`` that writes the document chunk by chunk.
+    """
+    file_like.write(json.dumps(obj, cls=encoder_cls, ensure_ascii=False, sort_keys=True))
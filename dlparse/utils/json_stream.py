@@ -0,0 +1,255 @@
+"""Utils to incrementally read a json document, or to select its fields."""
+import json
+import re
+from json import JSONDecodeError
+from typing import Any, Iterator, TextIO, Union
+
+__all__ = ("JsonStreamReader", "JsonFieldSelection", "select_json_fields")
+
+_WHITESPACES = re.compile(r"[ \t\n\r]*")
+
+# Characters which may appear in a number, used to check if a number is cut by the end of the buffer
+_NUMBER_CHARS = re.compile(r"[-+0-9.eE]*")
+
+JsonFieldSelection = Union[bool, dict[str, "JsonFieldSelection"]]
+"""
+Fields to be read by ``JsonStreamReader.read_selected()`` or ``select_json_fields()``.
+
+``True`` reads the whole value, and ``False`` skips it. A :class:`dict` reads the fields in its keys from an object,
+using the corresponding values as the selection of each field.
+The selection of an array applies to each of its elements.
+"""
+
+
+def select_json_fields(value: Any, selection: JsonFieldSelection) -> Any:
+    """
+    Get the fields in ``selection`` of the decoded json ``value``.
+
+    This gives the same result as ``JsonStreamReader.read_selected()`` reading ``value``.
+    """
+    if selection is True:
+        return value
+
+    if selection is False:
+        return None
+
+    if isinstance(value, dict):
+        return {
+            key: select_json_fields(value_field, selection[key])
+            for key, value_field in value.items()
+            if selection.get(key, False) is not False
+        }
+
+    if isinstance(value, list):
+        return [select_json_fields(element, selection) for element in value]
+
+    return value
+
+
+class JsonStreamReader:
+    """
+    Pull-style reader to incrementally read a json document from a file-like object.
+
+    Only a small window of the document is kept in the memory.
+    Objects and arrays are walked using ``iter_object()`` and ``iter_array()``,
+    so the caller decides which values to be decoded as a whole.
+
+    For example, the code below only keeps a single entry of ``dict.entriesValue`` decoded at a time:
+
+    >>> reader = JsonStreamReader(file_like)
+    >>> for key in reader.iter_object():
+    ...     if key != "dict":
+    ...         reader.skip_value()
+    ...         continue
+    ...
+    ...     for key_dict in reader.iter_object():
+    ...         if key_dict != "entriesValue":
+    ...             reader.skip_value()
+    ...             continue
+    ...
+    ...         for entry in reader.iter_array():
+    ...             process(entry)
+    """
+
+    def __init__(self, file_like: TextIO, /, chunk_size: int = 1 << 16):
+        self._file_like = file_like
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+
+        self._buffer: str = ""
+        self._pos: int = 0
+        self._eof: bool = False
+
+    def _read_more(self) -> bool:
+        """Read more data into the buffer. Returns ``False`` if the end of the file is reached."""
+        if self._eof:
+            return False
+
+        # Drop the consumed data
+        self._buffer = self._buffer[self._pos:]
+        self._pos = 0
+
+        # Read at least the size of the buffer, so a large value does not get decoded too many times
+        chunk = self._file_like.read(max(self._chunk_size, len(self._buffer)))
+        if not chunk:
+            self._eof = True
+            return False
+
+        self._buffer += chunk
+        return True
+
+    def _peek(self) -> str:
+        """Get the next non-whitespace character without consuming it."""
+        while True:
+            self._pos = _WHITESPACES.match(self._buffer, self._pos).end()
+
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+
+            if not self._read_more():
+                raise JSONDecodeError("Unexpected end of data", self._buffer, self._pos)
+
+    def _consume(self, expected: str) -> str:
+        """
+        Consume the next non-whitespace character, which must be one of ``expected``.
+
+        :raises JSONDecodeError: if the next character is not any of ``expected``
+        """
+        char = self._peek()
+
+        if char not in expected:
+            raise JSONDecodeError(f"Expecting any of `{expected}`", self._buffer, self._pos)
+
+        self._pos += 1
+        return char
+
+    def read_value(self) -> Any:
+        """
+        Read and decode the next value as a whole.
+
+        :raises JSONDecodeError: if the next value is malformed
+        """
+        self._peek()
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except JSONDecodeError:
+                # The value may be incomplete in the buffer
+                if self._read_more():
+                    continue
+
+                raise
+
+            if (
+                    self._buffer[self._pos] in "-0123456789"
+                    and _NUMBER_CHARS.match(self._buffer, self._pos).end() == len(self._buffer)
+                    and self._read_more()
+            ):
+                # A number reaching the end of the buffer may be truncated, for example, ``1.`` of ``1.5``
+                continue
+
+            self._pos = end
+            return value
+
+    def skip_value(self) -> None:
+        """
+        Skip the next value.
+
+        The value is still decoded by the C decoder, then discarded.
+        This is faster than scanning through the value in Python.
+        """
+        self.read_value()
+
+    def read_selected(self, selection: JsonFieldSelection) -> Any:
+        """
+        Read the next value, decoding only the fields in ``selection``. Other fields are skipped.
+
+        Check :class:`JsonFieldSelection` for the format of ``selection``.
+        Fields in ``selection`` but not in the data, and fields selected as ``False`` are absent in the return.
+        Returns ``None`` if ``selection`` is ``False``.
+
+        :raises JSONDecodeError: if the next value is malformed
+        """
+        if selection is True:
+            return self.read_value()
+
+        if selection is False:
+            self.skip_value()
+            return None
+
+        char = self._peek()
+
+        if char == "{":
+            ret = {}
+
+            for key in self.iter_object():
+                if selection.get(key, False) is not False:
+                    ret[key] = self.read_selected(selection[key])
+                else:
+                    self.skip_value()
+
+            return ret
+
+        if char == "[":
+            return list(self._iter_array_selected(selection))
+
+        return self.read_value()
+
+    def _iter_array_selected(self, selection: JsonFieldSelection) -> Iterator[Any]:
+        self._consume("[")
+
+        if self._peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            yield self.read_selected(selection)
+
+            if self._consume(",]") == "]":
+                return
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Walk through the next object and yield its keys.
+
+        The value of each key **must** be consumed by the caller before the iteration continues,
+        by calling any of ``read_value()``, ``skip_value()``, ``iter_object()`` or ``iter_array()``.
+
+        :raises JSONDecodeError: if the next value is not an object or is malformed
+        """
+        self._consume("{")
+
+        if self._peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise JSONDecodeError("Expecting property name", self._buffer, self._pos)
+
+            self._consume(":")
+
+            yield key
+
+            if self._consume(",}") == "}":
+                return
+
+    def iter_array(self) -> Iterator[Any]:
+        """
+        Walk through the next array and yield its decoded elements one by one.
+
+        :raises JSONDecodeError: if the next value is not an array or is malformed
+        """
+        self._consume("[")
+
+        if self._peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            yield self.read_value()
+
+            if self._consume(",]") == "]":
+                return
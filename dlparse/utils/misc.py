@@ -1,9 +1,12 @@
 """Miscellaneous utility functions."""
+import sys
 import time
+from enum import Enum
 from functools import wraps
+from types import FunctionType, MethodType, ModuleType
 from typing import Any, Sequence, TypeVar
 
-__all__ = ("time_exec", "remove_duplicates_preserve_order")
+__all__ = ("time_exec", "remove_duplicates_preserve_order", "get_deep_size")
 
 
 def time_exec(title: str):
@@ -34,3 +37,49 @@ def remove_duplicates_preserve_order(seq: T) -> T:
     seq_type = type(seq)
 
     return seq_type(dict.fromkeys(seq))
+
+
+# Objects shared globally, which should not be counted as a part of any object
+_SHARED_TYPES = (type, Enum, FunctionType, MethodType, ModuleType)
+
+
+def get_deep_size(obj: Any) -> int:
+    """
+    Get the approximated size of ``obj`` in bytes.
+
+    This includes the container items and the attributes of the objects.
+    Classes, enums, functions and modules are shared globally, so they are not counted.
+    """
+    size = 0
+    seen: set[int] = set()
+    pending: list[Any] = [obj]
+
+    while pending:
+        current = pending.pop()
+
+        if id(current) in seen or isinstance(current, _SHARED_TYPES):
+            continue
+
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+
+        if isinstance(current, dict):
+            pending.extend(current.keys())
+            pending.extend(current.values())
+            continue
+
+        if isinstance(current, (list, tuple, set, frozenset)):
+            pending.extend(current)
+            continue
+
+        if hasattr(current, "__dict__"):
+            pending.append(current.__dict__)
+
+        for cls in type(current).__mro__:
+            slots = cls.__dict__.get("__slots__", ())
+
+            for slot in (slots,) if isinstance(slots, str) else slots:
+                if slot not in ("__dict__", "__weakref__") and hasattr(current, slot):
+                    pending.append(getattr(current, slot))
+
+    return size
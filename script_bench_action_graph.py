@@ -0,0 +1,44 @@
+import time
+
+from dlparse.enums import ActionEdgeType
+from dlparse.mono.loader import ActionGraph
+from dlparse.mono.manager import AssetManager
+from tests.static import PATH_LOCAL_ROOT_RESOURCES
+
+manager = AssetManager(PATH_LOCAL_ROOT_RESOURCES, lazy=True)
+
+
+def make_graph() -> ActionGraph:
+    return ActionGraph(manager.asset_action_info_player, manager.loader_action)
+
+
+def bench_queries(graph: ActionGraph) -> float:
+    _start = time.perf_counter()
+
+    for action_id in manager.asset_action_info_player.all_ids:
+        graph.get_reachable(action_id)
+        graph.get_chain(action_id, ActionEdgeType.COMBO_NEXT)
+
+    return time.perf_counter() - _start
+
+
+def main():
+    _start = time.perf_counter()
+    manager.loader_action.preload()
+    print(f"Preloaded the prefabs in {time.perf_counter() - _start:.3f} secs")
+
+    # Edges computed on the first query involving each action
+    print(f"Lazy queries:  {bench_queries(make_graph()) * 1000:>9.2f} ms")
+
+    # Edges computed by ``build()``, so the queries only traverse the cached edges
+    graph = make_graph()
+
+    _start = time.perf_counter()
+    built_count = graph.build()
+    print(f"Build:         {(time.perf_counter() - _start) * 1000:>9.2f} ms ({built_count} actions)")
+
+    print(f"Built queries: {bench_queries(graph) * 1000:>9.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+import sys
+from dataclasses import fields
+
+from dlparse.mono.asset.base import MasterAssetBase, MasterEntryBase
+from dlparse.mono.manager import AssetManager
+from tests.static import PATH_LOCAL_ROOT_RESOURCES
+
+manager = AssetManager(PATH_LOCAL_ROOT_RESOURCES, lazy=True)
+
+
+class _DictBackedEntry:
+    """Entry using the instance ``__dict__`` to store the fields, which is the layout before using slots."""
+
+
+def get_size_slotted(entry: MasterEntryBase) -> int:
+    # Slotted instances do not have ``__dict__``, so the size of the instance includes all the fields
+    return sys.getsizeof(entry) + (sys.getsizeof(entry.__dict__) if hasattr(entry, "__dict__") else 0)
+
+
+def get_size_dict_backed(entry: MasterEntryBase) -> int:
+    dict_backed = _DictBackedEntry()
+
+    for field in fields(entry):
+        setattr(dict_backed, field.name, getattr(entry, field.name))
+
+    return sys.getsizeof(dict_backed) + sys.getsizeof(dict_backed.__dict__)
+
+
+def report_entry_memory(asset_name: str, asset: MasterAssetBase):
+    entries = list(asset)
+
+    size_before = sum(get_size_dict_backed(entry) for entry in entries)
+    size_after = sum(get_size_slotted(entry) for entry in entries)
+
+    print(f"{asset_name:<25} | "
+          f"{len(entries):>7} entries | "
+          f"Before: {size_before / len(entries):>7.1f} B/entry | "
+          f"After: {size_after / len(entries):>7.1f} B/entry | "
+          f"Saved: {(size_before - size_after) / 1024 / 1024:>6.2f} MB")
+
+
+def main():
+    report_entry_memory("HitAttrAsset", manager.asset_hit_attr)
+    report_entry_memory("ActionConditionAsset", manager.asset_action_cond)
+    report_entry_memory("SkillDataAsset", manager.asset_skill_data)
+    report_entry_memory("CharaDataAsset", manager.asset_chara_data)
+    report_entry_memory("AbilityAsset", manager.asset_ability_data)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+import glob
+import io
+import os
+import time
+from typing import Callable
+
+from dlparse.utils import JsonBackend, dump_json, load_json
+from tests.static import PATH_LOCAL_ROOT_RESOURCES
+
+repeat_count = 3
+
+# Representative files of each asset shape
+file_patterns = {
+    "Master (hit attribute)": os.path.join("master", "PlayerActionHitAttribute.json"),
+    "Master (action condition)": os.path.join("master", "ActionCondition.json"),
+    "Master (text label)": os.path.join("master", "TextLabel.json"),
+    "Player action": os.path.join("actions", "PlayerAction_0010*.json"),
+    "Character motion": os.path.join("characters", "motion", "*.json"),
+    "Story": os.path.join("story", "**", "*.json"),
+}
+
+
+def time_fn(fn: Callable[[], None]) -> float:
+    _start = time.perf_counter()
+
+    for _ in range(repeat_count):
+        fn()
+
+    return (time.perf_counter() - _start) / repeat_count
+
+
+def bench_load(file_paths: list[str]) -> dict[JsonBackend, float]:
+    contents = []
+    for file_path in file_paths:
+        with open(file_path, encoding="utf-8") as f:
+            contents.append(f.read())
+
+    def load(backend: JsonBackend):
+        for content in contents:
+            load_json(io.StringIO(content), backend=backend)
+
+    return {backend: time_fn(lambda: load(backend)) for backend in JsonBackend if backend.is_available}
+
+
+def bench_dump(file_paths: list[str]) -> float:
+    objs = []
+    for file_path in file_paths:
+        with open(file_path, encoding="utf-8") as f:
+            objs.append(load_json(f))
+
+    def dump():
+        for obj in objs:
+            dump_json(obj, io.StringIO())
+
+    return time_fn(dump)
+
+
+def main():
+    for name, file_pattern in file_patterns.items():
+        file_paths = glob.glob(os.path.join(PATH_LOCAL_ROOT_RESOURCES, file_pattern), recursive=True)
+
+        if not file_paths:
+            print(f"{name:<25} | No file found")
+            continue
+
+        load_time = bench_load(file_paths)
+        dump_time = bench_dump(file_paths)
+
+        load_time_str = " | ".join(
+            f"Load ({backend.value}): {secs * 1000:>9.2f} ms" for backend, secs in load_time.items()
+        )
+        print(f"{name:<25} | {len(file_paths):>5} files | {load_time_str} | Dump: {dump_time * 1000:>9.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+import glob
+import os
+import time
+
+from dlparse.mono.asset import PlayerActionPrefab
+from dlparse.mono.loader import ActionFileLoader
+from tests.static import PATH_LOCAL_ROOT_RESOURCES
+
+skill_levels = [1, 2, 3, 4]
+repeat_count = 5
+
+
+def load_prefabs() -> list[PlayerActionPrefab]:
+    prefabs = []
+
+    for file_path in glob.glob(os.path.join(PATH_LOCAL_ROOT_RESOURCES, "actions", "PlayerAction_*.json")):
+        action_id = ActionFileLoader.extract_action_id(os.path.basename(file_path))
+
+        prefabs.append(PlayerActionPrefab(action_id, file_path))
+
+    return prefabs
+
+
+def bench_hit_actions(prefabs: list[PlayerActionPrefab]) -> float:
+    _start = time.perf_counter()
+
+    for prefab in prefabs:
+        for skill_lv in skill_levels:
+            prefab.get_hit_actions(skill_lv)
+
+    return time.perf_counter() - _start
+
+
+def main():
+    _start = time.perf_counter()
+    prefabs = load_prefabs()
+    print(f"Loaded {len(prefabs)} prefabs in {time.perf_counter() - _start:.3f} secs")
+
+    # The first pass builds the hit action tables, the later passes are lookups only
+    print(f"First pass: {bench_hit_actions(prefabs) * 1000:>9.2f} ms")
+
+    repeat_time = sum(bench_hit_actions(prefabs) for _ in range(repeat_count)) / repeat_count
+    print(f"Repeated:   {repeat_time * 1000:>9.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
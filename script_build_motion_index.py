@@ -0,0 +1,23 @@
+import os
+import time
+
+from dlparse.mono.loader import MotionStopTimeIndex, get_sources_fingerprint
+from tests.static import PATH_LOCAL_ROOT_RESOURCES
+
+chara_motion_dir = os.path.join(PATH_LOCAL_ROOT_RESOURCES, "characters", "motion")
+dragon_motion_dir = os.path.join(PATH_LOCAL_ROOT_RESOURCES, "dragon", "motion")
+index_path = os.path.join(".cache", "motion_index.json")
+
+
+def main():
+    _start = time.time()
+
+    index = MotionStopTimeIndex.build(chara_motion_dir, dragon_motion_dir)
+    index.save(index_path, fingerprint=get_sources_fingerprint([chara_motion_dir, dragon_motion_dir]))
+
+    print(f"Indexed {len(index)} controllers to {index_path}")
+    print(f"{time.time() - _start:.3f} secs")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,16 @@
 from dlparse.mono.manager import AssetManager
-from tests.static import PATH_LOCAL_DIR_CUSTOM_ASSET, PATH_LOCAL_ROOT_RESOURCES, get_remote_dir_root_resources
+from tests.static import (
+    PATH_LOCAL_DIR_CUSTOM_ASSET, PATH_LOCAL_DIR_NETWORK_CACHE, PATH_LOCAL_ROOT_RESOURCES,
+    get_remote_dir_root_resources,
+)
 
 version_tag = "2021.09.21-KKAtp8GrkgrG4Y72"
 
 manager_local = AssetManager(PATH_LOCAL_ROOT_RESOURCES, custom_asset_dir=PATH_LOCAL_DIR_CUSTOM_ASSET)
 manager_remote = AssetManager(
     get_remote_dir_root_resources(version_tag),
-    is_network_source=True, custom_asset_dir=PATH_LOCAL_DIR_CUSTOM_ASSET
+    is_network_source=True, custom_asset_dir=PATH_LOCAL_DIR_CUSTOM_ASSET,
+    network_cache_dir=PATH_LOCAL_DIR_NETWORK_CACHE
 )
 
 
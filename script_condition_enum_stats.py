@@ -0,0 +1,41 @@
+from dlparse.enums import ConditionEnumerationStats
+from dlparse.mono.manager import AssetManager
+from tests.static import PATH_LOCAL_DIR_CUSTOM_ASSET, PATH_LOCAL_ROOT_RESOURCES
+
+top_count = 30
+
+
+def collect_stats(asset_manager: AssetManager) -> dict[int, ConditionEnumerationStats]:
+    stats: dict[int, ConditionEnumerationStats] = {}  # K = skill ID
+
+    args_list = [
+        (skill_id, result.unit_data.max_skill_level(result.skill_id_entry.skill_num), None)
+        for skill_id, result in sorted(asset_manager.skill_unit_index.items())
+    ]
+
+    for result in asset_manager.transformer_skill.transform_attacking_many(args_list):
+        if result.is_skipped:
+            continue
+
+        _ = result.skill_data.possible_conditions  # Enumerate the conditions
+        stats[result.skill_id] = result.skill_data.possible_conditions_stats
+
+    return stats
+
+
+def main():
+    asset_manager = AssetManager(PATH_LOCAL_ROOT_RESOURCES, custom_asset_dir=PATH_LOCAL_DIR_CUSTOM_ASSET, lazy=True)
+    stats = collect_stats(asset_manager)
+
+    print(f"{'Skill ID':>10} {'Combinations':>12} {'Exclusive':>10} {'Duplicated':>10} {'Yielded':>8}")
+    for skill_id, skill_stats in sorted(stats.items(), key=lambda item: -item[1].combination_count)[:top_count]:
+        print(f"{skill_id:>10} {skill_stats.combination_count:>12} {skill_stats.pruned_exclusive_count:>10} "
+              f"{skill_stats.pruned_duplicate_count:>10} {skill_stats.yielded_count:>8}")
+
+    print()
+    print(f"Total combinations: {sum(skill_stats.combination_count for skill_stats in stats.values())}")
+    print(f"Total yielded: {sum(skill_stats.yielded_count for skill_stats in stats.values())}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,7 +3,10 @@ from typing import TYPE_CHECKING
 from dlparse.enums import Language
 from dlparse.mono.asset import CharaDataEntry, SkillDataEntry
 from dlparse.mono.manager import AssetManager
-from tests.static import PATH_LOCAL_DIR_CUSTOM_ASSET, PATH_LOCAL_ROOT_RESOURCES, get_remote_dir_root_resources
+from tests.static import (
+    PATH_LOCAL_DIR_CUSTOM_ASSET, PATH_LOCAL_DIR_NETWORK_CACHE, PATH_LOCAL_ROOT_RESOURCES,
+    get_remote_dir_root_resources,
+)
 
 if TYPE_CHECKING:
     from dlparse.mono.asset.base import MasterAssetBase
@@ -13,7 +16,8 @@ version_tag = "2022.01.25-dFWk3YFKQaLyBjKr"
 manager_local = AssetManager(PATH_LOCAL_ROOT_RESOURCES, custom_asset_dir=PATH_LOCAL_DIR_CUSTOM_ASSET)
 manager_remote = AssetManager(
     get_remote_dir_root_resources(version_tag),
-    is_network_source=True, custom_asset_dir=PATH_LOCAL_DIR_CUSTOM_ASSET
+    is_network_source=True, custom_asset_dir=PATH_LOCAL_DIR_CUSTOM_ASSET,
+    network_cache_dir=PATH_LOCAL_DIR_NETWORK_CACHE
 )
 
 
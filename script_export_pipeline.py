@@ -14,7 +14,7 @@ from dlparse.export import (
 )
 from dlparse.mono.manager import AssetManager
 from dlparse.transformer import AbilityTransformer
-from dlparse.utils import time_exec
+from dlparse.utils import LRUCache, time_exec
 
 T = TypeVar("T", bound=TranslatableEnumMixin)
 
@@ -38,7 +38,10 @@ class FileExporter:
         print(f"Export directory: {dir_export}")
         print()
 
-        self._asset_manager: AssetManager = AssetManager(dir_resource, custom_asset_dir=dir_custom)
+        # All prefabs are preloaded and used during the export, so the prefab cache is unbounded
+        self._asset_manager: AssetManager = AssetManager(
+            dir_resource, custom_asset_dir=dir_custom, prefab_cache=LRUCache()
+        )
         self._transformer_ability: AbilityTransformer = AbilityTransformer(self._asset_manager)
         self._dir_export: str = dir_export
 
@@ -102,9 +105,19 @@ class FileExporter:
             skip_unparsable=True
         )
 
+    @time_exec(title="Prefab preloading time")
+    def _preload_prefabs(self):
+        result = self._asset_manager.loader_action.preload(workers=os.cpu_count() or 1)
+
+        for failure in result.failures:
+            print(f"Prefab of action #{failure.action_id} unparsable: {failure.error}")
+
     @time_exec(title="Total exporting time")
     def export(self):
         """Export the parsed assets."""
+        # Parse the prefabs on all cores before the transformation starts
+        self._preload_prefabs()
+
         # Enums
         self._export_enums({"afflictions": cond_afflictions, "elements": cond_elements}, "conditions")
         self._export_enums_ex()
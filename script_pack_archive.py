@@ -0,0 +1,22 @@
+import os
+import time
+
+from dlparse.mono.asset.base import pack_archive
+from tests.static import PATH_LOCAL_ROOT_DATA
+
+# Pack both `assets` and `localized`, so the localized stories are also served from the archive
+source_dir = os.path.join(PATH_LOCAL_ROOT_DATA, "media")
+archive_path = os.path.join(".cache", "media.pack")
+
+
+def main():
+    _start = time.time()
+
+    file_count = pack_archive(source_dir, archive_path, compress=False)
+
+    print(f"Packed {file_count} files to {archive_path} ({os.path.getsize(archive_path) / 1024 / 1024:.2f} MB)")
+    print(f"{time.time() - _start:.3f} secs")
+
+
+if __name__ == '__main__':
+    main()
@@ -10,7 +10,7 @@ diff_str = """
 - 233011103
 """
 
-manager = AssetManager(PATH_LOCAL_ROOT_RESOURCES)
+manager = AssetManager(PATH_LOCAL_ROOT_RESOURCES, lazy=True)
 
 
 def print_enemy_info(enemy_form, padding=0):
@@ -1,7 +1,7 @@
 from dlparse.mono.manager import AssetManager
 from tests.static import PATH_LOCAL_ROOT_RESOURCES
 
-manager = AssetManager(PATH_LOCAL_ROOT_RESOURCES)
+manager = AssetManager(PATH_LOCAL_ROOT_RESOURCES, lazy=True)
 
 enemy_params_to_check = """
 - 97008501
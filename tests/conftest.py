@@ -5,9 +5,11 @@ from dlparse.transformer import (
     AbilityTransformer, AttackingActionTransformer,
     EnemyTransformer, InfoTransformer, QuestTransformer, SkillTransformer,
 )
-from tests.static import PATH_LOCAL_DIR_CUSTOM_ASSET, PATH_LOCAL_ROOT_RESOURCES
+from tests.static import PATH_LOCAL_DIR_CUSTOM_ASSET, PATH_LOCAL_DIR_SNAPSHOT, PATH_LOCAL_ROOT_RESOURCES
 
-_asset_manager: AssetManager = AssetManager(PATH_LOCAL_ROOT_RESOURCES, custom_asset_dir=PATH_LOCAL_DIR_CUSTOM_ASSET)
+_asset_manager: AssetManager = AssetManager(
+    PATH_LOCAL_ROOT_RESOURCES, custom_asset_dir=PATH_LOCAL_DIR_CUSTOM_ASSET, snapshot_dir=PATH_LOCAL_DIR_SNAPSHOT
+)
 
 
 # region Transformer fixtures
@@ -1,7 +1,8 @@
 import os
 
 __all__ = (
-    "PATH_LOCAL_ROOT_RESOURCES", "PATH_LOCAL_DIR_CUSTOM_ASSET",
+    "PATH_LOCAL_ROOT_RESOURCES", "PATH_LOCAL_DIR_CUSTOM_ASSET", "PATH_LOCAL_DIR_SNAPSHOT",
+    "PATH_LOCAL_DIR_NETWORK_CACHE",
     "get_remote_dir_root_resources", "get_remote_dir_root"
 )
 
@@ -10,6 +11,10 @@ PATH_LOCAL_ROOT_RESOURCES = os.path.join(PATH_LOCAL_ROOT_DATA, "media", "assets"
 
 PATH_LOCAL_DIR_CUSTOM_ASSET = os.path.join(PATH_LOCAL_ROOT_DATA, "custom")
 
+PATH_LOCAL_DIR_SNAPSHOT = os.path.join(".cache", "snapshot")
+
+PATH_LOCAL_DIR_NETWORK_CACHE = os.path.join(".cache", "network")
+
 PATH_REMOTE_GH = "https://raw.githubusercontent.com/RaenonX-DL/dragalia-data-depot/"
 
 REMOTE_VERSION_TAG = "2021.10.28-P5vciqNVlQONmeQr"
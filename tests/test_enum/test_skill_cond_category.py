@@ -1,7 +1,8 @@
 import pytest
 
 from dlparse.enums import (
-    Condition, ConditionCategories as CondCat, ConditionMaxCount as CondMax, Status,
+    Condition, ConditionCategories as CondCat, ConditionMaxCount as CondMax, Status, get_condition_mask,
+    iter_mask_conditions,
 )
 from dlparse.errors import EnumConversionError
 
@@ -80,3 +81,36 @@ def test_extract():
 
     assert CondCat.target_status.extract(condition) == {Condition.TARGET_POISONED}
     assert CondCat.target_status.extract([Condition.BULLET_HIT_1]) == set()
+
+
+def test_extract_mask():
+    mask = get_condition_mask([
+        Condition.TARGET_PARALYZED,
+        Condition.TARGET_STUNNED,
+        Condition.SELF_BUFF_10,
+        Condition.BULLET_HIT_1
+    ])
+
+    assert CondCat.target_status.extract_mask(mask) == {Condition.TARGET_PARALYZED, Condition.TARGET_STUNNED}
+    assert CondCat.self_buff_count.extract_mask(mask) == Condition.SELF_BUFF_10
+    assert CondCat.self_hp_status.extract_mask(mask) is None
+    assert CondCat.target_status.extract_mask(0) == set()
+
+
+def test_is_valid_mask():
+    assert CondCat.self_buff_count.is_valid_mask(get_condition_mask([Condition.SELF_BUFF_10, Condition.SELF_HP_1]))
+    assert not CondCat.self_buff_count.is_valid_mask(
+        get_condition_mask([Condition.SELF_BUFF_10, Condition.SELF_BUFF_20])
+    )
+    assert CondCat.target_status.is_valid_mask(
+        get_condition_mask([Condition.TARGET_POISONED, Condition.TARGET_BURNED])
+    )
+
+
+def test_mask_round_trip():
+    conditions = [Condition.SELF_BUFF_10, Condition.TARGET_POISONED, Condition.NONE]
+
+    assert list(iter_mask_conditions(get_condition_mask(conditions))) == \
+           [Condition.NONE, Condition.TARGET_POISONED, Condition.SELF_BUFF_10]
+    assert get_condition_mask([Condition.SELF_BUFF_10, Condition.SELF_BUFF_10]) == \
+           get_condition_mask([Condition.SELF_BUFF_10])
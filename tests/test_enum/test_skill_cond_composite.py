@@ -49,6 +49,17 @@ def test_composite_eq():
     assert ConditionComposite(Condition.SELF_HP_1) != ConditionComposite(Condition.SELF_HP_FULL)
     assert ConditionComposite([Condition.SELF_HP_1, Condition.BULLET_HIT_8]) \
            == ConditionComposite([Condition.BULLET_HIT_8, Condition.SELF_HP_1])
+    # Conditions not sorted do not affect the equality
+    assert ConditionComposite([Condition.SELF_HP_1, Condition.QUEST_START]) == ConditionComposite(Condition.SELF_HP_1)
+
+
+def test_composite_hash():
+    composite = ConditionComposite([Condition.SELF_HP_1, Condition.BULLET_HIT_8])
+
+    # Hash is the same as the hash of the sorted condition values, which is used in the exported unique IDs
+    assert hash(composite) == hash(tuple(sorted((Condition.SELF_HP_1.value, Condition.BULLET_HIT_8.value))))
+    assert hash(composite) == hash(ConditionComposite([Condition.BULLET_HIT_8, Condition.SELF_HP_1]))
+    assert len({composite, ConditionComposite([Condition.BULLET_HIT_8, Condition.SELF_HP_1])}) == 1
 
 
 def test_composite_add():
@@ -61,6 +72,17 @@ def test_composite_add():
         assert ConditionComposite(Condition.SELF_HP_1) + ConditionComposite(Condition.SELF_HP_FULL)
 
 
+def test_composite_add_subset():
+    composite = ConditionComposite([Condition.SELF_HP_1, Condition.SELF_BUFF_10])
+
+    assert composite + ConditionComposite(Condition.SELF_HP_1) == composite
+    assert ConditionComposite(Condition.SELF_HP_1) + composite == composite
+    assert composite + Condition.SELF_BUFF_10 == composite
+    assert (composite + Condition.COMBO_GTE_5).conditions_sorted == (
+        Condition.SELF_HP_1, Condition.COMBO_GTE_5, Condition.SELF_BUFF_10
+    )
+
+
 def test_composite_contains():
     assert ConditionComposite() in ConditionComposite()
     assert ConditionComposite() in ConditionComposite(Condition.SELF_HP_1)
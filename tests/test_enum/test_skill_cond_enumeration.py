@@ -0,0 +1,81 @@
+from itertools import product
+
+from dlparse.enums import Condition, ConditionComposite, ConditionEnumerationStats, iter_condition_composites
+
+
+def test_enumerate_all():
+    cond_elems = [
+        {
+            (Condition.TARGET_BURNED,), (Condition.TARGET_POISONED,),
+            (Condition.TARGET_BURNED, Condition.TARGET_POISONED), (),
+        },
+        {(Condition.SELF_HP_1,), (Condition.SELF_HP_FULL,)},
+    ]
+    stats = ConditionEnumerationStats()
+
+    composites = list(iter_condition_composites(cond_elems, stats=stats))
+
+    assert set(composites) == {
+        ConditionComposite(tuple(subitem for item in item_combination for subitem in item))
+        for item_combination in product(*cond_elems)
+    }
+    assert len(composites) == 8
+    assert stats == ConditionEnumerationStats(combination_count=8, yielded_count=8)
+
+
+def test_enumerate_empty():
+    assert list(iter_condition_composites([])) == [ConditionComposite()]
+    assert list(iter_condition_composites([{(Condition.SELF_HP_1,)}, set()])) == []
+
+
+def test_enumerate_prune_exclusive():
+    cond_elems = [
+        {(Condition.TARGET_BURNED, Condition.COMBO_GTE_0), (Condition.TARGET_BURNED, Condition.COMBO_GTE_30), ()},
+        {(Condition.COMBO_GTE_0,), (Condition.COMBO_GTE_30,)},
+        {(Condition.SELF_HP_1,), (Condition.SELF_HP_FULL,)},
+    ]
+    stats = ConditionEnumerationStats()
+
+    composites = list(iter_condition_composites(cond_elems, stats=stats))
+
+    assert set(composites) == {
+        ConditionComposite(conditions)
+        for conditions in [
+            (Condition.TARGET_BURNED, Condition.COMBO_GTE_0, Condition.SELF_HP_1),
+            (Condition.TARGET_BURNED, Condition.COMBO_GTE_0, Condition.SELF_HP_FULL),
+            (Condition.TARGET_BURNED, Condition.COMBO_GTE_30, Condition.SELF_HP_1),
+            (Condition.TARGET_BURNED, Condition.COMBO_GTE_30, Condition.SELF_HP_FULL),
+            (Condition.COMBO_GTE_0, Condition.SELF_HP_1),
+            (Condition.COMBO_GTE_0, Condition.SELF_HP_FULL),
+            (Condition.COMBO_GTE_30, Condition.SELF_HP_1),
+            (Condition.COMBO_GTE_30, Condition.SELF_HP_FULL),
+        ]
+    }
+    # Combo 0 with combo 30 (and vice versa) pruned with all HP conditions
+    assert stats == ConditionEnumerationStats(combination_count=12, pruned_exclusive_count=4, yielded_count=8)
+
+
+def test_enumerate_prune_duplicate():
+    cond_elems = [
+        {(Condition.TARGET_BURNED,), ()},
+        {(Condition.TARGET_BURNED,), ()},
+        {(Condition.SELF_HP_1,), (Condition.SELF_HP_FULL,)},
+    ]
+    stats = ConditionEnumerationStats()
+
+    composites = list(iter_condition_composites(cond_elems, stats=stats))
+
+    assert len(composites) == len(set(composites)) == 4
+    # (Burned, None) and (None, Burned) are the same as (Burned, Burned)
+    assert stats == ConditionEnumerationStats(combination_count=8, pruned_duplicate_count=4, yielded_count=4)
+
+
+def test_enumerate_deterministic():
+    options = [(Condition.TARGET_BURNED,), (Condition.TARGET_POISONED,), (Condition.TARGET_FROZEN,), ()]
+
+    enumerated = [
+        [composite.conditions_sorted for composite in iter_condition_composites([set(options_ordered)])]
+        for options_ordered in (options, options[::-1])
+    ]
+
+    assert enumerated[0] == enumerated[1]
@@ -0,0 +1,149 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+import pytest
+
+from dlparse.enums import ActionEdgeType, SkillCancelType
+from dlparse.errors import ActionDataNotFoundError
+from dlparse.mono.loader import ActionEdge, ActionGraph
+
+
+@dataclass
+class _ActionInfo:
+    id: int
+    next_action_id: int
+
+
+@dataclass
+class _ActiveCancel:
+    action_id: int
+    cancel_type: SkillCancelType = SkillCancelType.NONE
+    time_start: float = 0.5
+
+    @property
+    def has_specific_cancel_action(self) -> bool:
+        return self.action_id != 0
+
+
+@dataclass
+class _Prefab:
+    action_id: int
+    cancel_actions: list[_ActiveCancel] = field(default_factory=list)
+    component_cancel_to_next: Optional[object] = None
+
+
+class _ActionInfoAsset:
+    def __init__(self, *entries: _ActionInfo):
+        self._data = {entry.id: entry for entry in entries}
+
+    @property
+    def all_ids(self) -> set[int]:
+        return set(self._data)
+
+    def get_data_by_id(self, action_id: int) -> Optional[_ActionInfo]:
+        return self._data.get(action_id)
+
+
+class _ActionLoader:
+    def __init__(self, *prefabs: _Prefab):
+        self._prefabs = {prefab.action_id: prefab for prefab in prefabs}
+        self.load_count = 0
+
+    def get_prefab(self, action_id: int) -> _Prefab:
+        self.load_count += 1
+
+        if action_id not in self._prefabs:
+            raise ActionDataNotFoundError(action_id)
+
+        return self._prefabs[action_id]
+
+
+@pytest.fixture
+def loader() -> _ActionLoader:
+    return _ActionLoader(
+        # Normal attack combos: 100 -> 101 -> 102 -> 100
+        _Prefab(100, [_ActiveCancel(6), _ActiveCancel(101), _ActiveCancel(0)]),
+        _Prefab(101, [_ActiveCancel(900, SkillCancelType.FS), _ActiveCancel(102)]),
+        _Prefab(102, [_ActiveCancel(100)]),
+        # Skill: 200 -> 201 (next action), 201 -> 202 (cancel to next)
+        _Prefab(200),
+        _Prefab(201, component_cancel_to_next=object()),
+    )
+
+
+@pytest.fixture
+def graph(loader: _ActionLoader) -> ActionGraph:
+    asset = _ActionInfoAsset(_ActionInfo(200, 201), _ActionInfo(201, 202), _ActionInfo(202, 0))
+
+    # noinspection PyTypeChecker
+    return ActionGraph(asset, loader)
+
+
+def test_edges(graph: ActionGraph):
+    assert graph.get_edges(101) == [
+        ActionEdge(101, 900, ActionEdgeType.ACTIVE_CANCEL),
+        ActionEdge(101, 102, ActionEdgeType.ACTIVE_CANCEL),
+        ActionEdge(101, 102, ActionEdgeType.COMBO_NEXT),
+    ]
+    assert graph.get_edges(201) == [
+        ActionEdge(201, 202, ActionEdgeType.NEXT_ACTION),
+        ActionEdge(201, 202, ActionEdgeType.CANCEL_TO_NEXT),
+    ]
+
+
+def test_combo_next_excludes_common_actions(graph: ActionGraph):
+    assert graph.get_targets(100, ActionEdgeType.COMBO_NEXT) == (101,)
+
+
+def test_chain(graph: ActionGraph):
+    assert graph.get_chain(100, ActionEdgeType.COMBO_NEXT) == (100, 101, 102)
+    assert graph.get_chain(200, ActionEdgeType.NEXT_ACTION) == (200, 201, 202)
+
+
+def test_reachable(graph: ActionGraph):
+    assert graph.get_reachable(200) == {201, 202}
+    assert graph.get_reachable(200, [ActionEdgeType.CANCEL_TO_NEXT]) == set()
+    assert graph.is_reachable(100, 900)
+    assert not graph.is_reachable(100, 900, [ActionEdgeType.COMBO_NEXT])
+
+
+def test_cycle(graph: ActionGraph):
+    assert graph.is_in_cycle(100, [ActionEdgeType.COMBO_NEXT])
+    assert graph.has_cycle(100)
+    assert not graph.has_cycle(200)
+    assert not graph.is_in_cycle(900)
+
+
+def test_cached(graph: ActionGraph, loader: _ActionLoader):
+    graph.get_reachable(100)
+    load_count = loader.load_count
+
+    graph.get_reachable(100)
+    graph.get_chain(100, ActionEdgeType.COMBO_NEXT)
+
+    assert loader.load_count == load_count
+
+
+def test_build(graph: ActionGraph, loader: _ActionLoader):
+    # 100 -> 101 -> 102, 100 -> 6, 101 -> 900
+    assert graph.build([100]) == 5
+    load_count = loader.load_count
+
+    assert graph.get_reachable(100) == {6, 100, 101, 102, 900}
+    assert graph.get_chain(100, ActionEdgeType.COMBO_NEXT) == (100, 101, 102)
+    assert loader.load_count == load_count
+
+
+def test_build_all(graph: ActionGraph, loader: _ActionLoader):
+    # 200 -> 201 -> 202
+    assert graph.build() == 3
+    load_count = loader.load_count
+
+    assert graph.get_reachable(200) == {201, 202}
+    assert loader.load_count == load_count
+
+
+def test_next_action_without_prefab(graph: ActionGraph, loader: _ActionLoader):
+    graph.get_chain(200, ActionEdgeType.NEXT_ACTION)
+
+    assert loader.load_count == 0
@@ -0,0 +1,138 @@
+import os
+
+import pytest
+
+from dlparse.mono.asset import CheatDetectionAsset
+from dlparse.mono.asset.base import AssetArchive, get_file_like, mount_archive, pack_archive, unmount_archive
+from dlparse.mono.manager import AssetManager
+
+CHEAT_DETECTION_CONTENT = (
+    '{"dict": {"entriesValue": [{"_Id": 1, "_MaxEnemyDamage": 100000000, "_MaxEnemyBreakDamage": 100000000, '
+    '"_MaxEnemyPlayerDistance": 35, "_MaxPlayerHeal": 25000, "_MaxPlayerMoveSpeed": 10}], '
+    '"entriesKey": [1], "count": 1}}'
+)
+
+
+def make_source_dir(root_dir: str) -> str:
+    source_dir = os.path.join(root_dir, "resources")
+
+    files = {
+        os.path.join("actions", "PlayerAction_00100000.prefab.json"): '{"Components": []}',
+        os.path.join("story", "unitstory", "chara", "100001011.json"): '{"名前": "文字"}',
+        os.path.join("master", "CheatDetectionParam.json"): CHEAT_DETECTION_CONTENT,
+        os.path.join("master", "readme.txt"): "Not packed",
+    }
+
+    for file_path, content in files.items():
+        file_path = os.path.join(source_dir, file_path)
+
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+    return source_dir
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_pack_and_read(tmp_path, compress: bool):
+    source_dir = make_source_dir(str(tmp_path))
+    archive_path = os.path.join(str(tmp_path), "resources.pack")
+
+    assert pack_archive(source_dir, archive_path, compress=compress) == 3
+
+    archive = AssetArchive(archive_path)
+
+    assert len(archive) == 3
+    assert "master/readme.txt" not in archive
+    assert os.path.join("actions", "PlayerAction_00100000.prefab.json") in archive
+    assert archive.open("story/unitstory/chara/100001011.json").read() == '{"名前": "文字"}'
+    assert bytes(archive.get_bytes("master/CheatDetectionParam.json")) == CHEAT_DETECTION_CONTENT.encode("utf-8")
+
+    with pytest.raises(FileNotFoundError):
+        archive.get_bytes("master/Missing.json")
+
+    archive.close()
+
+
+def test_close_with_view_alive(tmp_path):
+    source_dir = make_source_dir(str(tmp_path))
+    archive_path = os.path.join(str(tmp_path), "resources.pack")
+    pack_archive(source_dir, archive_path)
+
+    archive = AssetArchive(archive_path)
+    content = archive.get_bytes("master/CheatDetectionParam.json")
+
+    archive.close()
+    archive.close()
+
+    # View is still usable after the archive is closed
+    assert bytes(content) == CHEAT_DETECTION_CONTENT.encode("utf-8")
+
+    content.release()
+
+
+def test_not_archive(tmp_path):
+    file_path = os.path.join(str(tmp_path), "invalid.pack")
+    with open(file_path, "wb") as f:
+        f.write(b"0" * 64)
+
+    with pytest.raises(ValueError):
+        AssetArchive(file_path)
+
+
+def test_mounted(tmp_path):
+    source_dir = make_source_dir(str(tmp_path))
+    archive_path = os.path.join(str(tmp_path), "resources.pack")
+    pack_archive(source_dir, archive_path)
+
+    mount_dir = os.path.join(str(tmp_path), "mounted")
+
+    mount_archive(AssetArchive(archive_path), mount_dir)
+
+    try:
+        with get_file_like(os.path.join(mount_dir, "actions", "PlayerAction_00100000.prefab.json")) as f:
+            assert f.read() == '{"Components": []}'
+
+        asset = CheatDetectionAsset(asset_dir=os.path.join(mount_dir, "master"))
+        assert asset.get_data_by_id(1).max_player_heal == 25000
+
+        with pytest.raises(FileNotFoundError):
+            get_file_like(os.path.join(mount_dir, "master", "readme.txt"))
+    finally:
+        unmount_archive(mount_dir).close()
+
+
+def test_unmount_other_archive(tmp_path):
+    source_dir = make_source_dir(str(tmp_path))
+    archive_path = os.path.join(str(tmp_path), "resources.pack")
+    pack_archive(source_dir, archive_path)
+
+    mount_dir = os.path.join(str(tmp_path), "mounted")
+    archive = AssetArchive(archive_path)
+    archive_other = AssetArchive(archive_path)
+
+    mount_archive(archive, mount_dir)
+
+    try:
+        assert unmount_archive(mount_dir, archive=archive_other) is None
+        assert unmount_archive(mount_dir, archive=archive) is archive
+    finally:
+        archive.close()
+        archive_other.close()
+
+
+def test_manager_mount(tmp_path):
+    source_dir = make_source_dir(str(tmp_path))
+    archive_path = os.path.join(str(tmp_path), "resources.pack")
+    pack_archive(source_dir, archive_path)
+
+    mount_dir = os.path.join(str(tmp_path), "mounted")
+    file_path = os.path.join(mount_dir, "actions", "PlayerAction_00100000.prefab.json")
+
+    with AssetManager(mount_dir, archive_path=archive_path, lazy=True):
+        with get_file_like(file_path) as f:
+            assert f.read() == '{"Components": []}'
+
+    # Unmounted on close
+    with pytest.raises(FileNotFoundError):
+        get_file_like(file_path)
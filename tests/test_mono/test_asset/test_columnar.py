@@ -0,0 +1,92 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+from dlparse.enums import Status
+from dlparse.mono.asset.base import ColumnarView
+from dlparse.mono.manager import AssetManager
+
+
+@dataclass
+class _Entry:
+    id: int
+    count: int
+    rate: float
+    target: int
+    name: str
+
+
+class _Asset:
+    def __init__(self, *entries: _Entry):
+        self._data = {entry.id: entry for entry in entries}
+
+    def __iter__(self):
+        return iter(self._data.values())
+
+    def get_data_by_id(self, data_id: int) -> Optional[_Entry]:
+        return self._data.get(data_id)
+
+
+@pytest.fixture
+def asset_with_none() -> _Asset:
+    return _Asset(_Entry(1, 0, 0.5, 3, "A"), _Entry(2, 2, 1.5, None, "B"), _Entry(3, 1, 0.0, 5, "C"))
+
+
+def test_field_with_none_skipped(asset_with_none: _Asset):
+    # noinspection PyTypeChecker
+    view = ColumnarView(asset_with_none)
+
+    assert view.column_names == {"count", "rate"}
+    assert view.get_ids_nonzero("count") == [2, 3]
+    assert view.get_ids_equal("rate", 1.5) == [2]
+
+    with pytest.raises(KeyError):
+        view.get_column("target")
+
+
+def test_extra_column_with_none(asset_with_none: _Asset):
+    with pytest.raises(TypeError):
+        # noinspection PyTypeChecker
+        ColumnarView(asset_with_none, extra_columns={"target_double": lambda entry: entry.target and entry.target * 2})
+
+
+def test_action_cond_nonzero(asset_manager: AssetManager):
+    asset = asset_manager.asset_action_cond
+
+    expected = {entry.id for entry in asset if entry.buff_atk}
+
+    assert set(asset.columnar.get_ids_nonzero("buff_atk")) == expected
+
+
+def test_action_cond_equal_enum(asset_manager: AssetManager):
+    asset = asset_manager.asset_action_cond
+
+    expected = {entry.id for entry in asset if entry.afflict_status == Status.POISON}
+
+    assert set(asset.columnar.get_ids_equal("afflict_status", Status.POISON)) == expected
+
+
+def test_action_cond_value(asset_manager: AssetManager):
+    asset = asset_manager.asset_action_cond
+
+    for entry in asset:
+        assert asset.columnar.get_value(entry.id, "buff_def") == entry.buff_def
+
+
+def test_hit_attr_punisher(asset_manager: AssetManager):
+    asset = asset_manager.asset_hit_attr
+
+    expected = {entry.id for entry in asset if entry.punisher_states}
+
+    assert set(asset.columnar.get_ids_nonzero("punisher_state_count")) == expected
+
+
+def test_hit_attr_match(asset_manager: AssetManager):
+    asset = asset_manager.asset_hit_attr
+
+    expected = [entry for entry in asset if entry.damage_modifier > 10]
+
+    ids = asset.columnar.get_ids_match("damage_modifier", lambda damage_modifier: damage_modifier > 10)
+
+    assert asset.columnar.get_entries(ids) == expected
@@ -0,0 +1,21 @@
+from dlparse.mono.manager import AssetManager
+from dlparse.utils import make_hit_label
+
+
+def test_label_variants(asset_manager: AssetManager):
+    asset = asset_manager.asset_hit_attr
+
+    variants = asset.get_label_variants("GUN_107_04_BUF_LV01")
+
+    assert variants[(1, False)].id == "GUN_107_04_BUF_LV01"
+    assert variants[(2, False)].id == "GUN_107_04_BUF_LV02"
+    assert all(asset.get_data_by_id(entry.id) is entry for entry in variants.values())
+
+
+def test_label_variant_identical_to_made_label(asset_manager: AssetManager):
+    asset = asset_manager.asset_hit_attr
+
+    for entry in asset:
+        assert asset.get_label_variant(entry.id, shifted=True) is asset.get_data_by_id(
+            make_hit_label(entry.id, shifted=True)
+        )
@@ -0,0 +1,55 @@
+import pytest
+
+from dlparse.errors import ConfigError
+from dlparse.mono.manager import AssetManager
+
+
+def test_index_multi_valued(asset_manager: AssetManager):
+    asset = asset_manager.asset_skill_chain
+
+    for entry in asset:
+        expected = [data for data in asset if data.group_id == entry.group_id]
+
+        assert asset.get_by_group_id(entry.group_id) == expected
+        assert asset.get_data_by_group_id(entry.group_id) == expected
+
+
+def test_index_composite(asset_manager: AssetManager):
+    asset = asset_manager.asset_story_unit
+
+    for entry in asset:
+        expected = [data for data in asset if data.var_identifier == entry.var_identifier]
+
+        assert asset.get_data_by_variation_identifier(entry.var_identifier) == expected
+
+
+def test_index_not_found(asset_manager: AssetManager):
+    assert asset_manager.asset_story_unit.get_data_by_group_id(-1) is None
+    assert asset_manager.asset_skill_chain.get_data_by_group_id(-1) == []
+
+
+def test_index_not_declared(asset_manager: AssetManager):
+    with pytest.raises(ConfigError):
+        asset_manager.asset_skill_chain.get_by_index("id", 1)
+
+
+def test_filter_use_index(asset_manager: AssetManager):
+    asset = asset_manager.asset_story_unit
+
+    entry = next(iter(asset))
+
+    expected = [
+        data for data in asset
+        if data.group_id == entry.group_id and data.base_id == entry.base_id and data.id >= entry.id
+    ]
+
+    actual = asset.filter(lambda data: data.id >= entry.id, group_id=entry.group_id, base_id=entry.base_id)
+
+    assert actual == expected
+
+
+def test_all_ids_cached(asset_manager: AssetManager):
+    asset = asset_manager.asset_skill_chain
+
+    assert asset.all_ids is asset.all_ids
+    assert asset.all_ids == {entry.id for entry in asset}
@@ -1,4 +1,7 @@
+import pytest
+
 from dlparse.mono.asset import PlayerActionPrefab
+from dlparse.mono.manager import AssetManager
 
 
 def test_label_omission():
@@ -6,3 +9,25 @@ def test_label_omission():
     assert not PlayerActionPrefab.is_effective_label("CMN_AVOID_LV01")
     assert not PlayerActionPrefab.is_effective_label("CMN_AVOID_LV04")
     assert PlayerActionPrefab.is_effective_label("DAG_130_04_H01_LV01")
+
+
+@pytest.mark.parametrize("label,is_effective", [("CMN_AVOID", True), ("DAG_130_04_H01_LV01", False)])
+def test_label_omission_overridden(label: str, is_effective: bool):
+    class _Prefab(PlayerActionPrefab):
+        omitted_label_starts = {"DAG_"}
+
+    assert _Prefab.is_effective_label(label) == is_effective
+
+
+def test_hit_actions_computed_once(asset_manager: AssetManager):
+    prefab = asset_manager.loader_action.get_prefab(141001)
+
+    hit_actions = prefab.get_hit_actions(1)
+
+    assert hit_actions == prefab.get_hit_actions(1)
+
+    # A new list is returned every time, so modifying it does not affect the cached hit actions
+    hit_actions_modified = prefab.get_hit_actions(1)
+    hit_actions_modified.clear()
+    assert prefab.get_hit_actions(1) == hit_actions
+    assert all(label.endswith("_LV01") for label, _ in hit_actions)
@@ -0,0 +1,56 @@
+import os
+
+from dlparse.enums import Language
+from dlparse.mono.asset import TextAssetMultilingual
+from tests.static import PATH_LOCAL_ROOT_RESOURCES
+
+
+def test_load_on_demand():
+    asset = TextAssetMultilingual(os.path.join(PATH_LOCAL_ROOT_RESOURCES, "master"))
+
+    assert asset.loaded_languages == []
+
+    assert asset.get_text(Language.JP, "CHARA_NAME_10840301") == "ルーエン"
+    assert asset.loaded_languages == [Language.JP.value]
+
+
+def test_preload_unload():
+    asset = TextAssetMultilingual(os.path.join(PATH_LOCAL_ROOT_RESOURCES, "master"))
+
+    asset.preload([Language.EN.value, Language.JP.value])
+    assert set(asset.loaded_languages) == {Language.EN.value, Language.JP.value}
+
+    asset.unload([Language.EN.value])
+    assert asset.loaded_languages == [Language.JP.value]
+
+    # Empty languages release nothing
+    asset.unload([])
+    assert asset.loaded_languages == [Language.JP.value]
+
+    # Unloaded language is loaded again on use
+    assert asset.get_text(Language.EN, "CHARA_NAME_10840301")
+
+    asset.preload()
+    assert set(asset.loaded_languages) == set(asset.available_languages)
+
+    asset.unload()
+    assert asset.loaded_languages == []
+
+
+def test_preload_empty(tmp_path):
+    # Files do not exist, so loading any language raises an error
+    asset = TextAssetMultilingual(str(tmp_path / "assets" / "master"))
+
+    asset.preload([])
+    assert asset.loaded_languages == []
+
+
+def test_memory_usage():
+    asset = TextAssetMultilingual(os.path.join(PATH_LOCAL_ROOT_RESOURCES, "master"))
+
+    asset.preload([Language.JP.value])
+
+    memory_usage = asset.get_memory_usage()
+
+    assert list(memory_usage) == [Language.JP.value]
+    assert memory_usage[Language.JP.value] > 0
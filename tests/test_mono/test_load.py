@@ -1,10 +1,15 @@
+import io
 import os
 
 import pytest
 
-from dlparse.mono.asset import CharaDataAsset
+from dlparse.errors import ActionDataNotFoundError
+from dlparse.mono.asset import CharaDataAsset, HitAttrAsset, HitAttrEntry
+from dlparse.mono.asset.base import MasterParserBase
+from dlparse.mono.asset.master.action_hit_attr import HitAttrParser
 from dlparse.mono.loader import ActionFileLoader
 from dlparse.mono.manager import AssetManager
+from dlparse.utils import LRUCache, get_deep_size
 from tests.static import PATH_LOCAL_ROOT_RESOURCES, get_remote_dir_root_resources
 
 
@@ -45,3 +50,82 @@ def test_prefab_loader_local_dir(asset_manager: AssetManager):
 def test_prefab_loader_remote_dir(asset_manager: AssetManager):
     loader = ActionFileLoader(asset_manager.asset_action_list, get_remote_dir_root_resources() + "/actions")
     assert loader.get_prefab(141001) is not None
+
+
+def test_load_streaming_identical():
+    file_path = os.path.join(PATH_LOCAL_ROOT_RESOURCES, "master", "PlayerActionHitAttribute.json")
+
+    with open(file_path, encoding="utf-8") as f:
+        entries_raw = HitAttrParser.get_entries_dict(f)
+
+    asset = HitAttrAsset(asset_dir=os.path.join(PATH_LOCAL_ROOT_RESOURCES, "master"))
+
+    assert asset.data == {key: HitAttrEntry.parse_raw(value) for key, value in entries_raw.items()}
+
+
+@pytest.mark.parametrize("count_first", [True, False])
+def test_load_streaming_padded(count_first: bool):
+    count = '"count": 2'
+    entries = '"entriesKey": [1, 2, 0], "entriesValue": [{"_Id": 1, "_V": "a"}, {"_Id": 2, "_V": "b"}, {}]'
+    body = f"{count}, {entries}" if count_first else f"{entries}, {count}"
+
+    parsed = MasterParserBase.parse_entries(io.StringIO(f'{{"dict": {{{body}}}}}'), lambda entry: entry["_V"])
+
+    assert parsed == {1: "a", 2: "b"}
+
+
+@pytest.mark.parametrize("count_first", [True, False])
+def test_load_streaming_invalid_in_count(count_first: bool):
+    count = '"count": 2'
+    entries = '"entriesKey": [1, 2], "entriesValue": [{"_Id": 1, "_V": "a"}, {"_Id": 2}]'
+    body = f"{count}, {entries}" if count_first else f"{entries}, {count}"
+
+    with pytest.raises(KeyError):
+        MasterParserBase.parse_entries(io.StringIO(f'{{"dict": {{{body}}}}}'), lambda entry: entry["_V"])
+
+
+def test_prefab_loader_preload(asset_manager: AssetManager):
+    loader = ActionFileLoader(asset_manager.asset_action_list, os.path.join(PATH_LOCAL_ROOT_RESOURCES, "actions"))
+
+    result = loader.preload([141001, 991210], workers=2)
+
+    assert set(result.load_time) == {141001, 991210}
+    assert result.failures == []
+    assert loader.get_prefab(141001).action_id == 141001
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_prefab_loader_preload_unbounded(asset_manager: AssetManager, workers: int):
+    loader = ActionFileLoader(
+        asset_manager.asset_action_list, os.path.join(PATH_LOCAL_ROOT_RESOURCES, "actions"),
+        cache=LRUCache(fn_get_size=get_deep_size)
+    )
+
+    loader.preload([141001, 991210], workers=workers)
+
+    assert loader.prefab_cache.stats.entry_count == 2
+    assert loader.prefab_cache.stats.evictions == 0
+    assert loader.prefab_cache.size_bytes > 0
+
+
+def test_prefab_loader_preload_not_found(asset_manager: AssetManager):
+    loader = ActionFileLoader(asset_manager.asset_action_list, os.path.join(PATH_LOCAL_ROOT_RESOURCES, "actions"))
+
+    with pytest.raises(ActionDataNotFoundError):
+        loader.preload([-1])
+
+
+def test_prefab_loader_cache_bounded(asset_manager: AssetManager):
+    loader = ActionFileLoader(
+        asset_manager.asset_action_list, os.path.join(PATH_LOCAL_ROOT_RESOURCES, "actions"),
+        cache=LRUCache(max_entries=1)
+    )
+
+    prefab = loader.get_prefab(141001)
+    assert loader.get_prefab(141001) is prefab
+
+    loader.get_prefab(991210)
+
+    assert 141001 not in loader.prefab_cache
+    assert loader.prefab_cache.stats.hits == 1
+    assert loader.prefab_cache.stats.evictions == 1
@@ -1,6 +1,7 @@
 import pytest
 
 from dlparse.enums import Language
+from dlparse.mono.asset.base import get_network_source
 from dlparse.mono.manager import AssetManager
 from tests.static import PATH_LOCAL_ROOT_RESOURCES, get_remote_dir_root_resources
 
@@ -15,3 +16,73 @@ def test_load_local_dir():
 def test_load_remote_dir():
     manager = AssetManager(get_remote_dir_root_resources(), is_network_source=True)
     assert manager.asset_text_multi.get_text(Language.JP, "CHARA_NAME_19900001") is not None
+
+
+@pytest.mark.slow
+def test_load_on_demand_only():
+    manager = AssetManager(PATH_LOCAL_ROOT_RESOURCES)
+
+    assert manager.is_asset_loaded("asset_chara_data")
+    assert not manager.is_asset_loaded("action_graph")
+    assert not manager.is_asset_loaded("skill_unit_index")
+
+    assert manager.skill_unit_index is not None
+    assert manager.is_asset_loaded("skill_unit_index")
+
+
+def test_load_lazy():
+    manager = AssetManager(PATH_LOCAL_ROOT_RESOURCES, lazy=True)
+    assert not any(manager.asset_load_state.values())
+
+    assert 10440501 in manager.asset_chara_data
+    assert manager.is_asset_loaded("asset_chara_data")
+    assert not manager.is_asset_loaded("asset_hit_attr")
+
+
+def test_load_lazy_transformer_on_demand():
+    manager = AssetManager(PATH_LOCAL_ROOT_RESOURCES, lazy=True)
+
+    assert manager.transformer_info.transform_chara_info(10440501) is not None
+    assert manager.is_asset_loaded("transformer_info")
+    assert manager.is_asset_loaded("asset_chara_data")
+    assert not manager.is_asset_loaded("asset_action_cond")
+
+
+@pytest.mark.slow
+def test_load_parallel():
+    manager_serial = AssetManager(PATH_LOCAL_ROOT_RESOURCES)
+    manager_parallel = AssetManager(PATH_LOCAL_ROOT_RESOURCES, load_workers=4)
+
+    assert manager_parallel.asset_hit_attr.data == manager_serial.asset_hit_attr.data
+    assert manager_parallel.asset_action_cond.data == manager_serial.asset_action_cond.data
+    assert manager_parallel.asset_chara_data.data == manager_serial.asset_chara_data.data
+    assert manager_parallel.asset_text_multi.get_text(Language.JP, "CHARA_NAME_19900001") is not None
+
+    assert "asset_hit_attr" in manager_parallel.asset_load_time
+    assert all(load_time >= 0 for load_time in manager_parallel.asset_load_time.values())
+
+
+def test_prefetch_loader_files_local():
+    manager = AssetManager(PATH_LOCAL_ROOT_RESOURCES, lazy=True)
+
+    assert manager.prefetch_loader_files() == {}
+    assert not any(manager.asset_load_state.values())
+
+
+def test_close_network_source(tmp_path):
+    source_original = get_network_source()
+
+    with AssetManager(
+            get_remote_dir_root_resources(), is_network_source=True, network_cache_dir=str(tmp_path), lazy=True
+    ):
+        source_manager = get_network_source()
+        assert source_manager is not source_original
+
+        with AssetManager(
+                get_remote_dir_root_resources(), is_network_source=True, network_cache_dir=str(tmp_path), lazy=True
+        ):
+            assert get_network_source() is not source_manager
+
+        assert get_network_source() is source_manager
+
+    assert get_network_source() is source_original
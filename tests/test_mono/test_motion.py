@@ -0,0 +1,245 @@
+import io
+import json
+import os
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+from dlparse.enums import Weapon
+from dlparse.mono.asset import MotionControllerChara, MotionSelectorWeapon
+from dlparse.mono.asset.base import parse_motion_data
+from dlparse.mono.asset.motion.ctrl_weapon import MotionControllerWeapon
+from dlparse.mono.loader import CharacterMotionLoader, DragonMotionLoader, MotionStopTimeIndex
+
+
+def make_controller_data(name: str, motions: dict[str, tuple[int, float]]) -> dict[str, Any]:
+    """Make the data of an animator controller. The value of ``motions`` is the clip path ID and its stop time."""
+    clips = [{"m_FileID": 0, "m_PathID": path_id} for path_id, _ in motions.values()]
+
+    return {
+        "$Name": name,
+        "$Controller": {
+            "m_Name": name,
+            "m_TOS": {str(1000 + idx): motion_name for idx, motion_name in enumerate(motions)},
+            "m_Controller": {"m_StateMachineArray": [{"data": {"m_StateConstantArray": [
+                {"data": {
+                    "m_NameID": 1000 + idx,
+                    "m_BlendTreeConstantArray": [{"data": {"m_NodeArray": [{"data": {"m_ClipID": idx}}]}}],
+                }}
+                for idx in range(len(motions))
+            ]}}]},
+            "m_AnimationClips": clips,
+        },
+        "$Clips": [
+            {"$PathID": path_id, "$Name": motion_name, "$StopTime": stop_time}
+            for motion_name, (path_id, stop_time) in motions.items()
+        ],
+    }
+
+
+def make_override_data(name: str, overrides: dict[int, tuple[int, float]]) -> dict[str, Any]:
+    """Make the data of an override controller. The key of ``overrides`` is the original clip path ID."""
+    return {
+        "$Name": name,
+        "$Clips": [
+            {
+                "$OriginalClip": {"m_FileID": 0, "m_PathID": path_id_original},
+                "$OverrideClip": {"m_FileID": 0, "m_PathID": path_id_override},
+                "$Name": name,
+                "$StopTime": stop_time,
+            }
+            for path_id_original, (path_id_override, stop_time) in overrides.items()
+        ],
+    }
+
+
+@dataclass
+class _UnitEntry:
+    id: int
+    base_id: int
+    variation_id: int
+    weapon: Weapon = Weapon.NONE
+
+
+def write_json(file_path: str, data: Any):
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def test_parse_motion_data_selected():
+    data = make_controller_data("axe", {"combo1": (101, 1.5), "combo2": (102, 0.75)})
+    data["$Controller"]["m_Controller"]["m_StateMachineArray"][0]["data"]["m_AnyStateTransitionArray"] = [
+        {"data": {"m_ConditionConstantArray": [{"data": {"m_EventID": 3}}]}}
+    ]
+    data["$Controller"]["m_TOS"]["99"] = "unused"
+    data["$Clips"][0]["m_FloatCurves"] = [{"curve": {"m_Curve": [0.5] * 100}, "attribute": "x\\\"]}"}]
+    data["$Extra"] = {"m_Data": list(range(100))}
+
+    parsed = parse_motion_data(io.StringIO(json.dumps(data)))
+
+    assert "$Extra" not in parsed
+    assert "m_FloatCurves" not in parsed["$Clips"][0]
+    assert parsed["$Controller"]["m_TOS"] == data["$Controller"]["m_TOS"]
+
+    controller = MotionControllerWeapon.parse_raw(parsed)
+    controller_full = MotionControllerWeapon.parse_raw(data)
+
+    assert controller.weapon == Weapon.AXE
+    assert controller.state_machine_ref == controller_full.state_machine_ref
+    assert controller.animation_clip_path_ids == controller_full.animation_clip_path_ids
+    assert controller.get_stop_time_by_motion_name("combo2") == 0.75
+
+
+def test_parse_motion_data_override_selected():
+    data = make_override_data("axe_10000101", {101: (201, 2.0)})
+
+    override = MotionControllerChara.parse_raw(parse_motion_data(io.StringIO(json.dumps(data))))
+    override_full = MotionControllerChara.parse_raw(data)
+
+    assert override.clip_override_path == override_full.clip_override_path
+    assert override.clip_stop_time == override_full.clip_stop_time
+
+
+def test_selector_lazy(tmp_path):
+    motion_dir = str(tmp_path)
+    write_json(os.path.join(motion_dir, "swd.json"), make_controller_data("SWD", {"combo1": (11, 0.5)}))
+
+    # Other weapon controllers are missing, but they are not loaded
+    selector = MotionSelectorWeapon(motion_dir)
+    assert selector.loaded_keys == []
+
+    controller = selector.get_controller(Weapon.SWD)
+
+    assert controller.weapon == Weapon.SWD
+    assert controller.get_stop_time_by_motion_name("combo1") == 0.5
+    assert selector.get_controller(Weapon.SWD) is controller
+    assert selector.loaded_keys == [Weapon.SWD]
+
+
+@pytest.fixture
+def motion_dirs(tmp_path) -> tuple[str, str]:
+    chara_motion_dir = str(tmp_path / "characters")
+    dragon_motion_dir = str(tmp_path / "dragon")
+
+    write_json(
+        os.path.join(chara_motion_dir, "swd.json"),
+        make_controller_data("SWD", {"combo1": (11, 0.5), "combo2": (12, 0.7)})
+    )
+    write_json(
+        os.path.join(chara_motion_dir, "swd_10000101.json"),
+        make_override_data("swd_10000101", {12: (99, 1.5)})
+    )
+    write_json(os.path.join(chara_motion_dir, "readme.json"), {"content": "Not a controller"})
+    write_json(
+        os.path.join(dragon_motion_dir, "d20000_01.json"),
+        make_controller_data("d20000_01", {"skill_01": (21, 2.5)})
+    )
+
+    return chara_motion_dir, dragon_motion_dir
+
+
+def test_stop_time_index_build(motion_dirs: tuple[str, str]):
+    index = MotionStopTimeIndex.build(*motion_dirs)
+
+    assert len(index) == 3
+    assert index.get_stop_time("swd", "combo2") == 0.7
+    assert index.get_stop_time("swd_10000101", "combo1") == 0.5
+    assert index.get_stop_time("swd_10000101", "combo2") == 1.5
+    assert index.get_stop_time("d20000_01", "skill_01") == 2.5
+    assert index.get_stop_time("d20000_01", "skill_02") is None
+
+
+def test_stop_time_index_save_load(motion_dirs: tuple[str, str], tmp_path):
+    index_path = str(tmp_path / "motion_index.json")
+    MotionStopTimeIndex.build(*motion_dirs).save(index_path)
+
+    index = MotionStopTimeIndex.load(index_path)
+
+    assert index.get_stop_time("swd_10000101", "combo2") == 1.5
+    assert MotionStopTimeIndex.load(str(tmp_path / "missing.json")) is None
+
+
+def test_stop_time_index_fingerprint_mismatch(motion_dirs: tuple[str, str], tmp_path):
+    index_path = str(tmp_path / "motion_index.json")
+    MotionStopTimeIndex.build(*motion_dirs).save(index_path, fingerprint="a")
+
+    assert MotionStopTimeIndex.load(index_path, fingerprint="a") is not None
+    assert MotionStopTimeIndex.load(index_path, fingerprint="b") is None
+    assert MotionStopTimeIndex.load(index_path) is None
+
+
+@pytest.mark.parametrize("content", ["{\"version\": 2, \"finger", "[]", "{\"version\": 2, \"fingerprint\": \"\"}"])
+def test_stop_time_index_corrupted(tmp_path, content: str):
+    index_path = tmp_path / "motion_index.json"
+    index_path.write_text(content, encoding="utf-8")
+
+    assert MotionStopTimeIndex.load(str(index_path)) is None
+
+
+def test_stop_time_index_exclude_failed(motion_dirs: tuple[str, str]):
+    chara_motion_dir, _ = motion_dirs
+    write_json(os.path.join(chara_motion_dir, "swd_10000301.json"), {"content": "Not a controller"})
+    write_json(
+        os.path.join(chara_motion_dir, "axe_10000401.json"),
+        make_override_data("axe_10000401", {12: (99, 1.5)})
+    )
+
+    index = MotionStopTimeIndex.build(*motion_dirs)
+
+    assert index.is_excluded("swd_10000301")
+    assert index.is_excluded("axe_10000401")
+    assert not index.is_excluded("swd_10000101")
+    assert "swd_10000301" not in index
+
+    # Excluded controller must be loaded instead of falling back to the indexed weapon controller
+    loader = CharacterMotionLoader(chara_motion_dir, stop_time_index=index)
+
+    with pytest.raises(KeyError):
+        # noinspection PyTypeChecker
+        loader.get_motion_stop_time(_UnitEntry(10000301, 100003, 1, Weapon.SWD), "combo2")
+
+
+def test_loader_file_path(tmp_path):
+    motion_dir = str(tmp_path)
+
+    # noinspection PyTypeChecker
+    assert CharacterMotionLoader(motion_dir).get_file_path(_UnitEntry(10000101, 100001, 1, Weapon.SWD)) == (
+        os.path.join(motion_dir, "swd_10000101.json")
+    )
+    # noinspection PyTypeChecker
+    assert DragonMotionLoader(motion_dir).get_file_path(_UnitEntry(20000101, 20000, 1)) == (
+        os.path.join(motion_dir, "d20000_01.json")
+    )
+
+
+def test_loader_use_index(motion_dirs: tuple[str, str], tmp_path):
+    index = MotionStopTimeIndex.build(*motion_dirs)
+
+    # Motion directory does not exist, so the stop times must come from the index
+    motion_dir = str(tmp_path / "missing")
+    loader_chara = CharacterMotionLoader(motion_dir, stop_time_index=index)
+    loader_dragon = DragonMotionLoader(motion_dir, stop_time_index=index)
+
+    # noinspection PyTypeChecker
+    assert loader_chara.get_motion_stop_time(_UnitEntry(10000101, 100001, 1, Weapon.SWD), "combo2") == 1.5
+    # noinspection PyTypeChecker
+    assert loader_chara.get_motion_stop_time(_UnitEntry(10000201, 100002, 1, Weapon.SWD), "combo2") == 0.7
+    # noinspection PyTypeChecker
+    assert loader_dragon.get_motion_stop_time(_UnitEntry(20000101, 20000, 1), "skill_01") == 2.5
+
+
+def test_loader_index_identical(motion_dirs: tuple[str, str]):
+    chara_motion_dir, _ = motion_dirs
+
+    loader = CharacterMotionLoader(chara_motion_dir)
+    loader_indexed = CharacterMotionLoader(chara_motion_dir, stop_time_index=MotionStopTimeIndex.build(*motion_dirs))
+
+    for entry in (_UnitEntry(10000101, 100001, 1, Weapon.SWD), _UnitEntry(10000201, 100002, 1, Weapon.SWD)):
+        for motion_name in ("combo1", "combo2"):
+            # noinspection PyTypeChecker
+            stop_time = loader.get_motion_stop_time(entry, motion_name)
+            # noinspection PyTypeChecker
+            assert loader_indexed.get_motion_stop_time(entry, motion_name) == stop_time
@@ -0,0 +1,215 @@
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+
+import pytest
+
+from dlparse.mono.asset import CheatDetectionAsset
+from dlparse.mono.asset.base import NetworkSource, get_network_source, set_network_source
+
+FILES = {
+    "/v1/a.json": b'{"a": 1}',
+    "/v1/b.json": b'{"b": 2}',
+    "/v2/a.json": b'{"a": 1}',
+    "/v1/master/CheatDetectionParam.json": (
+        b'{"dict": {"entriesValue": [{"_Id": 1, "_MaxEnemyDamage": 100000000, "_MaxEnemyBreakDamage": 100000000, '
+        b'"_MaxEnemyPlayerDistance": 35, "_MaxPlayerHeal": 25000, "_MaxPlayerMoveSpeed": 10}], '
+        b'"entriesKey": [1], "count": 1}}'
+    ),
+}
+
+REDIRECTS = {
+    "/latest/a.json": "/v1/a.json",
+    "/latest/b.json": "../v1/b.json",
+    "/loop.json": "/loop.json",
+}
+
+SLOW_PATH = "/slow.json"
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _RequestHandler)
+
+        self.request_paths: list[str] = []
+        self.connection_count: int = 0
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive
+
+    server: _Server
+
+    def setup(self):
+        super().setup()
+        self.server.connection_count += 1
+
+    def do_GET(self):  # noqa: N802, pylint: disable=invalid-name
+        # Absolute URL is requested if the server is used as a proxy
+        path = urlsplit(self.path).path
+
+        self.server.request_paths.append(path)
+
+        if path == SLOW_PATH:
+            time.sleep(0.5)
+
+        if location := REDIRECTS.get(path):
+            self.send_response(302)
+            self.send_header("Location", location)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if not (content := FILES.get(path)):
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[_Server]:
+    http_server = _Server()
+
+    thread = threading.Thread(target=http_server.serve_forever, daemon=True)
+    thread.start()
+
+    yield http_server
+
+    http_server.shutdown()
+    http_server.server_close()
+
+
+def get_url(server: _Server, path: str) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def test_fetch_keep_alive(server: _Server):
+    source = NetworkSource()
+
+    assert source.fetch(get_url(server, "/v1/a.json")) == b'{"a": 1}'
+    assert source.fetch(get_url(server, "/v1/b.json")) == b'{"b": 2}'
+    assert source.fetch(get_url(server, "/v1/a.json")) == b'{"a": 1}'
+
+    assert server.request_paths == ["/v1/a.json", "/v1/b.json", "/v1/a.json"]
+    assert server.connection_count == 1
+    assert source.connection_count == 1
+
+    source.close()
+
+
+def test_fetch_not_found(server: _Server):
+    source = NetworkSource()
+
+    with pytest.raises(ValueError):
+        source.fetch(get_url(server, "/v1/x.json"))
+
+    # Connection should be still usable after 404
+    assert source.fetch(get_url(server, "/v1/a.json")) == b'{"a": 1}'
+
+
+def test_fetch_cached(server: _Server, tmp_path):
+    cache_dir = str(tmp_path)
+
+    source = NetworkSource(cache_dir=cache_dir)
+    assert source.fetch(get_url(server, "/v1/a.json")) == b'{"a": 1}'
+    assert source.fetch(get_url(server, "/v2/a.json")) == b'{"a": 1}'
+
+    # Another source sharing the same cache directory
+    source = NetworkSource(cache_dir=cache_dir)
+    assert source.fetch(get_url(server, "/v1/a.json")) == b'{"a": 1}'
+    assert source.fetch(get_url(server, "/v2/a.json")) == b'{"a": 1}'
+
+    assert server.request_paths == ["/v1/a.json", "/v2/a.json"]
+    assert source.request_count == 0
+
+    # Identical contents are stored once
+    object_count = sum(len(files) for _, _, files in os.walk(os.path.join(cache_dir, "objects")))
+    assert object_count == 1
+
+
+def test_prefetch(server: _Server):
+    source = NetworkSource(max_connections=2)
+
+    errors = source.prefetch([get_url(server, path) for path in ("/v1/a.json", "/v1/b.json", "/v1/x.json")])
+
+    assert list(errors) == [get_url(server, "/v1/x.json")]
+    assert server.connection_count <= 2
+
+    request_count = len(server.request_paths)
+
+    assert source.fetch(get_url(server, "/v1/a.json")) == b'{"a": 1}'
+    assert source.fetch(get_url(server, "/v1/b.json")) == b'{"b": 2}'
+    assert len(server.request_paths) == request_count
+
+
+def test_load_asset(server: _Server):
+    source_original = get_network_source()
+
+    try:
+        set_network_source(NetworkSource())
+
+        asset = CheatDetectionAsset(asset_dir=get_url(server, "/v1/master"))
+    finally:
+        set_network_source(source_original)
+
+    assert len(asset) == 1
+    assert asset.get_data_by_id(1).max_player_heal == 25000
+
+
+def test_fetch_redirect(server: _Server):
+    source = NetworkSource()
+
+    assert source.fetch(get_url(server, "/latest/a.json")) == b'{"a": 1}'
+    assert source.fetch(get_url(server, "/latest/b.json")) == b'{"b": 2}'
+    assert server.request_paths == ["/latest/a.json", "/v1/a.json", "/latest/b.json", "/v1/b.json"]
+
+    with pytest.raises(HTTPError):
+        source.fetch(get_url(server, "/loop.json"))
+
+
+def test_fetch_timeout(server: _Server):
+    source = NetworkSource(timeout=0.1)
+
+    with pytest.raises(OSError):
+        source.fetch(get_url(server, SLOW_PATH))
+
+    # Timed out connection is closed instead of being reused
+    assert source.fetch(get_url(server, "/v1/a.json")) == b'{"a": 1}'
+    assert source.connection_count == 2
+
+
+def test_fetch_proxied(server: _Server, monkeypatch):
+    for name in ("http_proxy", "HTTP_PROXY", "no_proxy", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("http_proxy", get_url(server, ""))
+
+    source = NetworkSource()
+
+    assert source.fetch("http://asset.invalid/v1/a.json") == b'{"a": 1}'
+    assert source.fetch("http://asset.invalid/latest/b.json") == b'{"b": 2}'
+    assert server.request_paths == ["/v1/a.json", "/latest/b.json", "/v1/b.json"]
+
+
+def test_close_drops_prefetched(server: _Server):
+    source = NetworkSource()
+
+    source.prefetch([get_url(server, "/v1/a.json")])
+    source.close()
+
+    assert source.fetch(get_url(server, "/v1/a.json")) == b'{"a": 1}'
+    assert server.request_paths == ["/v1/a.json", "/v1/a.json"]
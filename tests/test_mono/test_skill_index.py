@@ -0,0 +1,121 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+import pytest
+
+from dlparse.enums import SkillNumber, UnitType
+from dlparse.mono.asset import SkillIdEntry
+from dlparse.mono.loader import SkillUnitIndex, get_sources_fingerprint
+
+
+@dataclass
+class _Unit:
+    id: int
+    unit_type: UnitType
+    skill_ids: list[int]
+    is_playable: bool = True
+    discover_count: int = field(default=0, compare=False)
+
+    def get_skill_id_entries(self, _, /, is_dragon: bool = False) -> list[SkillIdEntry]:
+        self.discover_count += 1
+
+        skill_num = SkillNumber.S1_DRAGON if is_dragon else SkillNumber.S1
+        return [SkillIdEntry(skill_id, skill_num, f"s{idx}") for idx, skill_id in enumerate(self.skill_ids)]
+
+
+class _UnitAsset:
+    def __init__(self, *units: _Unit):
+        self._units = {unit.id: unit for unit in units}
+
+    @property
+    def playable_data(self) -> list[_Unit]:
+        return [unit for unit in self._units.values() if unit.is_playable]
+
+    def get_data_by_id(self, unit_id: int) -> Optional[_Unit]:
+        return self._units.get(unit_id)
+
+
+@dataclass
+class _AssetManager:
+    asset_chara_data: _UnitAsset
+    asset_dragon_data: _UnitAsset
+
+
+@pytest.fixture
+def asset_manager() -> _AssetManager:
+    return _AssetManager(
+        _UnitAsset(
+            _Unit(10000001, UnitType.CHARACTER, [100001, 100002]),
+            _Unit(10000002, UnitType.CHARACTER, [100003, 100002]),
+            _Unit(10000003, UnitType.CHARACTER, [100004], is_playable=False),
+        ),
+        _UnitAsset(
+            _Unit(20000001, UnitType.DRAGON, [200001, 100003]),
+        ),
+    )
+
+
+def test_build(asset_manager: _AssetManager):
+    index = SkillUnitIndex.build(asset_manager)
+
+    assert len(index) == 4
+    assert index.get(100001).unit_data.id == 10000001
+    assert index.get(100002).unit_data.id == 10000001  # Unit comes first takes priority
+    assert index.get(100003).unit_data.id == 10000002  # Character takes priority
+    assert index.get(200001).unit_data.id == 20000001
+    assert index.get(200001).skill_id_entry.skill_num == SkillNumber.S1_DRAGON
+    assert index.get(100004) is None  # Unplayable
+
+    # Each unit is discovered once
+    assert all(unit.discover_count == 1 for unit in asset_manager.asset_chara_data.playable_data)
+
+
+def test_build_parallel(asset_manager: _AssetManager):
+    index = SkillUnitIndex.build(asset_manager)
+    index_parallel = SkillUnitIndex.build(asset_manager, workers=2)
+
+    for skill_id in (100001, 100002, 100003, 200001):
+        assert index_parallel.get(skill_id) == index.get(skill_id)
+
+
+def test_save_load(asset_manager: _AssetManager, tmp_path):
+    index_path = str(tmp_path / "index.pickle")
+
+    SkillUnitIndex.build(asset_manager).save(index_path, fingerprint="a")
+
+    assert SkillUnitIndex.load(index_path, asset_manager, fingerprint="b") is None
+
+    index = SkillUnitIndex.load(index_path, asset_manager, fingerprint="a")
+    assert len(index) == 4
+    assert index.get(100003).unit_data is asset_manager.asset_chara_data.get_data_by_id(10000002)
+    assert index.get(200001).unit_data is asset_manager.asset_dragon_data.get_data_by_id(20000001)
+
+
+def test_load_or_build(asset_manager: _AssetManager, tmp_path):
+    index_path = str(tmp_path / "index.pickle")
+    source_path = tmp_path / "source.json"
+    source_path.write_text("{}")
+
+    SkillUnitIndex.load_or_build(index_path, asset_manager, source_paths=[str(source_path)])
+    unit = asset_manager.asset_chara_data.get_data_by_id(10000001)
+    assert unit.discover_count == 1
+
+    # Loaded from the stored index
+    SkillUnitIndex.load_or_build(index_path, asset_manager, source_paths=[str(source_path)])
+    assert unit.discover_count == 1
+
+    # Source changed
+    source_path.write_text('{"a": 1}')
+    SkillUnitIndex.load_or_build(index_path, asset_manager, source_paths=[str(source_path)])
+    assert unit.discover_count == 2
+
+
+def test_sources_fingerprint(tmp_path):
+    (tmp_path / "dir").mkdir()
+    (tmp_path / "dir" / "a.json").write_text("{}")
+
+    fingerprint = get_sources_fingerprint([str(tmp_path / "dir"), str(tmp_path / "missing.json")])
+    assert fingerprint == get_sources_fingerprint([str(tmp_path / "dir")])
+
+    (tmp_path / "dir" / "b.json").write_text("{}")
+    assert fingerprint != get_sources_fingerprint([str(tmp_path / "dir")])
@@ -0,0 +1,79 @@
+import json
+import os
+import shutil
+
+from dlparse.mono.asset import CharaDataAsset, PlayerActionPrefab, WeaponTypeAsset
+from dlparse.mono.asset.base import get_snapshot_path
+from dlparse.mono.asset.master.weapon_type import WeaponTypeParser
+from dlparse.mono.asset.player_action.prefab import PlayerActionParser
+from tests.static import PATH_LOCAL_ROOT_RESOURCES
+
+
+def test_snapshot_identical(tmp_path):
+    snapshot_dir = str(tmp_path / "snapshot")
+    asset_dir = os.path.join(PATH_LOCAL_ROOT_RESOURCES, "master")
+
+    asset_original = CharaDataAsset(asset_dir=asset_dir)
+    asset_cold = CharaDataAsset(asset_dir=asset_dir, snapshot_dir=snapshot_dir)
+    asset_warm = CharaDataAsset(asset_dir=asset_dir, snapshot_dir=snapshot_dir)
+
+    assert asset_original.data == asset_cold.data
+    assert asset_original.data == asset_warm.data
+
+
+def test_snapshot_created(tmp_path):
+    snapshot_dir = str(tmp_path / "snapshot")
+    file_path = os.path.join(PATH_LOCAL_ROOT_RESOURCES, "master", "WeaponType.json")
+
+    WeaponTypeAsset(file_path, snapshot_dir=snapshot_dir)
+
+    assert os.path.exists(get_snapshot_path(WeaponTypeParser, file_path, snapshot_dir))
+
+
+def test_snapshot_content_unchanged(tmp_path):
+    snapshot_dir = str(tmp_path / "snapshot")
+    file_path = str(tmp_path / "WeaponType.json")
+    shutil.copyfile(os.path.join(PATH_LOCAL_ROOT_RESOURCES, "master", "WeaponType.json"), file_path)
+
+    asset_cold = WeaponTypeAsset(file_path, snapshot_dir=snapshot_dir)
+
+    # Only the modification time changes
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    asset_warm = WeaponTypeAsset(file_path, snapshot_dir=snapshot_dir)
+
+    assert asset_cold.data == asset_warm.data
+
+
+def test_snapshot_invalidated(tmp_path):
+    snapshot_dir = str(tmp_path / "snapshot")
+    file_path = str(tmp_path / "WeaponType.json")
+    shutil.copyfile(os.path.join(PATH_LOCAL_ROOT_RESOURCES, "master", "WeaponType.json"), file_path)
+
+    asset_cold = WeaponTypeAsset(file_path, snapshot_dir=snapshot_dir)
+
+    # Drop the last entry from the source file
+    with open(file_path, encoding="utf-8") as f:
+        data = json.load(f)
+    data["dict"]["count"] -= 1
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+    asset_changed = WeaponTypeAsset(file_path, snapshot_dir=snapshot_dir)
+
+    assert len(asset_changed) == len(asset_cold) - 1
+
+
+def test_snapshot_prefab(tmp_path):
+    snapshot_dir = str(tmp_path / "snapshot")
+    file_path = os.path.join(PATH_LOCAL_ROOT_RESOURCES, "actions", "PlayerAction_00141001.prefab.json")
+
+    prefab_original = PlayerActionPrefab(141001, file_path)
+    prefab_cold = PlayerActionPrefab(141001, file_path, snapshot_dir=snapshot_dir)
+    prefab_warm = PlayerActionPrefab(141001, file_path, snapshot_dir=snapshot_dir)
+
+    assert os.path.exists(get_snapshot_path(PlayerActionParser, file_path, snapshot_dir))
+    assert prefab_original.data == prefab_cold.data
+    assert prefab_original.data == prefab_warm.data
+    assert prefab_original.get_hit_actions(1) == prefab_warm.get_hit_actions(1)
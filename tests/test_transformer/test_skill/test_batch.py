@@ -0,0 +1,112 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+import pytest
+
+from dlparse.errors import ActionDataNotFoundError, HitDataUnavailableError
+from dlparse.transformer import SkillTransformer
+from dlparse.utils import LRUCache
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_transform_attacking_many(transformer_skill: SkillTransformer, workers: int):
+    args_list = [
+        # Xander S2
+        # https://dragalialost.wiki/w/Xander
+        (101502012, 3, None),
+        # Patia S1, no attacking hit data
+        # https://dragalialost.wiki/w/Patia
+        (105405021, 0, None),
+        # Xander S2 at Lv 2
+        (101502012, 2, None),
+    ]
+
+    results = transformer_skill.transform_attacking_many(args_list, workers=workers)
+
+    assert [result.skill_id for result in results] == [101502012, 105405021, 101502012]
+    assert [result.is_skipped for result in results] == [False, True, False]
+    assert results[1].skip_error_type is HitDataUnavailableError
+
+    assert results[0].skill_data.max_level == 3
+    assert results[0].skill_data.asset_manager is not None
+    assert results[2].skill_data.max_level == 2
+
+    # Results are cached
+    assert transformer_skill.transform_attacking(101502012, 3) is results[0].skill_data
+
+
+@dataclass
+class _SkillData:
+    skill_id: int
+    asset_manager: Optional[object] = field(default=None, compare=False)
+
+
+def _transform_attacking(skill_id: int, max_lv: int = 0, ability_ids: Optional[list[int]] = None, **_):
+    if skill_id == 2:
+        raise HitDataUnavailableError()
+
+    if skill_id == 3:
+        raise ActionDataNotFoundError(300, skill_id)
+
+    if skill_id == 4:
+        raise KeyError(skill_id)
+
+    return _SkillData(skill_id * 10 + max_lv + len(ability_ids or ()))
+
+
+@pytest.fixture
+def transformer(monkeypatch) -> SkillTransformer:
+    transformer = SkillTransformer("manager", result_cache=LRUCache())
+    monkeypatch.setattr(transformer, "transform_attacking", _transform_attacking)
+
+    return transformer
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_many_ordered(transformer: SkillTransformer, workers: int):
+    args_list = [(skill_id, skill_id % 4, [1] * (skill_id % 3)) for skill_id in range(5, 50)] + [(2, 0, None)]
+
+    results = transformer.transform_attacking_many(args_list, workers=workers)
+
+    assert [result.skill_id for result in results] == [args[0] for args in args_list]
+    assert [result.skill_data for result in results[:-1]] == [_transform_attacking(*args) for args in args_list[:-1]]
+
+    if workers > 1:
+        # Asset manager is re-assigned to the skill data transformed in the workers
+        assert all(result.skill_data.asset_manager == "manager" for result in results[:-1])
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_many_skipped(transformer: SkillTransformer, workers: int):
+    results = transformer.transform_attacking_many([(1, 0, None), (2, 0, None), (3, 0, None)], workers=workers)
+
+    assert [result.is_skipped for result in results] == [False, True, True]
+    assert results[1].skip_error_type is HitDataUnavailableError
+    assert results[2].skip_error_type is ActionDataNotFoundError
+    assert "300" in results[2].skip_message
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_many_skipped_cached(monkeypatch, workers: int):
+    def get_skill_hit_data(skill_id: int, *_, **__):
+        raise ActionDataNotFoundError(300, skill_id)
+
+    transformer = SkillTransformer("manager", result_cache=LRUCache())
+    monkeypatch.setattr(transformer, "get_skill_hit_data", get_skill_hit_data)
+
+    results = transformer.transform_attacking_many([(1, 0, None), (3, 0, None)], workers=workers)
+
+    assert all(result.skip_error_type is ActionDataNotFoundError for result in results)
+    assert "300" in results[1].skip_message
+
+    # Skip errors are cached no matter transformed in the workers or not
+    monkeypatch.setattr(transformer, "get_skill_hit_data", None)
+
+    with pytest.raises(ActionDataNotFoundError, match="300"):
+        transformer.transform_attacking(3)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_many_error(transformer: SkillTransformer, workers: int):
+    with pytest.raises(KeyError):
+        transformer.transform_attacking_many([(1, 0, None), (4, 0, None)], workers=workers)
@@ -0,0 +1,58 @@
+import pytest
+
+from dlparse.errors import HitDataUnavailableError
+from dlparse.transformer import SkillTransformer
+from dlparse.utils import LRUCache
+
+
+def test_cached_attacking(transformer_skill: SkillTransformer):
+    # Xander S2
+    # https://dragalialost.wiki/w/Xander
+    skill_data = transformer_skill.transform_attacking(101502012)
+    hits = transformer_skill.result_cache.stats.hits
+
+    assert transformer_skill.transform_attacking(101502012) is skill_data
+    assert transformer_skill.result_cache.stats.hits == hits + 1
+
+    # Different arguments are cached separately
+    assert transformer_skill.transform_attacking(101502012, max_lv=2) is not skill_data
+
+
+def test_cached_supportive(transformer_skill: SkillTransformer):
+    # Patia S1
+    # https://dragalialost.wiki/w/Patia
+    skill_data = transformer_skill.transform_supportive(105405021)
+
+    assert transformer_skill.transform_supportive(105405021) is skill_data
+
+
+def test_cached_error(monkeypatch):
+    call_count = 0
+
+    def get_skill_hit_data(*_, **__):
+        nonlocal call_count
+        call_count += 1
+
+        raise HitDataUnavailableError()
+
+    transformer = SkillTransformer(None, result_cache=LRUCache(max_entries=2))
+    monkeypatch.setattr(transformer, "get_skill_hit_data", get_skill_hit_data)
+
+    errors = []
+
+    for _ in range(3):
+        with pytest.raises(HitDataUnavailableError) as ex_info:
+            transformer.transform_attacking(101502012, ability_ids=[1, 2])
+
+        errors.append(ex_info.value)
+
+    assert call_count == 1
+    # New error is raised every time, so the tracebacks do not pile up
+    assert len({id(error) for error in errors}) == 3
+    assert len({str(error) for error in errors}) == 1
+    assert transformer.result_cache.stats.hits == 2
+
+    with pytest.raises(HitDataUnavailableError):
+        transformer.transform_attacking(101502012, ability_ids=[1])
+
+    assert call_count == 2
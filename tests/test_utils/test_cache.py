@@ -0,0 +1,125 @@
+import pytest
+
+from dlparse.utils import LRUCache, get_deep_size
+
+
+def test_get_put():
+    cache = LRUCache()
+    cache.put("a", 1)
+
+    assert cache["a"] == 1
+    assert cache.get("b") is None
+    assert cache.get("b", 7) == 7
+
+    stats = cache.stats
+    assert stats.hits == 1
+    assert stats.misses == 2
+    assert stats.entry_count == 1
+    assert stats.hit_rate == pytest.approx(1 / 3)
+
+
+def test_negative_entry():
+    cache = LRUCache()
+    cache.put("a", None)
+
+    assert "a" in cache
+    assert cache["a"] is None
+
+    with pytest.raises(KeyError):
+        _ = cache["b"]
+
+
+def test_evict_by_entries():
+    cache = LRUCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    _ = cache["a"]  # Refreshes "a", so "b" is the least recently used
+    cache.put("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.stats.evictions == 1
+
+
+def test_evict_by_bytes():
+    cache = LRUCache(max_bytes=10, fn_get_size=len)
+    cache.put("a", "12345")
+    cache.put("b", "12345")
+    cache.put("c", "123")
+
+    assert "a" not in cache
+    assert cache.size_bytes == 8
+
+    # Value exceeding the budget alone is not cached
+    assert not cache.put("d", "12345678901")
+    assert "d" not in cache
+    assert cache.size_bytes == 8
+
+
+def test_put_replace():
+    cache = LRUCache(fn_get_size=len)
+    cache.put("a", "12345")
+    cache.put("a", "12")
+
+    assert cache["a"] == "12"
+    assert cache.size_bytes == 2
+
+
+def test_size_opt_in():
+    # Values are not measured unless bounded by bytes or measuring function is given
+    cache = LRUCache(max_entries=2)
+    cache.put("a", "12345")
+
+    assert cache.fn_get_size is None
+    assert cache.size_bytes == 0
+
+    cache = LRUCache(max_bytes=1024)
+    cache.put("a", "12345")
+
+    assert cache.fn_get_size is get_deep_size
+    assert cache.size_bytes == get_deep_size("12345")
+
+
+def test_put_measured():
+    cache = LRUCache(max_bytes=10, fn_get_size=len)
+
+    assert cache.fn_get_size is len
+
+    # Given size is used instead of measuring the value again
+    cache.put("a", "12345", size=3)
+    cache.put("b", "12345678", size=8)
+
+    assert "a" not in cache
+    assert cache.size_bytes == 8
+
+
+def test_invalidate():
+    cache = LRUCache(fn_get_size=len)
+    cache.put("a", "12345")
+    cache.put("b", "12")
+
+    assert cache.invalidate("a")
+    assert not cache.invalidate("a")
+    assert cache.size_bytes == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+
+def test_reset_stats():
+    cache = LRUCache()
+    cache.get("a")
+    cache.reset_stats()
+
+    assert cache.stats.misses == 0
+
+
+def test_deep_size():
+    class Data:
+        def __init__(self, items):
+            self.items = items
+
+    assert get_deep_size(Data(list(range(1000)))) > get_deep_size(Data([]))
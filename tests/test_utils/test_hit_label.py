@@ -79,3 +79,13 @@ def test_make_hit_label_change_level_no_shift():
     hit_label = make_hit_label("S071_000_00_LV01", level=2)
 
     assert hit_label == "S071_000_00_LV02"
+
+
+def test_get_hit_label_interned():
+    assert get_hit_label_data("S071_001_HAS_LV01") is get_hit_label_data("S071_001_HAS_LV01")
+
+
+def test_make_hit_label_repeated():
+    assert make_hit_label("S071_000_00_LV01", level=2) == "S071_000_00_LV02"
+    assert make_hit_label("S071_000_00_LV01", level=2) == "S071_000_00_LV02"
+    assert make_hit_label("S071_000_00_LV01", level=3) == "S071_000_00_LV03"
@@ -0,0 +1,61 @@
+import io
+import json
+import math
+from json import JSONEncoder
+from typing import Any
+
+import pytest
+
+from dlparse.errors import ConfigError
+from dlparse.utils import JsonBackend, dump_json, get_json_backend, load_json, set_json_backend
+
+DOCUMENT = '{"b": [1, 2.5, -3e-05, "文字"], "a": {"x": null, "y": true}, "c": 12345678901234}'
+
+
+@pytest.mark.parametrize("backend", [backend for backend in JsonBackend if backend.is_available])
+def test_load_identical(backend: JsonBackend):
+    assert load_json(io.StringIO(DOCUMENT), backend=backend) == json.loads(DOCUMENT)
+
+
+@pytest.mark.parametrize("backend", [backend for backend in JsonBackend if backend.is_available])
+def test_load_nan(backend: JsonBackend):
+    assert math.isnan(load_json(io.StringIO('{"a": NaN}'), backend=backend)["a"])
+
+
+def test_set_backend():
+    backend_original = get_json_backend()
+
+    try:
+        set_json_backend(JsonBackend.STDLIB)
+        assert get_json_backend() == JsonBackend.STDLIB
+    finally:
+        set_json_backend(backend_original)
+
+
+def test_set_backend_unavailable():
+    for backend in JsonBackend:
+        if backend.is_available:
+            continue
+
+        with pytest.raises(ConfigError):
+            set_json_backend(backend)
+
+
+class _SetEncoder(JSONEncoder):
+    def default(self, o: Any) -> Any:
+        if isinstance(o, set):
+            return sorted(o)
+
+        return super().default(o)
+
+
+def test_dump_identical():
+    obj = json.loads(DOCUMENT) | {"d": {3, 1, 2}, "e": 1e-7, "f": "é"}
+
+    expected = io.StringIO()
+    json.dump(obj, expected, cls=_SetEncoder, ensure_ascii=False, sort_keys=True)
+
+    actual = io.StringIO()
+    dump_json(obj, actual, encoder_cls=_SetEncoder)
+
+    assert actual.getvalue() == expected.getvalue()
@@ -0,0 +1,161 @@
+import io
+import json
+from json import JSONDecodeError
+
+import pytest
+
+from dlparse.utils import JsonStreamReader, select_json_fields
+
+
+def test_read_value():
+    reader = JsonStreamReader(io.StringIO(' {"a": [1, 2.5, "x"], "b": null} '))
+    assert reader.read_value() == {"a": [1, 2.5, "x"], "b": None}
+
+
+def test_iter_object():
+    reader = JsonStreamReader(io.StringIO('{"a": 1, "b": {"c": [1, 2]}, "d": "e"}'))
+
+    values = {}
+    for key in reader.iter_object():
+        values[key] = reader.read_value()
+
+    assert values == {"a": 1, "b": {"c": [1, 2]}, "d": "e"}
+
+
+def test_iter_nested():
+    reader = JsonStreamReader(io.StringIO('{"skip": [1, 2, 3], "dict": {"values": [{"x": 1}, {"x": 2}], "n": 2}}'))
+
+    items = []
+    for key in reader.iter_object():
+        if key != "dict":
+            reader.skip_value()
+            continue
+
+        for key_dict in reader.iter_object():
+            if key_dict == "values":
+                items.extend(reader.iter_array())
+            else:
+                reader.skip_value()
+
+    assert items == [{"x": 1}, {"x": 2}]
+
+
+def test_iter_empty():
+    assert list(JsonStreamReader(io.StringIO("{}")).iter_object()) == []
+    assert list(JsonStreamReader(io.StringIO(" [ ] ")).iter_array()) == []
+
+
+def test_small_chunks():
+    data = {"values": [{"id": i, "text": "文字" * i, "rate": i / 7} for i in range(100)], "count": 123456789}
+    reader = JsonStreamReader(io.StringIO(json.dumps(data, indent=2, ensure_ascii=False)), chunk_size=3)
+
+    values = []
+    count = None
+    for key in reader.iter_object():
+        if key == "values":
+            values.extend(reader.iter_array())
+        else:
+            count = reader.read_value()
+
+    assert values == data["values"]
+    assert count == data["count"]
+
+
+def test_malformed():
+    with pytest.raises(JSONDecodeError):
+        list(JsonStreamReader(io.StringIO('[1, 2')).iter_array())
+
+    with pytest.raises(JSONDecodeError):
+        list(JsonStreamReader(io.StringIO('[1, 2}')).iter_array())
+
+    with pytest.raises(JSONDecodeError):
+        list(JsonStreamReader(io.StringIO('[1, 2]')).iter_object())
+
+
+def test_skip_containers():
+    data = {
+        "skip": {"a": [1, {"b": '}]\\"{['}], "c": "\\\\"},
+        "skip2": [[], {}, "\\u0022]", [[[1]]]],
+        "keep": [1, 2],
+    }
+
+    for chunk_size in (1, 2, 3, 1 << 16):
+        reader = JsonStreamReader(io.StringIO(json.dumps(data, indent=2)), chunk_size=chunk_size)
+
+        kept = {}
+        for key in reader.iter_object():
+            if key == "keep":
+                kept[key] = reader.read_value()
+            else:
+                reader.skip_value()
+
+        assert kept == {"keep": [1, 2]}
+
+
+def test_skip_malformed():
+    reader = JsonStreamReader(io.StringIO('{"a": [1, {"b": 2}'))
+
+    with pytest.raises(JSONDecodeError):
+        for _ in reader.iter_object():
+            reader.skip_value()
+
+
+def test_read_selected():
+    data = {
+        "name": "x",
+        "skip": {"nested": ["}", {"deep": [1, 2, 3]}]},
+        "obj": {"keep": {"a": 1}, "drop": [1, 2], "arr": [{"id": 1, "v": "a"}, {"id": 2, "v": "b"}]},
+        "num": 7,
+    }
+    selection = {"name": True, "obj": {"keep": True, "arr": {"id": True}}, "missing": True, "num": {"x": True}}
+
+    for chunk_size in (1, 3, 1 << 16):
+        reader = JsonStreamReader(io.StringIO(json.dumps(data, indent=2)), chunk_size=chunk_size)
+
+        assert reader.read_selected(selection) == {
+            "name": "x",
+            "obj": {"keep": {"a": 1}, "arr": [{"id": 1}, {"id": 2}]},
+            "num": 7,
+        }
+
+
+def test_select_fields_identical():
+    data = {
+        "name": "x",
+        "skip": {"nested": ["}", {"deep": [1, 2, 3]}]},
+        "obj": {"keep": {"a": 1}, "drop": [1, 2], "arr": [{"id": 1, "v": "a"}, {"id": 2, "v": "b"}]},
+        "num": 7,
+    }
+    selection = {"name": True, "skip": False, "obj": {"keep": True, "arr": {"id": True}}, "num": {"x": True}}
+
+    reader = JsonStreamReader(io.StringIO(json.dumps(data)))
+
+    assert select_json_fields(data, selection) == reader.read_selected(selection)
+    assert select_json_fields(data, False) is None
+
+
+def test_read_selected_false():
+    data = {"name": "x", "skip": {"nested": [1, 2]}, "obj": {"keep": 1, "drop": [1, 2]}}
+    selection = {"name": True, "skip": False, "obj": {"keep": True, "drop": False}}
+
+    reader = JsonStreamReader(io.StringIO(f"{json.dumps(data)} [1, 2]"))
+
+    assert reader.read_selected(selection) == {"name": "x", "obj": {"keep": 1}}
+    assert reader.read_selected(False) is None
+
+
+_NUMBERS_DOC = '{"a": 1.5, "b": -2.25e+10, "c": [0.125, 1E-3, 30], "d": 12345, "e": -0.5}'
+
+
+@pytest.mark.parametrize("chunk_size", range(1, len(_NUMBERS_DOC) + 1))
+def test_numbers_split_at_chunks(chunk_size: int):
+    reader = JsonStreamReader(io.StringIO(_NUMBERS_DOC), chunk_size=chunk_size)
+
+    assert reader.read_value() == json.loads(_NUMBERS_DOC)
+
+
+@pytest.mark.parametrize("chunk_size", range(1, len(_NUMBERS_DOC) + 1))
+def test_numbers_split_at_chunks_selected(chunk_size: int):
+    reader = JsonStreamReader(io.StringIO(_NUMBERS_DOC), chunk_size=chunk_size)
+
+    assert reader.read_selected({"a": True, "c": True, "e": True}) == {"a": 1.5, "c": [0.125, 1E-3, 30], "e": -0.5}